@@ -22,17 +22,20 @@ and musics
 Created on 27/08/2018
 """
 
+import collections
 import os
-import audioop
 import threading
+import time
 import pyaudio
 
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
+from audio.mix_engine import MixEngine, resample, saturate
+from audio.ring_buffer import RingBuffer
 from audio.sound import Sound
 from audio.music import Music
-from game.config import LOW_AUDIO
+from game.config import AUDIO_BUFFER_CHUNKS, CALLBACK_AUDIO, LOW_AUDIO
 from game.util import get_resource_paths
 
 
@@ -68,25 +71,47 @@ class AudioPlayer:
         self.chunk_size = chunk_size
         self.framerate = AudioPlayer.default_framerate
 
+        self.ring_buffer = RingBuffer(
+            self.chunk_size * self.nb_channels * self.samples_width
+            * AUDIO_BUFFER_CHUNKS)
+        self.underruns = 0
+
         self.pyaudio_instance = pyaudio.PyAudio()
-        self.stream = self.pyaudio_instance.open(
-            format=self.pyaudio_instance.get_format_from_width(
-                self.samples_width),
-            rate=AudioPlayer.default_framerate,
-            channels=self.nb_channels,
-            output=True
-        )
+        if CALLBACK_AUDIO:
+            self.stream = self.pyaudio_instance.open(
+                format=self.pyaudio_instance.get_format_from_width(
+                    self.samples_width),
+                rate=AudioPlayer.default_framerate,
+                channels=self.nb_channels,
+                output=True,
+                frames_per_buffer=self.chunk_size,
+                stream_callback=self.stream_callback,
+                start=False
+            )
+        else:
+            self.stream = self.pyaudio_instance.open(
+                format=self.pyaudio_instance.get_format_from_width(
+                    self.samples_width),
+                rate=AudioPlayer.default_framerate,
+                channels=self.nb_channels,
+                output=True
+            )
 
         self.sounds = {}
         self.musics = {}
         self.mixer = []
+        self.voices = set()
+        self.commands = collections.deque()
+        # Sounds which have finished in the audio thread, to remove from
+        # voices in the game thread
+        self.finished_voices = collections.deque()
+        self.mix_engine = MixEngine(self.chunk_size * self.nb_channels)
 
         self.sound_volume = 1
         self.music_volume = 1
 
         self.active = False
         self.thread = None
-        self.lock = threading.RLock()
 
     def load_audio(self):
         """
@@ -175,6 +200,7 @@ class AudioPlayer:
 
         if (sound.file_path, "copy", sound) in self.sounds:
             self.sounds.pop((sound.file_path, "copy", sound))
+        self.voices.discard(sound)
 
     def remove_music(self, music):
         """
@@ -203,7 +229,9 @@ class AudioPlayer:
 
     def start(self):
         """
-        Start the audio player in a new thread.
+        Start the audio player in a new thread. With CALLBACK_AUDIO, this
+        thread fills a ring buffer read by the PyAudio stream callback,
+        otherwise it writes each chunk to the stream.
         """
 
         def loop():
@@ -213,8 +241,20 @@ class AudioPlayer:
                 else:
                     self.update()
 
+        def fill_loop():
+            chunk = bytes()
+            while self.active:
+                chunk = self.fill_ring_buffer(chunk)
+                if chunk:
+                    time.sleep(self.chunk_size / self.default_framerate / 4)
+
         self.active = True
-        self.thread = threading.Thread(target=loop)
+        if CALLBACK_AUDIO:
+            self.fill_ring_buffer(bytes())
+            self.stream.start_stream()
+            self.thread = threading.Thread(target=fill_loop)
+        else:
+            self.thread = threading.Thread(target=loop)
         self.thread.start()
         print("[INFO] [AudioPlayer.start] Player started in a new thread")
 
@@ -227,9 +267,150 @@ class AudioPlayer:
             print("[INFO] [AudioPlayer.stop] Stopping player")
             self.active = False
             self.thread.join()
+            if CALLBACK_AUDIO:
+                self.stream.stop_stream()
+                print("[INFO] [AudioPlayer.stop] "
+                      + f"{self.underruns} audio underruns")
         else:
             print("[WARNING] [AudioPlayer.stop] AudioPlayer already stopped")
 
+    def fill_ring_buffer(self, chunk):
+        """
+        Mix new audio chunks until the ring buffer is full. If no sound is
+        playing, silence is written so the buffer still gets full.
+
+        :type chunk: bytes
+        :param chunk: Mixed audio data which didn't fit in the buffer
+            the last time.
+
+        :rtype: bytes
+        :returns: The mixed audio data which doesn't fit in the buffer.
+        """
+
+        while True:
+            if not chunk:
+                chunk = self.mix_low() if LOW_AUDIO else self.mix()
+            if not chunk:
+                chunk = bytes(
+                    self.chunk_size * self.nb_channels * self.samples_width)
+            chunk = chunk[self.ring_buffer.write(chunk):]
+            if chunk or not self.ring_buffer.get_free_space():
+                return chunk
+
+    def stream_callback(self, _in_data, frame_count, _time_info, _status):
+        """
+        Give the next audio data to the PyAudio stream. This method is called
+        by PyAudio in its own thread. If the ring buffer is empty, silence is
+        played and an underrun is counted.
+
+        :type frame_count: int
+        :param frame_count: The number of frames to play.
+
+        :rtype: tuple
+        :returns: A (data, flag) tuple as requested by PyAudio.
+        """
+
+        length = frame_count * self.nb_channels * self.samples_width
+        data = self.ring_buffer.read(length)
+        if len(data) < length:
+            self.underruns += 1
+            data += bytes(length - len(data))
+        return data, pyaudio.paContinue
+
+    def get_underruns(self):
+        """
+        Get the number of times the stream callback had no audio data ready.
+
+        :rtype: int
+        :returns: The number of underruns since the creation of the player.
+        """
+
+        return self.underruns
+
+    def post_command(self, fct, *args):
+        """
+        Ask the audio thread to call a method. This is the only way for the
+        game thread to change the mixer: commands are stored in a queue with
+        a single producer (the game thread) and a single consumer (the audio
+        thread).
+
+        :type fct: method
+        :param fct: The method to call in the audio thread.
+
+        :type *args: object
+        :param *args: The arguments to pass to the method.
+        """
+
+        self.commands.append((fct, args))
+
+    def process_commands(self):
+        """
+        Call all the methods posted by the game thread.
+        """
+
+        while self.commands:
+            fct, args = self.commands.popleft()
+            fct(*args)
+
+    def add_voice(self, sound):
+        """
+        Add a sound to the mixer. Must be called by the audio thread
+        (see AudioPlayer.post_command).
+
+        :type sound: audio.sound.Sound
+        :param sound: The sound to add.
+        """
+
+        if sound not in self.mixer:
+            self.mixer.append(sound)
+
+    def remove_voice(self, sound):
+        """
+        Remove a sound from the mixer and reset it. Must be called by the
+        audio thread (see AudioPlayer.post_command).
+
+        :type sound: audio.sound.Sound
+        :param sound: The sound to remove.
+        """
+
+        if sound in self.mixer:
+            self.mixer.remove(sound)
+        sound.reset()
+
+    def end_voice(self, sound):
+        """
+        Remove a sound which has finished from the mixer and give it back to
+        the game thread (see AudioPlayer.discard_finished_voices). Must be
+        called by the audio thread.
+
+        :type sound: audio.sound.Sound
+        :param sound: The sound which has finished.
+        """
+
+        self.remove_voice(sound)
+        self.finished_voices.append(sound)
+
+    def discard_finished_voices(self):
+        """
+        Remove the sounds which have finished from the voices. Must be called
+        by the game thread. A sound played again in the meantime is kept.
+        """
+
+        while self.finished_voices:
+            sound = self.finished_voices.popleft()
+            if not sound.is_playing:
+                self.voices.discard(sound)
+
+    def clear_voices(self):
+        """
+        Remove all sounds from the mixer. Must be called by the audio thread
+        (see AudioPlayer.post_command).
+        """
+
+        for sound in self.mixer:
+            sound.reset()
+        self.mixer.clear()
+
     def is_music(self, sound):
         """
         Return True if the given sound is a Music instance.
@@ -242,32 +423,30 @@ class AudioPlayer:
         """
         return isinstance(sound, Music)
 
+    def get_voice_volume(self, sound):
+        """
+        Get the volume to apply to a sound in the mixer.
+
+        :type sound: audio.sound.Sound
+        :param sound: A sound or a music.
+
+        :rtype: float
+        :returns: The volume of the sound multiplied by the music or sound
+            volume of the player.
+        """
+
+        if self.is_music(sound):
+            return self.music_volume * sound.volume
+        return self.sound_volume * sound.volume
+
     def update(self):
         """
         Update sounds and music and play a new audio sample.
         """
 
-        with self.lock:
-            framerate = int(self.framerate)
-            chunks = bytes()
-            for sound in self.mixer:
-                if sound.is_playing and self.is_playable(sound):
-                    if self.is_music(sound):
-                        volume = self.music_volume
-                    else:
-                        volume = self.sound_volume
-
-                    chunk = sound.set_chunk_framerate(
-                        sound.set_chunk_volume(
-                            sound.update(),
-                            volume * sound.volume),
-                        framerate)
-                    if chunks:
-                        chunks = audioop.add(chunks, chunk, self.samples_width)
-                    else:
-                        chunks = chunk
-            if chunks:
-                self.stream.write(chunks)
+        chunks = self.mix()
+        if chunks:
+            self.stream.write(chunks)
 
     def update_low(self):
         """
@@ -275,24 +454,82 @@ class AudioPlayer:
         resources than AudioPlayer.update() method.
         """
 
-        with self.lock:
-            framerate = int(self.framerate)
-            chunks = bytes(self.chunk_size *
-                           self.samples_width * self.nb_channels // 2)
+        self.stream.write(self.mix_low())
 
-            for sound in self.mixer:
-                if sound.is_playing and self.is_playable(sound):
-                    if self.is_music(sound):
-                        volume = self.music_volume
-                    else:
-                        volume = self.sound_volume
+    def mix(self):
+        """
+        Process the commands of the game thread and mix a new audio chunk.
+        Voices with the same framerate are mixed together in one pass then
+        resampled once. Each group is padded with silence to a full chunk so
+        a voice which is ending doesn't shorten the others.
 
-                    chunk = sound.set_chunk_volume(sound.update(), volume
-                                                   * sound.volume)
-                    chunks = audioop.add(chunks, chunk, self.samples_width)
-            chunks = audioop.ratecv(chunks, self.samples_width, self.nb_channels,
-                                    AudioPlayer.default_framerate, framerate * 2, None)[0]
-            self.stream.write(chunks)
+        :rtype: bytes
+        :returns: Raw audio data (empty if no sound is playing).
+        """
+
+        self.process_commands()
+        framerate = int(self.framerate)
+        groups = {}
+        for sound in tuple(self.mixer):
+            if sound.is_playing and self.is_playable(sound):
+                groups.setdefault(sound.framerate, []).append(
+                    (sound.update_samples(), self.get_voice_volume(sound)))
+
+        chunks = None
+        for voice_framerate, voices in groups.items():
+            nb_samples = max(
+                self.get_chunk_length(voice_framerate),
+                max(len(samples) for samples, _ in voices))
+            mixed = resample(self.mix_engine.mix(voices, nb_samples),
+                             self.nb_channels, voice_framerate, framerate)
+            if chunks is None:
+                chunks = mixed
+            else:
+                if len(mixed) > len(chunks):
+                    chunks, mixed = mixed, chunks
+                chunks[:len(mixed)] += mixed
+        if chunks is None:
+            return bytes()
+        return saturate(chunks)
+
+    def get_chunk_length(self, framerate):
+        """
+        Get the number of samples of a full chunk of a sound (see
+        audio.sound.Sound.get_chunk_size).
+
+        :type framerate: int
+        :param framerate: The framerate of the sound.
+
+        :rtype: int
+        :returns: The number of 16 bits samples of a chunk.
+        """
+
+        return int(self.chunk_size * self.nb_channels * self.samples_width
+                   * framerate / self.default_framerate) // self.samples_width
+
+    def mix_low(self):
+        """
+        Process the commands of the game thread and mix a new audio chunk of
+        fixed size. Use less resources than AudioPlayer.mix() method.
+
+        :rtype: bytes
+        :returns: Raw audio data.
+        """
+
+        self.process_commands()
+        framerate = int(self.framerate)
+        nb_samples = self.chunk_size * self.nb_channels // 2
+        voices = []
+
+        for sound in tuple(self.mixer):
+            if sound.is_playing and self.is_playable(sound):
+                voices.append(
+                    (sound.update_samples(), self.get_voice_volume(sound)))
+
+        chunks = resample(self.mix_engine.mix(voices, nb_samples),
+                          self.nb_channels, AudioPlayer.default_framerate,
+                          framerate * 2)
+        return saturate(chunks)
 
     def get_music_in_mixer(self):
         """
@@ -319,16 +556,20 @@ class AudioPlayer:
         Stop all sounds and musics in the mixer.
         """
 
-        for sound in self.mixer:
-            sound.stop()
-        self.mixer.clear()
+        self.discard_finished_voices()
+        for sound in tuple(self.voices):
+            if sound.is_playing:
+                sound.stop()
+        self.voices.clear()
+        self.post_command(self.clear_voices)
 
     def pause_audio(self):
         """
         Pause all sounds and musics in the mixer.
         """
 
-        for sound in self.mixer:
+        self.discard_finished_voices()
+        for sound in tuple(self.voices):
             sound.pause()
 
     def unpause_audio(self):
@@ -336,7 +577,8 @@ class AudioPlayer:
         Unpause sounds and musics in the mixer.
         """
 
-        for sound in self.mixer:
+        self.discard_finished_voices()
+        for sound in tuple(self.voices):
             sound.play()
 
     def set_speed(self, speed):
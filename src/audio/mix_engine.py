@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+#	This file is part of Pyoro (A Python fan game).
+#
+#	Metawars is free software: you can redistribute it and/or modify
+#	it under the terms of the GNU General Public License as published by
+#	the Free Software Foundation, either version 3 of the License, or
+#	(at your option) any later version.
+#
+#	Metawars is distributed in the hope that it will be useful,
+#	but WITHOUT ANY WARRANTY; without even the implied warranty of
+#	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#	GNU General Public License for more details.
+#
+#	You should have received a copy of the GNU General Public License
+#	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide a NumPy mixing engine for 16 bits audio samples
+
+Created on 17/10/2026
+"""
+
+import numpy
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+
+def resample(samples, nb_channels, from_framerate, to_framerate):
+    """
+    Change the framerate of interleaved samples by linear interpolation.
+
+    :type samples: numpy.ndarray
+    :param samples: The interleaved samples to resample.
+
+    :type nb_channels: int
+    :param nb_channels: The number of channels of the samples.
+
+    :type from_framerate: float
+    :param from_framerate: The framerate of the samples.
+
+    :type to_framerate: float
+    :param to_framerate: The framerate to convert the samples to.
+
+    :rtype: numpy.ndarray
+    :returns: New float32 interleaved samples.
+    """
+
+    frames = samples.reshape(-1, nb_channels)
+    nb_frames = len(frames)
+    if from_framerate == to_framerate or nb_frames < 2:
+        return samples.astype(numpy.float32)
+
+    nb_new_frames = int(nb_frames * to_framerate / from_framerate)
+    positions = numpy.arange(nb_new_frames) * (from_framerate / to_framerate)
+    indexes = numpy.minimum(positions.astype(numpy.intp), nb_frames - 2)
+    weights = (positions - indexes).astype(numpy.float32)[:, None]
+    new_frames = frames[indexes] * (1 - weights) + frames[indexes + 1] * weights
+    return new_frames.astype(numpy.float32).reshape(-1)
+
+
+def saturate(samples):
+    """
+    Clip float samples to the 16 bits range and convert them to raw bytes.
+
+    :type samples: numpy.ndarray
+    :param samples: The samples to convert.
+
+    :rtype: bytes
+    :returns: Raw 16 bits audio data.
+    """
+
+    return numpy.clip(samples, -32768, 32767).astype(numpy.int16).tobytes()
+
+
+class MixEngine:
+    """
+    Mix several 16 bits voices in a single vectorized pass. Voices are
+    copied in a reused 2D buffer and summed with their gain by a matrix
+    product.
+    """
+
+    def __init__(self, nb_samples=2048, nb_voices=16):
+        """
+        Initialize a MixEngine object.
+
+        :type nb_samples: int
+        :param nb_samples: (Optional) The default number of samples per voice.
+            Default is 2048.
+
+        :type nb_voices: int
+        :param nb_voices: (Optional) The default number of voices which can
+            be mixed without growing the buffer. Default is 16.
+        """
+
+        self.voices = numpy.zeros((nb_voices, nb_samples), dtype=numpy.int16)
+        self.gains = numpy.zeros(nb_voices, dtype=numpy.float32)
+
+    def reserve(self, nb_voices, nb_samples):
+        """
+        Grow the voice buffer if it's too small.
+
+        :type nb_voices: int
+        :param nb_voices: The number of voices to mix.
+
+        :type nb_samples: int
+        :param nb_samples: The number of samples per voice.
+        """
+
+        capacity, length = self.voices.shape
+        if nb_voices > capacity or nb_samples > length:
+            capacity = max(capacity, nb_voices * 2)
+            length = max(length, nb_samples)
+            self.voices = numpy.zeros((capacity, length), dtype=numpy.int16)
+            self.gains = numpy.zeros(capacity, dtype=numpy.float32)
+
+    def mix(self, voices, nb_samples):
+        """
+        Sum voices with their gain. Shorter voices are padded with silence and
+        longer voices are truncated.
+
+        :type voices: list
+        :param voices: A list of (samples, gain) tuples where samples is an
+            int16 numpy.ndarray and gain is a float number.
+
+        :type nb_samples: int
+        :param nb_samples: The number of samples to mix.
+
+        :rtype: numpy.ndarray
+        :returns: The float32 mixed samples (not clipped).
+        """
+
+        nb_voices = len(voices)
+        self.reserve(nb_voices, nb_samples)
+        buffer = self.voices[:nb_voices, :nb_samples]
+
+        for i, (samples, gain) in enumerate(voices):
+            length = min(len(samples), nb_samples)
+            buffer[i, :length] = samples[:length]
+            buffer[i, length:] = 0
+            self.gains[i] = gain
+        return self.gains[:nb_voices] @ buffer
@@ -25,6 +25,7 @@ Created on 27/08/2018
 
 import os
 import wave
+import numpy
 
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
@@ -118,6 +119,19 @@ class Music(Sound):
             self.pos = self.wave_file.tell()
             return chunk + bytes(nb_frames - len(chunk))
 
+    def get_samples(self, nb_frames):
+        """
+        Get a new audio chunk as a 16 bits numpy array.
+
+        :type nb_frames: int
+        :param nb_frames: The size of the audio chunk to get (in bytes).
+
+        :rtype: numpy.ndarray
+        :returns: 16 bits audio samples.
+        """
+
+        return numpy.frombuffer(self.get_frames(nb_frames), dtype=numpy.int16)
+
     def reset(self):
         """
         Set the playhead at the beginning.
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+#	This file is part of Pyoro (A Python fan game).
+#
+#	Metawars is free software: you can redistribute it and/or modify
+#	it under the terms of the GNU General Public License as published by
+#	the Free Software Foundation, either version 3 of the License, or
+#	(at your option) any later version.
+#
+#	Metawars is distributed in the hope that it will be useful,
+#	but WITHOUT ANY WARRANTY; without even the implied warranty of
+#	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#	GNU General Public License for more details.
+#
+#	You should have received a copy of the GNU General Public License
+#	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide a byte ring buffer shared by one writer thread and one reader
+thread without lock.
+
+Created on 17/10/2026
+"""
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+
+class RingBuffer:
+    """
+    A fixed size byte ring buffer. Only one thread can write and only one
+    thread can read: the writer only moves write_pos and the reader only
+    moves read_pos, so no lock is needed.
+    """
+
+    def __init__(self, size):
+        """
+        Initialize a RingBuffer object.
+
+        :type size: int
+        :param size: The capacity of the buffer (in bytes).
+        """
+
+        self.buffer = bytearray(size)
+        self.size = size
+        self.write_pos = 0
+        self.read_pos = 0
+
+    def get_fill(self):
+        """
+        Get the number of bytes which can be read.
+
+        :rtype: int
+        :returns: The number of bytes written but not read yet.
+        """
+
+        return self.write_pos - self.read_pos
+
+    def get_free_space(self):
+        """
+        Get the number of bytes which can be written.
+
+        :rtype: int
+        :returns: The free space of the buffer (in bytes).
+        """
+
+        return self.size - self.get_fill()
+
+    def write(self, data):
+        """
+        Write as much data as possible in the buffer.
+
+        :type data: bytes
+        :param data: The data to write.
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+
+        length = min(len(data), self.get_free_space())
+        start = self.write_pos % self.size
+        first_length = min(length, self.size - start)
+
+        self.buffer[start: start + first_length] = data[:first_length]
+        self.buffer[: length - first_length] = data[first_length:length]
+        self.write_pos += length
+        return length
+
+    def read(self, length):
+        """
+        Read at most length bytes from the buffer.
+
+        :type length: int
+        :param length: The number of bytes to read.
+
+        :rtype: bytes
+        :returns: The data read (shorter than length if the buffer doesn't
+            contain enough data).
+        """
+
+        length = min(length, self.get_fill())
+        start = self.read_pos % self.size
+        first_length = min(length, self.size - start)
+
+        data = bytes(self.buffer[start: start + first_length]) \
+            + bytes(self.buffer[: length - first_length])
+        self.read_pos += length
+        return data
@@ -23,13 +23,15 @@ to use audio.music.Music.
 Created on 23/08/2018
 """
 
-import audioop
 import os
 import wave
+import numpy
 
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
+from audio.mix_engine import resample
+
 
 class Sound:
     """
@@ -47,6 +49,7 @@ class Sound:
 
         self.audio_player = audio_player
         self.samples = bytes()
+        self.data = numpy.zeros(0, dtype=numpy.int16)
 
         self.is_loaded = False
         self.is_playing = False
@@ -79,6 +82,9 @@ class Sound:
                     # Loading sounds samples
                     self.samples = wave_file.readframes(
                         wave_file.getnframes() - 1)
+                    if self.samples_width == 2:
+                        self.data = numpy.frombuffer(
+                            self.samples, dtype=numpy.int16)
                     self.is_loaded = True
 
             except Exception:
@@ -97,13 +103,15 @@ class Sound:
             self.nb_channels = 0
             self.samples_width = 0
             self.samples = bytes()
+            self.data = numpy.zeros(0, dtype=numpy.int16)
             self.is_loaded = False
         else:
             print("[WARNING] [Sound.unload] Sound not loaded")
 
     def play(self, loop=None):
         """
-        Make the sound be playable by the audio player.
+        Make the sound be playable by the audio player. The sound is added
+        to the mixer by the audio thread.
 
         :type loop: int
         :param loop: The number of times to play the sound.
@@ -112,8 +120,9 @@ class Sound:
         if self.is_loaded:
             self.loop = loop if loop else self.loop
             self.is_playing = True
-            if self not in self.audio_player.mixer:
-                self.audio_player.mixer.append(self)
+            self.audio_player.discard_finished_voices()
+            self.audio_player.voices.add(self)
+            self.audio_player.post_command(self.audio_player.add_voice, self)
         else:
             print("[WARNING] [Sound.play] Sound not loaded")
 
@@ -129,15 +138,16 @@ class Sound:
 
     def stop(self):
         """
-        Prevent the audio player to play this sound and reset it.
+        Prevent the audio player to play this sound. The sound is removed
+        from the mixer and reset by the audio thread.
         """
 
         if self.is_loaded:
             if self.is_playing:
                 self.is_playing = False
-                if self in self.audio_player.mixer:
-                    self.audio_player.mixer.remove(self)
-                self.reset()
+                self.audio_player.voices.discard(self)
+                self.audio_player.post_command(
+                    self.audio_player.remove_voice, self)
                 self.loop = 1
             else:
                 print(
@@ -169,14 +179,36 @@ class Sound:
         else:
             print("[WARNING] [Sound.update] Sound not loaded")
 
+    def update_samples(self):
+        """
+        Update the sound like Sound.update but get the new audio chunk as a
+        16 bits numpy array (a view on the sound samples when possible).
+
+        :rtype: numpy.ndarray
+        :returns: Audio samples (may be shorter than a chunk at the end of
+            the sound).
+        """
+
+        if self.is_loaded and self.is_playing:
+            if self.is_finished():
+                self.end_loop()
+                if not self.is_playing:
+                    return self.data[:0]
+            return self.get_samples(self.get_chunk_size())
+        return self.data[:0]
+
     def end_loop(self):
         """
         Decrement the loop count and reset the sound if necessary.
+        This method is called by the audio thread so the sound is directly
+        removed from the mixer (see audio.audio_player.AudioPlayer.end_voice).
         """
 
         self.loop -= 1
         if self.loop == 0:
-            self.stop()
+            self.is_playing = False
+            self.loop = 1
+            self.audio_player.end_voice(self)
         else:
             self.reset()
 
@@ -231,6 +263,29 @@ class Sound:
             return chunk
         return bytes(nb_frames)
 
+    def get_samples(self, nb_frames):
+        """
+        Get a new audio chunk as a view on the sound samples.
+
+        :type nb_frames: int
+        :param nb_frames: The size of the audio chunk to get (in bytes).
+
+        :rtype: numpy.ndarray
+        :returns: 16 bits audio samples (may be shorter than nb_frames at the
+            end of the sound).
+        """
+
+        data_length = len(self.samples)
+        if self.pos < data_length:
+            start = self.pos // 2
+            chunk = self.data[start: start + nb_frames // 2]
+            if self.pos + nb_frames >= data_length:
+                self.pos = data_length
+            else:
+                self.pos += nb_frames
+            return chunk
+        return self.data[:0]
+
     def set_chunk_volume(self, chunk, volume):
         """
         Modify a raw data chunk to change the audio volume.
@@ -246,9 +301,8 @@ class Sound:
         """
 
         if self.is_loaded:
-            return audioop.mul(chunk,
-                               self.samples_width,
-                               volume)
+            samples = numpy.frombuffer(chunk, dtype=numpy.int16) * volume
+            return numpy.clip(samples, -32768, 32767).astype(numpy.int16).tobytes()
         else:
             print("[WARNING] [Sound.setChunkVolume] Sound not loaded")
             return chunk
@@ -268,14 +322,9 @@ class Sound:
         """
 
         if self.is_loaded:
-            return audioop.ratecv(
-                chunk,
-                self.samples_width,
-                self.nb_channels,
-                self.framerate,
-                framerate,
-                None
-            )[0]
+            samples = numpy.frombuffer(chunk, dtype=numpy.int16)
+            return resample(samples, self.nb_channels, self.framerate,
+                            framerate).astype(numpy.int16).tobytes()
         print("[WARNING] [Sound.setChunkFramerate] Sound not loaded")
         return chunk
 
@@ -319,5 +368,6 @@ class Sound:
             snd.samples_width = self.samples_width
             snd.file_path = self.file_path
             snd.samples = self.samples
+            snd.data = self.data
             snd.is_loaded = True
         return snd
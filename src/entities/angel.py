@@ -26,7 +26,8 @@ __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
 from entities.entity import Entity
-from game.config import ANGEL_SPEED, ANGEL_SPRITE_DURATION
+from game.animation import ANGEL_ANIMATION
+from game.config import ANGEL_SPEED
 
 
 class Angel(Entity):
@@ -34,6 +35,8 @@ class Angel(Entity):
     Angel that fall from the sky to repair a destroyed block
     """
 
+    animation = ANGEL_ANIMATION
+
     def __init__(self, level, repair_case):
         """
         Initialize an Angel object.
@@ -45,7 +48,6 @@ class Angel(Entity):
         :param repair_case: The block to repair
         """
 
-        self.sprite_index = 0
         self.case = repair_case
         self.case.is_repairing = True
         Entity.__init__(self, level, (repair_case.pos + 0.75, 0.75), (1.5, 1.5))
@@ -94,23 +96,3 @@ class Angel(Entity):
         case.is_repairing = False
         case.exists = True
         self.sounds["angel_down"].stop()
-
-    def update_sprite(self):
-        """
-        Update the images to create a flight animation.
-        """
-
-        score = self.level.get_style_type_with_score()
-        self.sprite_index = 1 if self.sprite_index == 0 else 0
-        self.current_image_name = f"angel_{score}_{self.sprite_index}.png"
-        self.level.set_action_delay(
-            (self, "updateSprite"), ANGEL_SPRITE_DURATION, self.update_sprite
-        )
-
-    def remove(self):
-        """
-        Remove the angel from its level and stop all actions delayed.
-        """
-
-        self.level.remove_action_delay((self, "updateSprite"))
-        Entity.remove(self)
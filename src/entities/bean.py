@@ -23,13 +23,12 @@ if they touch it.
 Created on 18/03/2018
 """
 
-import random
-
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
 from entities.entity import Entity
-from game.config import BEAN_SPEED, BEAN_SPRITE_DURATION
+from game.animation import BEAN_ANIMATION
+from game.config import BEAN_SPEED
 
 
 class Bean(Entity):
@@ -37,6 +36,10 @@ class Bean(Entity):
     Main class for all falling beans
     """
 
+    physics_kind = "bean"
+    index_kind = "bean"
+    animation = BEAN_ANIMATION
+
     def __init__(self, level, pos, speed):
         """
         Initialize a Bean object.
@@ -53,7 +56,6 @@ class Bean(Entity):
 
         self.caught = False
         self.speed = speed
-        self.sprite_index = 0
         Entity.__init__(self, level, pos, (1.5, 1.5))
 
     def init_images(self):
@@ -80,36 +82,45 @@ class Bean(Entity):
 
         if not self.caught:
             self.pos[1] += BEAN_SPEED * self.speed * delta_time
-            if self.is_hitting_floor():
-                if self.level.cases[int(self.pos[0])].exists:
-                    self.level.cases[int(self.pos[0])].exists = False
-                    self.explode()
-                    self.remove()
-            if self.is_hitting_entity(self.level.pyoro) and not self.level.pyoro.dead:
-                self.explode()
-                self.remove()
-                self.level.pyoro.remove()
+            self.check_collisions()
         Entity.update(self, delta_time)
 
-    def update_sprite(self):
+    def check_collisions(self):
         """
-        Update the images to create a swing animation.
+        Destroy the case under the bean or kill Pyoro if the bean is hitting
+        them.
+        """
+
+        if self.is_hitting_floor():
+            if self.level.cases[int(self.pos[0])].exists:
+                self.level.cases[int(self.pos[0])].exists = False
+                self.explode()
+                self.remove()
+        if self.is_hitting_entity(self.level.pyoro) and not self.level.pyoro.dead:
+            self.explode()
+            self.remove()
+            self.level.pyoro.remove()
+
+    def is_body(self):
         """
+        Check if the bean is a falling body (see entities.entity.Entity).
 
-        score = self.level.get_style_type_with_score()
-        self.sprite_index = self.sprite_index + 1 if self.sprite_index < 2 else 0
-        self.current_image_name = f"bean_{score}_{self.sprite_index}.png"
+        :rtype: bool
+        :returns: True if the bean hasn't been caught.
+        """
 
-        self.level.set_action_delay(
-            (self, "update_sprite"), BEAN_SPRITE_DURATION, self.update_sprite
-        )
+        return not self.caught
 
     def catch(self):
         """
-        Method called when caught by Pyoro.
+        Method called when caught by Pyoro. A caught bean is moved by the
+        tongue, not by the physics backend.
         """
 
         self.caught = True
+        self.level.entities.update_body(self)
+        if self.body is not None:
+            self.body.remove(self)
 
     def explode(self):
         """
@@ -128,15 +139,7 @@ class Bean(Entity):
         self.sounds["bean_cut"].play()
         for _ in range(2):
             rand_pos = [
-                self.pos[0] + random.uniform(-0.5, 0.5),
-                self.pos[1] + random.uniform(-0.5, 0.2),
+                self.pos[0] + self.level.random.uniform(-0.5, 0.5),
+                self.pos[1] + self.level.random.uniform(-0.5, 0.2),
             ]
             self.level.spawn_leaf(rand_pos, "leaf")
-
-    def remove(self):
-        """
-        Remove the bean from its level and stop all actions delayed.
-        """
-
-        self.level.remove_action_delay((self, "update_sprite"))
-        Entity.remove(self)
@@ -23,19 +23,33 @@ Created on 18/03/2018
 
 import os
 
-from game.config import ENTITIES_IMAGE_PATH
-from game.util import Game
-from gui.image_transformer import resize_image
-
 __author__ = "RedbeanGit"
 __version__ = "1.1.1"
 
+from game.animation import ANIMATIONS
+
 
 class Entity:
     """
     Abstract class for all moving objects : entities
     """
 
+    # Kind of body moved by game.physics.PhysicsBackend (None if the entity
+    # moves itself)
+    physics_kind = None
+    body = None
+    body_index = None
+    # Kind of entity in game.spatial_index.SpatialIndex (None if the entity
+    # isn't indexed)
+    index_kind = None
+
+    # Image names of the entity (see game.animation.SpriteTable), None if
+    # the sprites are given by the animation clip
+    sprite_table = None
+    # Id of the animation clip in game.animation.ANIMATIONS (None if the
+    # sprite is only chosen by update_sprite)
+    animation = None
+
     def __init__(self, level, pos, size=(1, 1)):
         """
         Initialize an Entity object.
@@ -57,7 +71,10 @@ class Entity:
         self.pos = list(pos)
         self.sounds = {}
         self.images = {}
-        self.current_image_name = ""
+        self.sprites = ()
+        self.compiled_sprite_table = None
+        self.sprite_id = 0
+        self.animation_start = level.get_time()
 
         self.init_images()
         self.init_sounds()
@@ -87,20 +104,37 @@ class Entity:
             reference are.
         """
 
-        self.images = {}
-        case_size = self.level.level_drawer.get_case_size()
-        image_names = os.listdir(os.path.join(ENTITIES_IMAGE_PATH, folder_name))
-
-        for image_name in image_names:
-            if image_name.split(".")[-1] == "png":
-                self.images[image_name] = resize_image(
-                    self.level.level_drawer.activity.window.get_image(
-                        os.path.join(ENTITIES_IMAGE_PATH, folder_name, image_name)
-                    ),
-                    (case_size[0] * self.size[0], case_size[1] * self.size[1]),
-                )
+        self.images = self.level.level_drawer.get_entity_images(folder_name, self.size)
+        self.compile_sprites()
         self.update_sprite()
 
+    def get_sprite_table(self):
+        """
+        Get the image names of the entity sprites.
+
+        :rtype: game.animation.SpriteTable
+        :returns: The sprite table of the animation clip if the entity is
+            animated, otherwise Entity.sprite_table.
+        """
+
+        if self.animation is None:
+            return self.sprite_table
+        return ANIMATIONS[self.animation].sprite_table
+
+    def compile_sprites(self):
+        """
+        Get the images of the sprite table in a list indexed by sprite id
+        (see game.animation.SpriteTable.get_id).
+        """
+
+        self.compiled_sprite_table = self.get_sprite_table()
+        if self.compiled_sprite_table is None:
+            self.sprites = ()
+        else:
+            self.sprites = self.level.level_drawer.get_entity_sprites(
+                self.images, self.compiled_sprite_table
+            )
+
     def init_images(self):
         """
         Initialize the images used by the entity.
@@ -124,6 +158,30 @@ class Entity:
                 os.path.join("data", "audio", "sounds", f"{sound_name}.wav")
             )
 
+    def reset(self, pos, size=(1, 1)):
+        """
+        Reinitialize a removed entity to use it again (see
+        game.entity_pool.EntityPool). Images and sounds are kept, images are
+        only reloaded if the size has changed and sprites are only compiled
+        again if the sprite table has changed.
+
+        :type pos: list<float>
+        :param pos: The new (x, y) position of the entity.
+
+        :type size: list<float>
+        :param size: Optional! The (width, height) size of the entity.
+            Default is [1, 1].
+        """
+
+        self.pos = list(pos)
+        self.animation_start = self.level.get_time()
+        if list(size) != self.size:
+            self.size = list(size)
+            self.init_images()
+        elif self.get_sprite_table() is not self.compiled_sprite_table:
+            self.compile_sprites()
+        self.update_sprite()
+
     def init_sounds(self):
         """
         Initialize the sounds used by the entity.
@@ -144,10 +202,44 @@ class Entity:
 
     def update_sprite(self):
         """
-        Update the image currently used by the entity.
+        Update the sprite currently used by the entity (Entity.sprite_id).
         This method should be override.
         """
 
+    def get_sprite_id(self, time, style_type):
+        """
+        Get the sprite to draw. For an animated entity, it's computed from
+        the time elapsed since the animation has started.
+
+        :type time: float
+        :param time: The current time of the level (see
+            game.level.Level.get_time).
+
+        :type style_type: int
+        :param style_type: The current style of the level.
+
+        :rtype: int
+        :returns: The index of the image in Entity.sprites.
+        """
+
+        if self.animation is None:
+            return self.sprite_id
+        return ANIMATIONS[self.animation].get_sprite_id(
+            time - self.animation_start, style_type
+        )
+
+    def is_body(self):
+        """
+        Check if the entity is a falling body. Bodies are updated before the
+        other entities at each level step, whether they are moved by
+        game.physics.PhysicsBackend or by their own update method.
+
+        :rtype: bool
+        :returns: True if the entity has a physics kind.
+        """
+
+        return self.physics_kind is not None
+
     def is_hitting_entity(self, entity):
         """
         Check if the entity collide another.
@@ -219,7 +311,8 @@ class Entity:
         Stop and remove all sounds used by this entity.
         """
 
+        audio_player = self.level.get_audio_player()
         for sound in self.sounds.values():
             if sound.is_playing:
                 sound.stop()
-            Game.audio_player.remove_sound(sound)
+            audio_player.remove_sound(sound)
@@ -22,14 +22,12 @@ This entity is used as leaf particles when a bean is destroyed.
 Created on 07/05/2018
 """
 
-import random
-
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
+from game.animation import LEAF_ANIMATION
 from game.config import (
     LEAF_SPEED,
-    LEAF_SPRITE_DURATION,
     LEAF_WIND_SPEED,
     AIR_RESISTANCE,
 )
@@ -43,6 +41,10 @@ class Leaf(Entity):
         that has just been destroyed.
     """
 
+    physics_kind = "leaf"
+    index_kind = "leaf"
+    animation = LEAF_ANIMATION
+
     def __init__(self, level, pos, speed, leaf_type):
         """
         Initialise a Leaf object.
@@ -62,12 +64,57 @@ class Leaf(Entity):
             or "super leaf".
         """
 
+        self.body_vel = [0, 0]
         self.vel = 0
-        self.sprite_index = 0
         self.leaf_type = leaf_type
         self.speed = speed
         Entity.__init__(self, level, pos, (0.75, 0.75))
 
+    @property
+    def vel(self):
+        """
+        The horizontal velocity of the leaf (stored in body_vel to be shared
+        with the physics backend).
+
+        :rtype: float
+        :returns: The horizontal velocity of the leaf.
+        """
+
+        return self.body_vel[0]
+
+    @vel.setter
+    def vel(self, vel):
+        """
+        Set the horizontal velocity of the leaf.
+
+        :type vel: float
+        :param vel: The new horizontal velocity.
+        """
+
+        self.body_vel[0] = vel
+
+    def reset(self, pos, speed, leaf_type):
+        """
+        Reinitialize a removed leaf to use it again.
+
+        :type pos: list
+        :param pos: The new position of the leaf.
+
+        :type speed: float
+        :param speed: The falling speed of the leaf.
+
+        :type leaf_type: str
+        :param leaf_type: The type of the leaf. It can be "leaf", "pink leaf"
+            or "super leaf".
+        """
+
+        self.vel = 0
+        self.speed = speed
+        if leaf_type != self.leaf_type:
+            self.leaf_type = leaf_type
+            self.init_images()
+        Entity.reset(self, pos, (0.75, 0.75))
+
     def init_images(self):
         """
         Load leaf images.
@@ -95,19 +142,6 @@ class Leaf(Entity):
                 self.vel = 0
         Entity.update(self, delta_time)
 
-    def update_sprite(self):
-        """
-        Update the images to create a flight animation.
-        """
-
-        score = self.level.get_style_type_with_score()
-        self.sprite_index = self.sprite_index + 1 if self.sprite_index < 2 else 0
-        self.current_image_name = f"leaf_{score}_{self.sprite_index}.png"
-
-        self.level.set_action_delay(
-            (self, "updateSprite"), LEAF_SPRITE_DURATION, self.update_sprite
-        )
-
     def set_left_wind(self):
         """
         Change the leaf's velocity as if there is wind to the left.
@@ -127,7 +161,7 @@ class Leaf(Entity):
         Replace the leaf by 2 leaf pieces as if it was cut in a half.
         """
 
-        if not random.randint(0, 2):
+        if not self.level.random.randint(0, 2):
             for delta_pos in (-self.size[0], self.size[0]):
                 self.level.spawn_leaf_piece(
                     (self.pos[0] + delta_pos / 2, self.pos[1]),
@@ -136,11 +170,3 @@ class Leaf(Entity):
                     self.vel / 2,
                 )
             self.remove()
-
-    def remove(self):
-        """
-        Remove the leaf and its action delayed.
-        """
-
-        self.level.remove_action_delay((self, "updateSprite"))
-        Entity.remove(self)
@@ -25,8 +25,8 @@ Created on 08/05/2018
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
-from game.config import LEAF_SPRITE_DURATION
 from entities.leaf import Leaf
+from game.animation import LEAF_PIECE_ANIMATION
 
 
 class LeafPiece(Leaf):
@@ -36,6 +36,8 @@ class LeafPiece(Leaf):
         leaf that has just been cut.
     """
 
+    animation = LEAF_PIECE_ANIMATION
+
     def __init__(self, level, pos, speed, leafpiece_type, vel=0):
         """
         Initialise a Leaf object.
@@ -61,26 +63,32 @@ class LeafPiece(Leaf):
         Leaf.__init__(self, level, pos, speed, leafpiece_type)
         self.vel = vel
 
-    def init_images(self):
-        """
-        Load leaf_pieces images.
+    def reset(self, pos, speed, leafpiece_type, vel=0):
         """
+        Reinitialize a removed leaf piece to use it again.
 
-        self.__init_images__(self.leaf_type)
+        :type pos: list
+        :param pos: The new position of the leaf.
 
-    def update_sprite(self):
-        """
-        Update the images to create a flight animation.
+        :type speed: float
+        :param speed: The falling speed of the leaf.
+
+        :type leafpiece_type: str
+        :param leafpiece_type: The type of the leaf.
+
+        :type vel: float
+        :param vel: (Optional) The default velocity of the leaf.
         """
 
-        score = self.level.get_style_type_with_score()
+        Leaf.reset(self, pos, speed, leafpiece_type)
+        self.vel = vel
 
-        self.sprite_index = self.sprite_index + 1 if self.sprite_index < 2 else 0
-        self.current_image_name = f"leafpiece_{score}_{self.sprite_index}.png"
+    def init_images(self):
+        """
+        Load leaf_pieces images.
+        """
 
-        self.level.set_action_delay(
-            (self, "update_sprite"), LEAF_SPRITE_DURATION, self.update_sprite
-        )
+        self.__init_images__(self.leaf_type)
 
     def cut(self):
         """
@@ -24,8 +24,8 @@ Created on 11/04/2018.
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
-from entities.bean import Bean
 from entities.pyoro import Pyoro
+from game.config import PYOBOT_SPEED
 
 
 class Pyobot(Pyoro):
@@ -37,13 +37,16 @@ class Pyobot(Pyoro):
     def update(self, delta_time):
         """
         Pyobot search for the best position to eat the lowest bean and update
-            its position.
+            its position. If the level has a bot controller, it decides
+            instead.
 
         :type delta_time: float
         :param delta_time: Time elapsed since the last update.
         """
 
-        if not self.tongue:
+        if self.level.bot_controller is not None:
+            self.level.bot_controller.control(self)
+        elif not self.tongue and not self.dead:
             pos = self.get_nearest_pos(*self.get_pos_to_eat())
             if pos > 0 and pos < self.level.size[0]:
                 if self.pos[0] > pos:
@@ -58,17 +61,21 @@ class Pyobot(Pyoro):
                 self.enable_capacity()
         Pyoro.update(self, delta_time)
 
-    def get_pos_to_eat(self):
+    def get_pos_to_eat(self, lowest_bean=None):
         """
         Find the 2 horizontal position that could allow Pyobot to eat the
-            lowest bean.
+            target bean.
+
+        :type lowest_bean: entities.bean.Bean
+        :param lowest_bean: (Optional) The bean to eat. Default is the target
+            bean (see Pyobot.get_target_bean).
 
         :rtype: tuple
         :returns: A (pos1, pos2) tuple where pos1 is the leftmost position and
             pos2 is the rightmost one.
         """
 
-        lowest_bean = self.get_lowest_bean()
+        lowest_bean = lowest_bean or self.get_target_bean()
         if lowest_bean:
             return lowest_bean.pos[0] - (
                 self.level.size[1] - lowest_bean.pos[1]
@@ -80,7 +87,7 @@ class Pyobot(Pyoro):
         Turn Pyobot to make him look at the bean he will catch.
         """
 
-        lowest_bean = self.get_lowest_bean()
+        lowest_bean = self.get_target_bean()
         if lowest_bean:
             if self.pos[0] > lowest_bean.pos[0]:
                 self.enable_move_left()
@@ -109,24 +116,50 @@ class Pyobot(Pyoro):
 
     def remove(self):
         """
-        Reset the level (this entity can't die).
+        Reset the level (this entity can't die), or kill Pyobot if the level
+            has a mortal bot.
         """
 
-        self.level.reset()
+        if self.level.mortal_bot:
+            Pyoro.remove(self)
+        else:
+            self.level.reset()
 
     def get_lowest_bean(self):
         """
-        Find the bean which has the smallest vertical coordinate.
+        Find the bean which has the greatest vertical coordinate (the closest
+            to the floor). See game.bean_index.BeanIndex.
 
         :rtype: entities.bean.Bean
         :returns: The lowest bean.
         """
 
-        best_entity = None
-        for entity in self.level.entities:
-            if isinstance(entity, Bean):
-                if best_entity is None:
-                    best_entity = entity
-                elif entity.pos[1] > best_entity.pos[1]:
-                    best_entity = entity
-        return best_entity
+        return self.level.bean_index.get_lowest_bean()
+
+    def get_target_bean(self):
+        """
+        Find the lowest bean Pyobot can reach before it hits the floor. See
+            game.bean_index.BeanIndex.get_lowest_reachable_bean.
+
+        :rtype: entities.bean.Bean
+        :returns: The bean to eat.
+        """
+
+        return self.level.bean_index.get_lowest_reachable_bean(
+            self.get_time_to_reach
+        )
+
+    def get_time_to_reach(self, bean):
+        """
+        Estimate the time Pyobot needs to walk to a position where it can eat
+            a bean.
+
+        :type bean: entities.bean.Bean
+        :param bean: The bean to eat.
+
+        :rtype: float
+        :returns: The time to reach the bean (in seconds).
+        """
+
+        pos = self.get_nearest_pos(*self.get_pos_to_eat(bean))
+        return abs(self.pos[0] - pos) / (PYOBOT_SPEED * self.level.speed)
@@ -24,8 +24,8 @@ Created on 01/09/2018.
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
-from entities.bean import Bean
 from entities.pyoro_2 import Pyoro2
+from game.config import PYOBOT_SPEED
 
 
 class Pyobot2(Pyoro2):
@@ -37,37 +37,45 @@ class Pyobot2(Pyoro2):
     def update(self, delta_time):
         """
         Pyobot 2 search for the best position to eat the lowest bean and
-                update its position.
+                update its position. If the level has a bot controller, it
+                decides instead.
 
         :type delta_time: float
         :param delta_time: Time elapsed since the last update.
         """
 
-        pos = self.get_nearest_pos(*self.get_pos_to_eat())
-        if 0 < pos < self.level.size[0]:
-            if self.pos[0] > pos:
-                self.enable_move_left()
-            elif self.pos[0] < pos:
-                self.enable_move_right()
-        else:
-            self.disable_move()
+        if self.level.bot_controller is not None:
+            self.level.bot_controller.control(self)
+        elif not self.dead:
+            pos = self.get_nearest_pos(*self.get_pos_to_eat())
+            if 0 < pos < self.level.size[0]:
+                if self.pos[0] > pos:
+                    self.enable_move_left()
+                elif self.pos[0] < pos:
+                    self.enable_move_right()
+            else:
+                self.disable_move()
 
-        if int(pos) == int(self.pos[0]):
-            self.look_bean()
-            self.enable_capacity()
+            if int(pos) == int(self.pos[0]):
+                self.look_bean()
+                self.enable_capacity()
         Pyoro2.update(self, delta_time)
 
-    def get_pos_to_eat(self):
+    def get_pos_to_eat(self, lowest_bean=None):
         """
         Find the 2 horizontal position that could allow Pyobot 2 to eat the
-                lowest bean.
+                target bean.
+
+        :type lowest_bean: entities.bean.Bean
+        :param lowest_bean: (Optional) The bean to shoot. Default is the
+                target bean (see Pyobot2.get_target_bean).
 
         :rtype: tuple
         :returns: A (pos1, pos2) tuple where pos1 is the leftmost position and
                 pos2 is the rightmost one.
         """
 
-        lowest_bean = self.get_lowest_bean()
+        lowest_bean = lowest_bean or self.get_target_bean()
         if lowest_bean:
             return [
                 lowest_bean.pos[0] - (self.level.size[0] - lowest_bean.pos[1]),
@@ -80,7 +88,7 @@ class Pyobot2(Pyoro2):
         Turn Pyobot 2 to make him look at the bean he will catch.
         """
 
-        lowest_bean = self.get_lowest_bean()
+        lowest_bean = self.get_target_bean()
         if lowest_bean:
             if self.pos[0] > lowest_bean.pos[0]:
                 self.enable_move_left()
@@ -109,20 +117,50 @@ class Pyobot2(Pyoro2):
 
     def remove(self):
         """
-        Reset the level (this entity can't die).
+        Reset the level (this entity can't die), or kill Pyobot 2 if the
+                level has a mortal bot.
         """
 
-        self.level.reset()
+        if self.level.mortal_bot:
+            Pyoro2.remove(self)
+        else:
+            self.level.reset()
 
     def get_lowest_bean(self):
         """
-        Find the bean which has the smallest vertical coordinate.
+        Find the bean which has the greatest vertical coordinate (the closest
+            to the floor). See game.bean_index.BeanIndex.
 
         :rtype: entities.bean.Bean
         :returns: The lowest bean.
         """
 
-        for entity in self.level.entities:
-            if isinstance(entity, Bean):
-                return entity
-        return None
+        return self.level.bean_index.get_lowest_bean()
+
+    def get_target_bean(self):
+        """
+        Find the lowest bean Pyobot 2 can reach before it hits the floor. See
+                game.bean_index.BeanIndex.get_lowest_reachable_bean.
+
+        :rtype: entities.bean.Bean
+        :returns: The bean to shoot.
+        """
+
+        return self.level.bean_index.get_lowest_reachable_bean(
+            self.get_time_to_reach
+        )
+
+    def get_time_to_reach(self, bean):
+        """
+        Estimate the time Pyobot 2 needs to walk to a position where it can
+                shoot a bean.
+
+        :type bean: entities.bean.Bean
+        :param bean: The bean to shoot.
+
+        :rtype: float
+        :returns: The time to reach the bean (in seconds).
+        """
+
+        pos = self.get_nearest_pos(*self.get_pos_to_eat(bean))
+        return abs(self.pos[0] - pos) / (PYOBOT_SPEED * self.level.speed)
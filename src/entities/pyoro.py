@@ -26,6 +26,8 @@ __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
 from entities.entity import Entity
 from entities.tongue import Tongue
+from game.animation import SpriteTable
+from game.events import PyoroDiedEvent
 from game.config import (
     PYORO_SPEED,
     PYORO_NOTCH_DURATION,
@@ -33,12 +35,20 @@ from game.config import (
     PYORO_DIE_SPEED,
 )
 
+# Sprite states of Pyoro (see game.animation.SpriteTable)
+NORMAL, JUMP, EAT_0, EAT_1, DIE = range(5)
+
 
 class Pyoro(Entity):
     """
     Create a Pyoro (a little red bird) controlled by the player in game.
     """
 
+    sprite_table = SpriteTable(
+        "pyoro_{style}_{state}_{direction}.png",
+        ("normal", "jump", "eat_0", "eat_1", "die"),
+    )
+
     def __init__(self, level):
         """
         Initialize a new Pyoro object.
@@ -150,15 +160,15 @@ class Pyoro(Entity):
         if self.pos[0] < new_pos:
             old_pos = int(self.pos[0] + self.size[0] / 2)
             new_pos = min(int(new_pos), len(self.level.cases) - 1)
-            for i in range(old_pos, new_pos + 1):
-                if not self.level.cases[i].exists:
-                    return i
+            hole_pos = self.level.floor.get_next_hole_right(old_pos)
+            if hole_pos is not None and hole_pos <= new_pos:
+                return hole_pos
         else:
             old_pos = int(self.pos[0] - self.size[0] / 2 - 1)
             new_pos = max(int(new_pos), 0)
-            for i in range(old_pos, new_pos - 1, -1):
-                if not self.level.cases[i].exists:
-                    return i
+            hole_pos = self.level.floor.get_next_hole_left(old_pos)
+            if hole_pos is not None and hole_pos >= new_pos:
+                return hole_pos
         return None
 
     def enable_notch(self):
@@ -212,19 +222,20 @@ class Pyoro(Entity):
                 self.update_eating_count,
             )
 
-        style_type = self.level.get_style_type_with_score()
         if self.dead:
-            image_name = "pyoro_{}_die_{}.png"
+            state = DIE
         elif self.tongue:
-            image_name = "pyoro_{}_eat_1_{}.png"
+            state = EAT_1
         elif self.notch:
-            image_name = "pyoro_{}_jump_{}.png"
+            state = JUMP
         elif self.eating_count % 2:
-            image_name = "pyoro_{}_eat_0_{}.png"
+            state = EAT_0
         else:
-            image_name = "pyoro_{}_normal_{}.png"
+            state = NORMAL
 
-        self.current_image_name = image_name.format(style_type, self.direction)
+        self.sprite_id = self.sprite_table.get_id(
+            self.level.get_style_type_with_score(), state, self.direction
+        )
 
     def update_eating_count(self):
         """
@@ -252,7 +263,7 @@ class Pyoro(Entity):
             if self.tongue:
                 self.tongue.remove()
             self.tongue = Tongue(self.level, self.direction)
-            self.level.entities.append(self.tongue)
+            self.level.add_entity(self.tongue)
 
     def disable_capacity(self):
         """
@@ -270,6 +281,7 @@ class Pyoro(Entity):
 
         if not self.dead:
             self.dead = True
+            self.level.events.publish(PyoroDiedEvent(self))
             if self.tongue:
                 self.tongue.remove()
 
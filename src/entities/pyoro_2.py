@@ -27,15 +27,24 @@ __repo__ = "https://github.com/RedbeanGit/Pyoro"
 from entities.bean import Bean
 from entities.leaf import Leaf
 from entities.pyoro import Pyoro
-from entities.seed import Seed
+from game.animation import SpriteTable
 from game.config import PYORO_SHOOT_SPRITE_DURATION
 
+# Sprite states of Pyoro 2, the 4 shoot states follow SHOOT (see
+# game.animation.SpriteTable)
+NORMAL, JUMP, DIE, SHOOT = range(4)
+
 
 class Pyoro2(Pyoro):
     """
     Create a Pyoro 2 (a little yellow bird) controlled by the player in game.
     """
 
+    sprite_table = SpriteTable(
+        "pyoro_{style}_{state}_{direction}.png",
+        ("normal", "jump", "die") + tuple(f"shoot_{i}" for i in range(4)),
+    )
+
     def __init__(self, level):
         """
         Initialize a new Pyoro 2 object.
@@ -119,18 +128,18 @@ class Pyoro2(Pyoro):
         Define the sprite to use (normal, shooting, jumping, dying)
         """
 
-        style_type = self.level.get_style_type_with_score()
-        shoot_type = self.shoot_sprite_id - 1
         if self.dead:
-            self.current_image_name = f"pyoro_{style_type}_die_{self.direction}.png"
+            state = DIE
         elif self.shoot_sprite_id:
-            self.current_image_name = (
-                f"pyoro_{style_type}_shoot_{shoot_type}_{self.direction}.png"
-            )
+            state = SHOOT + self.shoot_sprite_id - 1
         elif self.notch:
-            self.current_image_name = f"pyoro_{style_type}_jump_{self.direction}.png"
+            state = JUMP
         else:
-            self.current_image_name = f"pyoro_{style_type}_normal_{self.direction}.png"
+            state = NORMAL
+
+        self.sprite_id = self.sprite_table.get_id(
+            self.level.get_style_type_with_score(), state, self.direction
+        )
 
     def enable_capacity(self):
         """
@@ -141,7 +150,9 @@ class Pyoro2(Pyoro):
         self.shoot_sprite_id = 1
         bean_coords = []
 
-        for entity in self.level.entities:
+        for entity in self.level.spatial_index.query_shot(
+            ("bean", "leaf"), self.pos, self.direction
+        ):
             if self.is_shooting_entity(entity):
                 if isinstance(entity, Bean):
                     entity.cut()
@@ -166,8 +177,8 @@ class Pyoro2(Pyoro):
 
         for bean_pos in bean_coords:
             self.level.spawn_score(score, bean_pos)
-        self.level.entities.append(Seed(self.level, 35, self.direction))
-        self.level.entities.append(Seed(self.level, 55, self.direction))
+        self.level.spawn_seed(35, self.direction)
+        self.level.spawn_seed(55, self.direction)
 
     def is_shooting_entity(self, entity):
         """
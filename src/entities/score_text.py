@@ -25,7 +25,8 @@ __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
 from entities.entity import Entity
-from game.config import SCORE_TEXT_BLINK_DURATION, SCORE_TEXT_LIFE_DURATION
+from game.animation import SCORE_TEXT_ANIMATIONS
+from game.config import SCORE_TEXT_LIFE_DURATION
 
 
 class ScoreText(Entity):
@@ -49,15 +50,44 @@ class ScoreText(Entity):
             1000).
         """
 
+        self.value = value
+        self.animation = SCORE_TEXT_ANIMATIONS[value]
+        Entity.__init__(self, level, pos, ScoreText.get_size(value))
+
+    @staticmethod
+    def get_size(value):
+        """
+        Get the size of a score_text according to its number of digits.
+
+        :type value: int
+        :param value: The value to display.
+
+        :rtype: tuple
+        :returns: The (width, height) size of the score_text.
+        """
+
         pixel_size = 1
         for _ in str(value):
             if value == 1:
                 pixel_size += 2
             else:
                 pixel_size += 4
+        return pixel_size * 0.125, 0.875
+
+    def reset(self, pos, value):
+        """
+        Reinitialize a removed score_text to use it again.
+
+        :type pos: list
+        :param pos: An [x, y] list where x and y are both float numbers.
+
+        :type value: int
+        :param value: The value to display.
+        """
+
         self.value = value
-        self.color_index = 0
-        Entity.__init__(self, level, pos, (pixel_size * 0.125, 0.875))
+        self.animation = SCORE_TEXT_ANIMATIONS[value]
+        Entity.reset(self, pos, ScoreText.get_size(value))
 
     def init_images(self):
         """
@@ -79,24 +109,10 @@ class ScoreText(Entity):
         )
         Entity.update(self, deltaTime)
 
-    def update_sprite(self):
-        """
-        Change the sprite to make a blinking effect.
-        """
-
-        if self.value in (300, 1000):
-            self.color_index = self.color_index + 1 if self.color_index < 5 else 0
-            self.current_image_name = f"number_{self.value}_{self.color_index}.png"
-        else:
-            self.current_image_name = f"number_{self.value}.png"
-        self.level.set_action_delay(
-            (self, "update_sprite"), SCORE_TEXT_BLINK_DURATION, self.update_sprite
-        )
-
     def remove(self):
         """
         Remove the score_text actions delayed en the score_text itself.
         """
 
-        self.level.remove_action_delay((self, "destroy"), (self, "update_sprite"))
+        self.level.remove_action_delay((self, "destroy"))
         Entity.remove(self)
@@ -22,14 +22,13 @@ Created on 27/03/2018.
 """
 
 import math
-import os
 
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
 from entities.entity import Entity
-from gui.image_transformer import resize_image
-from game.config import SEED_SPEED, AIR_RESISTANCE, GRAVITY_FORCE, ENTITIES_IMAGE_PATH
+from game.animation import SpriteTable
+from game.config import SEED_SPEED, AIR_RESISTANCE, GRAVITY_FORCE
 
 
 class Seed(Entity):
@@ -37,6 +36,9 @@ class Seed(Entity):
     Create seeds used for Pyoro 2 shoot animations.
     """
 
+    physics_kind = "seed"
+    sprite_table = SpriteTable("seed_{style}.png")
+
     def __init__(self, level, angle, direction):
         """
         Initialize a new Seed object.
@@ -51,19 +53,120 @@ class Seed(Entity):
         :param direction: The direction of the seed (1=right, -1=left).
         """
 
-        self.direction = direction
+        self.body_vel = [0, 0]
+        self.body_aux = [0, 255]
         self.sprite_alpha = 255
+        pos = self.init_trajectory(level, angle, direction)
+        Entity.__init__(self, level, pos, (0.125, 0.125))
+
+    @property
+    def vel(self):
+        """
+        The [x, y] velocity of the seed (shared with the physics backend).
+
+        :rtype: list
+        :returns: The velocity of the seed.
+        """
+
+        return self.body_vel
+
+    @vel.setter
+    def vel(self, vel):
+        """
+        Set the velocity of the seed.
+
+        :type vel: list
+        :param vel: The new [x, y] velocity.
+        """
+
+        self.body_vel[:] = vel
+
+    @property
+    def direction(self):
+        """
+        The direction of the seed (shared with the physics backend).
+
+        :rtype: int
+        :returns: 1 for right, -1 for left.
+        """
+
+        return self.body_aux[0]
+
+    @direction.setter
+    def direction(self, direction):
+        """
+        Set the direction of the seed.
+
+        :type direction: int
+        :param direction: 1 for right, -1 for left.
+        """
+
+        self.body_aux[0] = direction
+
+    @property
+    def sprite_alpha(self):
+        """
+        The opacity of the seed (shared with the physics backend).
+
+        :rtype: float
+        :returns: The opacity of the seed.
+        """
+
+        return self.body_aux[1]
+
+    @sprite_alpha.setter
+    def sprite_alpha(self, sprite_alpha):
+        """
+        Set the opacity of the seed.
+
+        :type sprite_alpha: float
+        :param sprite_alpha: The new opacity.
+        """
+
+        self.body_aux[1] = sprite_alpha
+
+    def init_trajectory(self, level, angle, direction):
+        """
+        Define the direction and the velocity of the seed.
+
+        :type level: game.level.Level
+        :param level: The level managing this object
+
+        :type angle: float
+        :param angle: The initial trajectory's angle in degree.
+
+        :type direction: int
+        :param direction: The direction of the seed (1=right, -1=left).
+
+        :rtype: tuple
+        :returns: The initial (x, y) position of the seed (in front of
+            Pyoro's beak).
+        """
+
+        self.direction = direction
         self.vel = [
             math.cos(angle * math.pi / 180) * direction * SEED_SPEED,
             -math.sin(angle * math.pi / 180) * SEED_SPEED,
         ]
-
-        pos = (
+        return (
             level.pyoro.pos[0] + (level.pyoro.size[0] / 2 + 0.0625) * direction,
             level.pyoro.pos[1] - level.pyoro.size[1] / 2 + 0.0625,
         )
 
-        Entity.__init__(self, level, pos, (0.125, 0.125))
+    def reset(self, angle, direction):
+        """
+        Reinitialize a removed seed to use it again.
+
+        :type angle: float
+        :param angle: The initial trajectory's angle in degree.
+
+        :type direction: int
+        :param direction: The direction of the seed (1=right, -1=left).
+        """
+
+        self.sprite_alpha = 255
+        pos = self.init_trajectory(self.level, angle, direction)
+        Entity.reset(self, pos, (0.125, 0.125))
 
     def __init_images__(self, folder_name):
         """
@@ -73,21 +176,12 @@ class Seed(Entity):
         :param folder_name: The path to the folder containing the seeds.
         """
 
-        self.images = {}
-        folder = os.path.join(ENTITIES_IMAGE_PATH, folder_name)
-        image_names = os.listdir(folder)
-        case_size = self.level.level_drawer.get_case_size()
-
-        for image_name in image_names:
-            if image_name.split(".")[-1] == "png":
-                self.images[image_name] = resize_image(
-                    self.level.level_drawer.activity.window.get_image(
-                        os.path.join(folder, image_name), alpha_channel=False
-                    ),
-                    (case_size[0] * self.size[0], case_size[1] * self.size[1]),
-                )
-                self.images[image_name].set_alpha(self.sprite_alpha)
-                self.current_image_name = image_name
+        self.images = self.level.level_drawer.get_entity_images(
+            folder_name, self.size, alpha_channel=False
+        )
+        for image in self.images.values():
+            image.set_alpha(self.sprite_alpha)
+        self.compile_sprites()
 
     def init_images(self):
         """
@@ -120,5 +214,7 @@ class Seed(Entity):
         Define the sprite to use according to the current level style
         """
 
-        self.current_image_name = f"seed_{self.level.get_style_type_with_score()}.png"
-        self.images[self.current_image_name].set_alpha(self.sprite_alpha)
+        self.sprite_id = self.sprite_table.get_id(
+            self.level.get_style_type_with_score()
+        )
+        self.sprites[self.sprite_id].set_alpha(self.sprite_alpha)
@@ -25,6 +25,7 @@ __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
 from entities.entity import Entity
+from game.animation import SMOKE_ANIMATION
 from game.config import SMOKE_SPRITE_DURATION
 
 
@@ -33,6 +34,8 @@ class Smoke(Entity):
     Create a Smoke object used for destrution animations.
     """
 
+    animation = SMOKE_ANIMATION
+
     def __init__(self, level, pos):
         """
         Initialize a new Smoke object.
@@ -44,9 +47,18 @@ class Smoke(Entity):
         :param pos: An [x, y] list where x and y are both float numbers.
         """
 
-        self.sprite_index = 0
         Entity.__init__(self, level, pos, (1.5, 1.5))
 
+    def reset(self, pos):
+        """
+        Reinitialize a removed smoke to use it again.
+
+        :type pos: list
+        :param pos: An [x, y] list where x and y are both float numbers.
+        """
+
+        Entity.reset(self, pos, (1.5, 1.5))
+
     def init_images(self):
         """
         Initialize smoke images.
@@ -69,24 +81,10 @@ class Smoke(Entity):
         )
         Entity.update(self, deltaTime)
 
-    def update_sprite(self):
-        """
-        Define the sprite to use according to the animation's state and the
-            current level style.
-        """
-
-        score = self.level.get_style_type_with_score()
-        self.sprite_index = self.sprite_index + 1 if self.sprite_index < 2 else 0
-        self.current_image_name = f"smoke_{score}_{self.sprite_index}.png"
-
-        self.level.set_action_delay((self, "update_sprite"),
-                                    SMOKE_SPRITE_DURATION, self.update_sprite)
-
     def remove(self):
         """
         Remove the smoke actions delayed and the smoke itself.
         """
 
-        self.level.remove_action_delay(
-            (self, "destroy"), (self, "update_sprite"))
+        self.level.remove_action_delay((self, "destroy"))
         Entity.remove(self)
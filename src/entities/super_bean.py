@@ -21,13 +21,11 @@ Provide a Score_text class (entity).
 Created on 17/03/2018.
 """
 
-import random
-
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
 from entities.bean import Bean
-from game.config import BEAN_SPRITE_DURATION
+from game.animation import SUPER_BEAN_ANIMATION
 
 
 class SuperBean(Bean):
@@ -36,6 +34,8 @@ class SuperBean(Bean):
         cases and to explode all beans currently falling.
     """
 
+    animation = SUPER_BEAN_ANIMATION
+
     def __init__(self, level, pos, speed):
         """
         Initialize a new Super_bean object.
@@ -50,8 +50,6 @@ class SuperBean(Bean):
         :param speed: The falling speed multiplicator.
         """
 
-        self.sprite_index = 0
-        self.color_index = 0
         Bean.__init__(self, level, pos, speed)
 
     def init_images(self):
@@ -69,22 +67,6 @@ class SuperBean(Bean):
         Bean.init_sounds(self)
         self.__init_sounds__(("bean_implode",))
 
-    def update_sprite(self):
-        """
-        Define the sprite to use according to the blinking animation state and
-            the current level style.
-        """
-
-        if not self.color_index % 2:
-            self.sprite_index = self.sprite_index + 1 if self.sprite_index < 2 else 0
-
-        self.color_index = self.color_index + 1 if self.color_index < 5 else 0
-        self.current_image_name = f"bean_{self.sprite_index}_{self.color_index}.png"
-
-        self.level.set_action_delay(
-            (self, "update_sprite"), BEAN_SPRITE_DURATION / 6, self.update_sprite
-        )
-
     def catch(self):
         """
         Explode all the beans currently falling and repair 10 destroyed cases.
@@ -94,12 +76,16 @@ class SuperBean(Bean):
         for entity in self.level.entities:
             if isinstance(entity, Bean) and entity != self:
                 self.level.create_action_delay(
-                    (self, "destroy_bean", i), i * 0.1, self.destroy_bean, entity, i
+                    (self, "destroy_bean", i),
+                    i * 0.1,
+                    self.destroy_bean,
+                    entity.handle,
+                    i,
                 )
                 i += 1
         i = 0
-        empty_cases = list(self.level.get_void_cases())
-        for i in range(min(10, len(empty_cases))):
+        empty_cases = self.level.get_void_cases(10)
+        for i in range(len(empty_cases)):
             self.level.create_action_delay(
                 (self, "repair_case", empty_cases[i].pos),
                 i * 0.5,
@@ -108,23 +94,27 @@ class SuperBean(Bean):
             )
         Bean.catch(self)
 
-    def destroy_bean(self, bean, bean_id):
+    def destroy_bean(self, bean_handle, bean_id):
         """
         Explode a bean, increase the score and remove action delayed
-            associated with this bean.
+            associated with this bean. Nothing happens if the bean has been
+            removed since the explosion was decided.
 
-        :type bean: entities.bean.Bean
-        :param bean: The bean to destroy.
+        :type bean_handle: int
+        :param bean_handle: The handle of the bean to destroy (see
+            game.level.Level.get_entity).
 
         :type bean_id: int
         :param bean_id: An integer associated with this bean when the explosion
             was decided.
         """
 
-        self.sounds["bean_implode"].play()
-        bean.cut()
-        bean.remove()
-        self.level.spawn_score(50, bean.pos)
+        bean = self.level.get_entity(bean_handle)
+        if bean:
+            self.sounds["bean_implode"].play()
+            bean.cut()
+            bean.remove()
+            self.level.spawn_score(50, bean.pos)
         self.level.remove_action_delay((self, "destroy_bean", bean_id))
 
     def cut(self):
@@ -135,8 +125,8 @@ class SuperBean(Bean):
         self.sounds["bean_cut"].play()
         for _ in range(2):
             rand_pos = [
-                self.pos[0] + random.uniform(-0.5, 0.5),
-                self.pos[1] + random.uniform(-0.5, 0.2),
+                self.pos[0] + self.level.random.uniform(-0.5, 0.5),
+                self.pos[1] + self.level.random.uniform(-0.5, 0.2),
             ]
             self.level.spawn_leaf(rand_pos, "super leaf")
 
@@ -150,11 +140,3 @@ class SuperBean(Bean):
 
         self.level.repair_case(case)
         self.level.remove_action_delay((self, "repair_case", case.pos))
-
-    def remove(self):
-        """
-        Remove the super bean action delayed and the super bean itself.
-        """
-
-        self.level.remove_action_delay(("override", self, "update_sprite"))
-        Bean.remove(self)
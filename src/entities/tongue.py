@@ -24,8 +24,8 @@ Created on 21/03/2018.
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
-from entities.bean import Bean
 from entities.entity import Entity
+from game.animation import SpriteTable
 from game.config import TONG_SPEED
 
 
@@ -34,6 +34,8 @@ class Tongue(Entity):
     Creat a Tongue object used by Pyoro to catch falling beans.
     """
 
+    sprite_table = SpriteTable("tongue_{style}_{direction}.png")
+
     def __init__(self, level, direction):
         """
         Initialize a new Tongue object.
@@ -97,8 +99,10 @@ class Tongue(Entity):
             self.pos[0] += TONG_SPEED * self.direction * deltaTime
             self.pos[1] -= TONG_SPEED * deltaTime
 
-            for entity in self.level.entities:
-                if self.is_hitting_entity(entity) and isinstance(entity, Bean):
+            for entity in self.level.spatial_index.query_box(
+                ("bean",), self.pos, self.size
+            ):
+                if self.is_hitting_entity(entity):
                     entity.catch()
                     self.sounds["tongue"].stop()
 
@@ -126,8 +130,9 @@ class Tongue(Entity):
         Define the sprite to use according to the current level style.
         """
 
-        score = self.level.get_style_type_with_score()
-        self.current_image_name = f"tongue_{score}_{self.direction}.png"
+        self.sprite_id = self.sprite_table.get_id(
+            self.level.get_style_type_with_score(), direction=self.direction
+        )
 
     def remove(self):
         """
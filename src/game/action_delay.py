@@ -69,4 +69,11 @@ class ActionDelay:
 
         self.passed_time += delta_time
         if self.passed_time >= self.wait_time:
-            self.fct(*self.fct_args, **self.fct_kwargs)
+            self.run()
+
+    def run(self):
+        """
+        Call the delayed function or method.
+        """
+
+        self.fct(*self.fct_args, **self.fct_kwargs)
@@ -0,0 +1,217 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide a class to schedule named game.action_delay.ActionDelay objects
+with a priority queue.
+
+Created on 17/10/2026
+"""
+
+import heapq
+import itertools
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.action_delay import ActionDelay
+
+
+class ActionScheduler:
+    """
+    Store named action delays in a heap ordered by due time. Each update only
+    costs the number of action delays which are due. Removed or replaced
+    action delays are dropped from the heap lazily.
+    """
+
+    def __init__(self):
+        """
+        Initialize an ActionScheduler object.
+        """
+
+        self.time = 0
+        self.action_delays = {}
+        self.queue = []
+        self.counter = itertools.count()
+
+    def create_action_delay(self, action_name, wait_time, fct, *fct_args, **fct_kwargs):
+        """
+        Create a new action_delay. If an action_delay already exists with the
+        same name, do nothing.
+
+        :type action_name: object
+        :param action_name: The name given to the new action_delay.
+
+        :type wait_time: float
+        :param wait_time: The time to wait before calling fct.
+
+        :type fct: function or method
+        :param fct: The function or method to delay.
+        """
+
+        if action_name not in self.action_delays:
+            self.set_action_delay(action_name, wait_time, fct, *fct_args, **fct_kwargs)
+
+    def set_action_delay(self, action_name, wait_time, fct, *fct_args, **fct_kwargs):
+        """
+        Create a new action_delay or replace an existing one.
+
+        :type action_name: object
+        :param action_name: The name given to the new action_delay.
+
+        :type wait_time: float
+        :param wait_time: The time to wait before calling fct.
+
+        :type fct: function or method
+        :param fct: The function or method to delay.
+        """
+
+        action_delay = ActionDelay(wait_time, fct, *fct_args, **fct_kwargs)
+        self.action_delays[action_name] = action_delay
+        self.push(action_name, action_delay, self.time + wait_time)
+
+    def remove_action_delay(self, *action_names):
+        """
+        Remove action_delay(s). Their heap entries are ignored when they are
+        due.
+
+        :type *action_names: object
+        :param *action_names: The name of the action_delays to remove.
+        """
+
+        for action_name in action_names:
+            self.action_delays.pop(action_name, None)
+
+    def push(self, action_name, action_delay, due_time):
+        """
+        Add an action_delay to the heap and compact the heap if it contains
+        too many removed action delays.
+
+        :type action_name: object
+        :param action_name: The name of the action_delay.
+
+        :type action_delay: game.action_delay.ActionDelay
+        :param action_delay: The action_delay to schedule.
+
+        :type due_time: float
+        :param due_time: The scheduler time when the action_delay is due.
+        """
+
+        heapq.heappush(
+            self.queue, (due_time, next(self.counter), action_name, action_delay)
+        )
+        if len(self.queue) > 2 * len(self.action_delays) + 64:
+            self.compact()
+
+    def compact(self):
+        """
+        Drop removed and replaced action delays from the heap.
+        """
+
+        self.queue = [
+            entry for entry in self.queue if self.is_scheduled(entry[2], entry[3])
+        ]
+        heapq.heapify(self.queue)
+
+    def is_scheduled(self, action_name, action_delay):
+        """
+        Check if an action_delay is still registered with the given name.
+
+        :type action_name: object
+        :param action_name: The name of the action_delay.
+
+        :type action_delay: game.action_delay.ActionDelay
+        :param action_delay: The action_delay to check.
+
+        :rtype: bool
+        :returns: True if the action_delay has not been removed nor replaced.
+        """
+
+        return self.action_delays.get(action_name) is action_delay
+
+    def update(self, delta_time):
+        """
+        Advance the time and call the action delays which are due. As with
+        game.action_delay.ActionDelay.update, an action_delay is called at each
+        update until it is removed or replaced.
+
+        :type delta_time: float
+        :param delta_time: Time elapsed since the last update.
+        """
+
+        self.time += delta_time
+        due = []
+        while self.queue and self.queue[0][0] <= self.time:
+            _, _, action_name, action_delay = heapq.heappop(self.queue)
+            if self.is_scheduled(action_name, action_delay):
+                due.append((action_name, action_delay))
+
+        for action_name, action_delay in due:
+            if self.is_scheduled(action_name, action_delay):
+                action_delay.run()
+                if self.is_scheduled(action_name, action_delay):
+                    self.push(action_name, action_delay, self.time)
+
+    def clear(self):
+        """
+        Remove all action delays.
+        """
+
+        self.action_delays.clear()
+        self.queue.clear()
+
+    def get_entries(self):
+        """
+        Get the scheduled action delays with their due time.
+
+        :rtype: list<tuple>
+        :returns: A list of (action_name, action_delay, due_time, rank)
+            tuples in registration order, where rank is the position of the
+            action_delay in the heap order.
+        """
+
+        ranks = {}
+        for entry in sorted(self.queue, key=lambda entry: entry[:2]):
+            if self.is_scheduled(entry[2], entry[3]):
+                ranks[id(entry[3])] = (entry[0], len(ranks))
+        return [
+            (action_name, action_delay) + ranks[id(action_delay)]
+            for action_name, action_delay in self.action_delays.items()
+        ]
+
+    def restore(self, time, entries):
+        """
+        Replace all action delays (see ActionScheduler.get_entries).
+
+        :type time: float
+        :param time: The scheduler time.
+
+        :type entries: list<tuple>
+        :param entries: A list of (action_name, action_delay, due_time, rank)
+            tuples.
+        """
+
+        self.clear()
+        self.time = time
+        for action_name, action_delay, _, _ in entries:
+            self.action_delays[action_name] = action_delay
+        for action_name, action_delay, due_time, _ in sorted(
+            entries, key=lambda entry: entry[3]
+        ):
+            heapq.heappush(
+                self.queue, (due_time, next(self.counter), action_name, action_delay)
+            )
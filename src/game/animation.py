@@ -0,0 +1,199 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide the sprite tables and the animation clips of the entities. Sprites
+are selected with integer ids computed from the level state, and the
+current image of an animated entity is computed from the level clock when
+it's drawn, so no action delay is needed to flip sprites.
+
+Created on 17/10/2026
+"""
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import (
+    ANGEL_SPRITE_DURATION,
+    BEAN_SPRITE_DURATION,
+    LEAF_SPRITE_DURATION,
+    SCORE_TEXT_BLINK_DURATION,
+    SMOKE_SPRITE_DURATION,
+)
+
+# Number of level styles (see game.level.Level.get_style_type_with_score)
+NB_STYLES = 3
+
+
+class SpriteTable:
+    """
+    The image names of an entity kind compiled once in a flat tuple. A sprite
+    is identified by an integer computed from its (style, state, direction,
+    frame) indexes, so choosing a sprite needs no string formatting.
+    """
+
+    def __init__(self, name_format, states=("",), frames=("",)):
+        """
+        Initialize a SpriteTable object.
+
+        :type name_format: str
+        :param name_format: The image name with {style}, {state},
+            {direction} and {frame} fields (unused fields are allowed).
+
+        :type states: tuple<str>
+        :param states: (Optional) The values of the {state} field. Default
+            is a single empty state.
+
+        :type frames: tuple
+        :param frames: (Optional) The values of the {frame} field. Default is
+            a single empty frame.
+        """
+
+        self.nb_states = len(states)
+        self.nb_frames = len(frames)
+        self.image_names = tuple(
+            name_format.format(
+                style=style_type, state=state, direction=direction, frame=frame
+            )
+            for style_type in range(NB_STYLES)
+            for state in states
+            for direction in (-1, 1)
+            for frame in frames
+        )
+
+    def get_id(self, style_type, state=0, direction=1, frame=0):
+        """
+        Get the id of a sprite.
+
+        :type style_type: int
+        :param style_type: The current style of the level.
+
+        :type state: int
+        :param state: (Optional) The index of the state. Default is 0.
+
+        :type direction: int
+        :param direction: (Optional) The direction of the entity (1=right,
+            -1=left). Default is 1.
+
+        :type frame: int
+        :param frame: (Optional) The index of the frame. Default is 0.
+
+        :rtype: int
+        :returns: The index of the image name in SpriteTable.image_names.
+        """
+
+        return (
+            (style_type * self.nb_states + state) * 2 + (direction > 0)
+        ) * self.nb_frames + frame
+
+
+class AnimationClip:
+    """
+    A looping sequence of the frames of a sprite table, shown for the same
+    duration each.
+    """
+
+    def __init__(self, sprite_table, frame_duration):
+        """
+        Initialize an AnimationClip object.
+
+        :type sprite_table: game.animation.SpriteTable
+        :param sprite_table: The sprites of the clip (one per frame).
+
+        :type frame_duration: float
+        :param frame_duration: The time each frame is shown (in seconds).
+        """
+
+        self.sprite_table = sprite_table
+        self.frame_duration = frame_duration
+
+    def get_sprite_id(self, elapsed_time, style_type):
+        """
+        Get the sprite to show.
+
+        :type elapsed_time: float
+        :param elapsed_time: Time elapsed since the animation has started.
+
+        :type style_type: int
+        :param style_type: The current style of the level.
+
+        :rtype: int
+        :returns: The id of the sprite in the sprite table.
+        """
+
+        frame = int(elapsed_time / self.frame_duration) % self.sprite_table.nb_frames
+        return self.sprite_table.get_id(style_type, frame=frame)
+
+
+# Animation clips by id (see entities.entity.Entity.animation)
+ANIMATIONS = []
+
+
+def register_animation(name_format, frames, frame_duration):
+    """
+    Create an animation clip and give it an id.
+
+    :type name_format: str
+    :param name_format: The image name with {style} and {frame} fields.
+
+    :type frames: tuple
+    :param frames: The values of the {frame} field in display order.
+
+    :type frame_duration: float
+    :param frame_duration: The time each frame is shown (in seconds).
+
+    :rtype: int
+    :returns: The id of the clip in ANIMATIONS.
+    """
+
+    ANIMATIONS.append(
+        AnimationClip(SpriteTable(name_format, frames=frames), frame_duration)
+    )
+    return len(ANIMATIONS) - 1
+
+
+ANGEL_ANIMATION = register_animation(
+    "angel_{style}_{frame}.png", range(2), ANGEL_SPRITE_DURATION
+)
+BEAN_ANIMATION = register_animation(
+    "bean_{style}_{frame}.png", range(3), BEAN_SPRITE_DURATION
+)
+# The super bean swings every 2 color changes (one color before the swing)
+SUPER_BEAN_ANIMATION = register_animation(
+    "bean_{frame}.png",
+    ("1_1", "1_2", "2_3", "2_4", "0_5", "0_0"),
+    BEAN_SPRITE_DURATION / 6,
+)
+LEAF_ANIMATION = register_animation(
+    "leaf_{style}_{frame}.png", range(3), LEAF_SPRITE_DURATION
+)
+LEAF_PIECE_ANIMATION = register_animation(
+    "leafpiece_{style}_{frame}.png", range(3), LEAF_SPRITE_DURATION
+)
+SMOKE_ANIMATION = register_animation(
+    "smoke_{style}_{frame}.png", range(3), SMOKE_SPRITE_DURATION
+)
+# Score texts by displayed value, 300 and 1000 are blinking
+SCORE_TEXT_ANIMATIONS = {
+    value: register_animation(
+        f"number_{value}{{frame}}.png",
+        tuple(f"_{color}" for color in range(6)) if value in (300, 1000) else ("",),
+        SCORE_TEXT_BLINK_DURATION,
+    )
+    for value in (10, 50, 100, 300, 1000)
+}
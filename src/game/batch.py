@@ -0,0 +1,244 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide a runner playing many headless bot games on all the processor
+cores, with different seeds and config values.
+
+Created on 17/10/2026
+"""
+
+import multiprocessing
+import sys
+
+import numpy
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+import game.config
+from game.config import FPS, PLANNING_BOT
+from game.headless import HeadlessLevelDrawer
+from game.planner import Planner
+
+# Columns of the results and their numpy type
+RESULT_COLUMNS = (
+    ("job", numpy.int32),
+    ("seed", numpy.uint32),
+    ("config", numpy.int16),
+    ("score", numpy.int32),
+    ("time", numpy.float32),
+    ("frames", numpy.int32),
+    ("beans", numpy.int32),
+)
+
+
+def apply_config(overrides):
+    """
+    Change some values of game.config. Modules use
+    "from game.config import NAME" so the value is also changed in every
+    loaded game module still using the original one. Config values are
+    only read when a function is called (default arguments are None, not
+    config values), so every value can be changed.
+
+    :type overrides: dict
+    :param overrides: A {name: value} dictionary of config values.
+
+    :rtype: dict
+    :returns: The previous {name: value} dictionary, to give back to
+        apply_config to restore the config.
+    """
+
+    previous = {}
+    for name, value in overrides.items():
+        if not hasattr(game.config, name):
+            print(f"[WARNING] [apply_config] Unknown config value {name}")
+            continue
+        old_value = getattr(game.config, name)
+        previous[name] = old_value
+        for module_name, module in tuple(sys.modules.items()):
+            if module_name.split(".")[0] in ("game", "entities", "gui", "audio") \
+                    and getattr(module, name, None) is old_value:
+                setattr(module, name, value)
+    return previous
+
+
+def create_results(nb_games):
+    """
+    Create empty results in columnar format.
+
+    :type nb_games: int
+    :param nb_games: The number of games.
+
+    :rtype: dict
+    :returns: A {column name: numpy.ndarray} dictionary (see RESULT_COLUMNS).
+    """
+
+    return {name: numpy.zeros(nb_games, dtype) for name, dtype in RESULT_COLUMNS}
+
+
+def run_games(game_id, jobs, overrides, config_id, duration, delta_time):
+    """
+    Play some bot games one after another with the same config values. Bots
+    are mortal, so a game ends when the bot is killed or when the duration
+    is reached. If PLANNING_BOT is set, bots use a game.planner.Planner.
+
+    :type game_id: int
+    :param game_id: 0 for Pyoro, 1 for Pyoro 2.
+
+    :type jobs: list<tuple>
+    :param jobs: A list of (job index, seed) tuples.
+
+    :type overrides: dict
+    :param overrides: The config values to use (see apply_config).
+
+    :type config_id: int
+    :param config_id: The index of the overrides in the batch.
+
+    :type duration: float
+    :param duration: The maximum simulated time of a game (in seconds).
+
+    :type delta_time: float
+    :param delta_time: The time step of each update (in seconds), or None
+        for 1 / game.config.FPS.
+
+    :rtype: dict
+    :returns: The results of the games in columnar format.
+    """
+
+    previous = apply_config(overrides)
+    delta_time = delta_time or 1 / FPS
+    results = create_results(len(jobs))
+    try:
+        for i, (job, seed) in enumerate(jobs):
+            level_drawer = HeadlessLevelDrawer(
+                game_id, True, seed=seed, mortal_bot=True
+            )
+            if PLANNING_BOT:
+                level_drawer.level.bot_controller = Planner(level_drawer.level)
+            frames = 0
+            while frames * delta_time < duration \
+                    and not level_drawer.is_game_over():
+                level_drawer.update(delta_time)
+                frames += 1
+
+            level = level_drawer.level
+            results["job"][i] = job
+            results["seed"][i] = level.seed
+            results["config"][i] = config_id
+            results["score"][i] = level.score
+            results["time"][i] = frames * delta_time
+            results["frames"][i] = frames
+            results["beans"][i] = level.nb_spawned_beans
+    finally:
+        apply_config(previous)
+    return results
+
+
+def run_task(task):
+    """
+    Unpack a task sent to a worker process and run its games.
+
+    :type task: tuple
+    :param task: The arguments of run_games.
+
+    :rtype: dict
+    :returns: The results of the games in columnar format.
+    """
+
+    return run_games(*task)
+
+
+def iter_batch(game_id=0, seeds=range(100), configs=({},), duration=300,
+               delta_time=None, nb_workers=None, games_per_task=8):
+    """
+    Play each seed with each config in a pool of processes and give the
+    results of each task as soon as they are ready (in any order).
+
+    :type game_id: int
+    :param game_id: (Optional) 0 for Pyoro, 1 for Pyoro 2. Default is 0.
+
+    :type seeds: Iterable<int>
+    :param seeds: (Optional) The seeds of the games. Default is 0 to 99.
+
+    :type configs: Iterable<dict>
+    :param configs: (Optional) The config values to try (see apply_config),
+        e.g. ({}, {"BEAN_FREQUENCY": 1.5}). Default is the game config only.
+
+    :type duration: float
+    :param duration: (Optional) The maximum simulated time of a game (in
+        seconds). Default is 300.
+
+    :type delta_time: float
+    :param delta_time: (Optional) The time step of each update (in seconds).
+        Default is 1 / game.config.FPS.
+
+    :type nb_workers: int
+    :param nb_workers: (Optional) The number of processes. Default is None
+        (one per processor core).
+
+    :type games_per_task: int
+    :param games_per_task: (Optional) The number of games played by a worker
+        before sending the results. Default is 8.
+
+    :rtype: generator
+    :returns: A generator of results in columnar format (see run_games).
+    """
+
+    seeds = list(seeds)
+    tasks = []
+    job = 0
+    for config_id, overrides in enumerate(configs):
+        jobs = []
+        for seed in seeds:
+            jobs.append((job, seed))
+            job += 1
+        for i in range(0, len(jobs), games_per_task):
+            tasks.append(
+                (game_id, jobs[i: i + games_per_task], overrides, config_id,
+                 duration, delta_time)
+            )
+
+    print(
+        f"[INFO] [iter_batch] Running {job} games in {len(tasks)} tasks "
+        + f"on {nb_workers or multiprocessing.cpu_count()} processes"
+    )
+    with multiprocessing.Pool(nb_workers) as pool:
+        yield from pool.imap_unordered(run_task, tasks)
+
+
+def run_batch(*args, **kwargs):
+    """
+    Play many games (see iter_batch) and gather their results.
+
+    :rtype: dict
+    :returns: A {column name: numpy.ndarray} dictionary with the "job"
+        index, the "seed", the "config" index, the final "score", the
+        simulated "time", the number of "frames" and the number of spawned
+        "beans" of each game, sorted by job index.
+    """
+
+    parts = list(iter_batch(*args, **kwargs))
+    if not parts:
+        return create_results(0)
+    results = {
+        name: numpy.concatenate([part[name] for part in parts])
+        for name, _ in RESULT_COLUMNS
+    }
+    order = numpy.argsort(results["job"])
+    return {name: column[order] for name, column in results.items()}
@@ -0,0 +1,165 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide an index of the falling beans of a level ordered by height.
+
+Created on 17/10/2026
+"""
+
+import bisect
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import BEAN_SPEED
+
+
+class BeanIndex:
+    """
+    Keep the beans of a level sorted from the lowest (greatest vertical
+    position) to the highest. Beans are sorted again on the first query
+    after BeanIndex.invalidate (once per level step). Beans keep almost the
+    same order between two steps so sorting them is nearly linear.
+    """
+
+    def __init__(self, level):
+        """
+        Initialize a BeanIndex object.
+
+        :type level: game.level.Level
+        :param level: The level whose beans are indexed.
+        """
+
+        self.level = level
+        self.beans = []
+        self.heights = []
+        self.new_beans = []
+        self.sorted = True
+
+    def add(self, bean):
+        """
+        Add a new bean to the index.
+
+        :type bean: entities.bean.Bean
+        :param bean: The bean to add.
+        """
+
+        self.new_beans.append(bean)
+        self.sorted = False
+
+    def invalidate(self):
+        """
+        Mark the order as outdated. It must be called when beans have moved.
+        """
+
+        self.sorted = False
+
+    def clear(self):
+        """
+        Remove all beans from the index.
+        """
+
+        self.beans.clear()
+        self.heights.clear()
+        self.new_beans.clear()
+        self.sorted = True
+
+    def sort(self):
+        """
+        Drop the removed beans, add the new ones and sort them again.
+        """
+
+        store = self.level.entities
+        beans = [bean for bean in self.beans if bean in store]
+        beans.extend(bean for bean in self.new_beans if bean in store)
+        beans.sort(key=lambda bean: -bean.pos[1])
+
+        self.beans = beans
+        self.heights = [-bean.pos[1] for bean in beans]
+        self.new_beans.clear()
+        self.sorted = True
+
+    def get_lowest_bean(self):
+        """
+        Get the bean which is the closest to the floor.
+
+        :rtype: entities.bean.Bean
+        :returns: The lowest bean or None if there is no bean.
+        """
+
+        if not self.sorted:
+            self.sort()
+        return self.beans[0] if self.beans else None
+
+    def get_beans_lower_than(self, height):
+        """
+        Get the beans under a vertical position.
+
+        :type height: float
+        :param height: The vertical position.
+
+        :rtype: list<entities.bean.Bean>
+        :returns: The beans whose vertical position is greater than height,
+            from the lowest to the highest.
+        """
+
+        if not self.sorted:
+            self.sort()
+        return self.beans[: bisect.bisect_left(self.heights, -height)]
+
+    def get_lowest_reachable_bean(self, get_time_to_reach):
+        """
+        Get the lowest bean which can be reached before it hits the floor.
+        Beans are checked from the lowest, so only the beans under the
+        result are checked.
+
+        :type get_time_to_reach: function
+        :param get_time_to_reach: A function giving the time needed to reach
+            a bean (in seconds).
+
+        :rtype: entities.bean.Bean
+        :returns: The lowest reachable bean which hasn't been caught, the
+            lowest bean if none can be reached, or None if there is no bean.
+        """
+
+        if not self.sorted:
+            self.sort()
+        for bean in self.beans:
+            if not bean.caught \
+                    and get_time_to_reach(bean) <= self.get_time_to_impact(bean):
+                return bean
+        return self.beans[0] if self.beans else None
+
+    def get_time_to_impact(self, bean):
+        """
+        Estimate the time before a bean hits the floor. The acceleration of
+        the level is neglected.
+
+        :type bean: entities.bean.Bean
+        :param bean: The bean.
+
+        :rtype: float
+        :returns: The estimated time (in seconds). It's infinite if the bean
+            has been caught.
+        """
+
+        if bean.caught:
+            return float("inf")
+        distance = self.level.size[1] - 1 - bean.pos[1] - bean.size[1] / 2
+        return max(distance, 0) / (BEAN_SPEED * bean.speed * self.level.speed)
@@ -28,17 +28,44 @@ __repo__ = "https://github.com/RedbeanGit/Pyoro"
 class Case:
     """
     A block on which Pyoro can walk. It can be destroyed and
-    repaired by entities.angel.Angel.
+    repaired by entities.angel.Angel. Its state is stored in the floor
+    bitsets of the level (see game.floor.Floor).
     """
 
-    def __init__(self, pos):
+    def __init__(self, pos, floor):
         """
         Initialize a Case object.
 
         :type pos: int
         :param pos: The horizontal position of the block.
+
+        :type floor: game.floor.Floor
+        :param floor: The floor storing the state of the block.
         """
 
         self.pos = pos
-        self.exists = True
-        self.is_repairing = False
+        self.floor = floor
+
+    @property
+    def exists(self):
+        """
+        False if the block is destroyed.
+        """
+
+        return self.floor.exists(self.pos)
+
+    @exists.setter
+    def exists(self, exists):
+        self.floor.set_exists(self.pos, exists)
+
+    @property
+    def is_repairing(self):
+        """
+        True if an angel is repairing the block.
+        """
+
+        return self.floor.is_repairing(self.pos)
+
+    @is_repairing.setter
+    def is_repairing(self, is_repairing):
+        self.floor.set_repairing(self.pos, is_repairing)
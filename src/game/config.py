@@ -38,8 +38,16 @@ NAME = "PYORO"
 VERSION = "1.1.1"
 # background color
 WINDOW_COLOR = (120, 120, 120)
+# If True, only the changed parts of the screen are redrawn and updated
+DIRTY_RECT_RENDERING = True
+# Number of rendered surfaces kept by each text widget
+TEXT_CACHE_SIZE = 8
 # If True, use less resources but cannot read several sounds at the same time
 LOW_AUDIO = True
+# If True, audio is played by PyAudio callbacks from a pre-filled buffer
+CALLBACK_AUDIO = True
+# Size of this buffer (in audio chunks)
+AUDIO_BUFFER_CHUNKS = 4
 
 # Update server address and login
 # FTP host
@@ -58,6 +66,20 @@ BACKGROUND_TRANSITION_DURATION = 3
 CASE_SIZE = 10
 # Gravity force for seeds falling effect
 GRAVITY_FORCE = 9.81
+# If True, levels are updated with fixed time steps (see FIXED_DELTA_TIME)
+FIXED_TIMESTEP = False
+# Duration of a fixed time step (in second)
+FIXED_DELTA_TIME = 1 / 60
+# Maximum number of fixed time steps run in one frame
+MAX_FIXED_STEPS = 5
+# If True, beans, leaves and seeds are moved by a vectorized NumPy backend
+# (only faster with thousands of them, see game.headless.check_physics)
+NUMPY_PHYSICS = False
+# If True, the inputs of each game are saved in a replay file (the level is
+# then updated with fixed time steps)
+RECORD_REPLAYS = False
+# Size of a level (in case) when running without display
+HEADLESS_LEVEL_SIZE = (34, 19.5)
 # Acceleration of the level speed each second
 SPEED_ACCELERATION = 0.01
 # Duration of each animated background
@@ -104,10 +126,23 @@ PYORO_NOTCH_DURATION = 0.01
 PYORO_SHOOT_SPRITE_DURATION = 0.1
 # Pyoro speed (in case per second)
 PYORO_SPEED = 25
+# Mean speed of a walking Pyoro, stopped half of the time by its notches
+# (in case per second)
+PYOBOT_SPEED = 12.5
 
 # Seed speed (in case per second)
 SEED_SPEED = 45
 
+# Bot planning (see game.planner)
+# If True, the bots choose their moves by simulating the level ahead
+PLANNING_BOT = False
+# CPU time given to the bot planning at each level update (in second)
+PLANNER_BUDGET = 0.004
+# Simulated duration of each move evaluated by the planning (in second)
+PLANNER_HORIZON = 3
+# Number of beans (the lowest ones) which can be chosen as targets
+PLANNER_TARGETS = 6
+
 # Duration of each smoke sprite (in second)
 SMOKE_SPRITE_DURATION = 0.2
 
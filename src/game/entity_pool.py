@@ -0,0 +1,141 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide a class to reuse removed entities instead of creating new ones.
+
+Created on 17/10/2026
+"""
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+
+class EntityPool:
+    """
+    Keep the removed entities of a level by type to reuse them. A pooled
+    entity type must have a reset method taking the same arguments as its
+    constructor (except the level).
+    """
+
+    def __init__(self, level):
+        """
+        Initialize an EntityPool object.
+
+        :type level: game.level.Level
+        :param level: The level managing the entities.
+        """
+
+        self.level = level
+        self.free_entities = {}
+        self.used_counts = {}
+        self.high_water_marks = {}
+
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, entity_type, *args):
+        """
+        Get an entity of the given type. A removed entity is reset and reused
+        if there is one, otherwise a new entity is created.
+
+        :type entity_type: type
+        :param entity_type: The class of the entity.
+
+        :type *args: object
+        :param *args: The arguments of the entity constructor (except the
+            level).
+
+        :rtype: entities.entity.Entity
+        :returns: An entity ready to be added to the level.
+        """
+
+        free_entities = self.free_entities.setdefault(entity_type, [])
+        if free_entities:
+            entity = free_entities.pop()
+            entity.reset(*args)
+            self.reused += 1
+        else:
+            entity = entity_type(self.level, *args)
+            self.created += 1
+
+        used_count = self.used_counts.get(entity_type, 0) + 1
+        self.used_counts[entity_type] = used_count
+        if used_count > self.high_water_marks.get(entity_type, 0):
+            self.high_water_marks[entity_type] = used_count
+        return entity
+
+    def release(self, entity):
+        """
+        Keep a removed entity to reuse it later. Entities which have not been
+        acquired from the pool are ignored.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity which has just been removed from the level.
+        """
+
+        entity_type = type(entity)
+        if self.used_counts.get(entity_type):
+            self.used_counts[entity_type] -= 1
+            self.free_entities[entity_type].append(entity)
+
+    def restore(self, entities, removed_entities):
+        """
+        Update the pool after the entities of the level have been replaced
+        (see game.snapshot). The removed entities of pooled types are kept
+        to be reused, without keeping more free entities of a type than its
+        high water mark.
+
+        :type entities: list<entities.entity.Entity>
+        :param entities: The entities of the level.
+
+        :type removed_entities: list<entities.entity.Entity>
+        :param removed_entities: The entities which are no longer in the
+            level.
+        """
+
+        for entity in removed_entities:
+            free_entities = self.free_entities.get(type(entity))
+            if free_entities is not None \
+                    and len(free_entities) < self.high_water_marks[type(entity)]:
+                free_entities.append(entity)
+        for entity_type in self.used_counts:
+            self.used_counts[entity_type] = 0
+        for entity in entities:
+            if type(entity) in self.used_counts:
+                self.used_counts[type(entity)] += 1
+
+    def get_stats(self):
+        """
+        Get the pool counters.
+
+        :rtype: dict
+        :returns: A dictionary with the number of "created" and "reused"
+            entities, the number of "free" entities and the "high water marks"
+            (the maximum number of entities used at the same time by type
+            name).
+        """
+
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "free": sum(len(entities) for entities in self.free_entities.values()),
+            "high water marks": {
+                entity_type.__name__: count
+                for entity_type, count in self.high_water_marks.items()
+            },
+        }
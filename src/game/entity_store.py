@@ -0,0 +1,247 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide a container for the entities of a level with constant time
+removal.
+
+Created on 17/10/2026
+"""
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+
+class EntityStore:
+    """
+    Store entities in slots. Removing an entity only empties its slot, and
+    empty slots are dropped by EntityStore.compact (once per level step).
+    Iterating is safe while entities are added or removed: removed entities
+    are skipped and added entities are reached in the same iteration.
+
+    Each added entity gets a new handle (entity.handle) which is never
+    reused, so a handle kept on an entity which has been removed (and maybe
+    reused by the entity pool) gives None.
+
+    The entities which aren't falling bodies (see Entity.is_body) are also
+    kept in their own slots, so they can be updated without going through
+    the bodies (see EntityStore.iter_others).
+    """
+
+    def __init__(self):
+        """
+        Initialize an EntityStore object.
+        """
+
+        self.slots = []
+        self.other_slots = []
+        self.handles = {}
+        self.last_handle = 0
+        self.nb_removed = 0
+        self.others_sorted = True
+
+    def __iter__(self):
+        """
+        Iterate over the entities in insertion order.
+
+        :rtype: generator
+        :returns: A generator of entities.entity.Entity.
+        """
+
+        slots = self.slots
+        i = 0
+        while i < len(slots):
+            entity = slots[i]
+            if entity is not None:
+                yield entity
+            i += 1
+
+    def iter_others(self):
+        """
+        Iterate over the entities which aren't falling bodies in insertion
+        order. An entity which stops being a body during a step (see
+        EntityStore.update_body) is reached last in this step.
+
+        :rtype: generator
+        :returns: A generator of entities.entity.Entity.
+        """
+
+        slots = self.other_slots
+        i = 0
+        while i < len(slots):
+            entity = slots[i]
+            if entity is not None:
+                yield entity
+            i += 1
+
+    def __len__(self):
+        """
+        Get the number of entities.
+
+        :rtype: int
+        :returns: The number of entities in the store.
+        """
+
+        return len(self.slots) - self.nb_removed
+
+    def __contains__(self, entity):
+        """
+        Check if an entity is in the store.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity to look for.
+
+        :rtype: bool
+        :returns: True if the entity has been added and not removed.
+        """
+
+        return self.handles.get(getattr(entity, "handle", None)) is entity
+
+    def add(self, entity):
+        """
+        Add an entity and give it a new handle.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity to add.
+
+        :rtype: int
+        :returns: The handle of the entity.
+        """
+
+        self.last_handle += 1
+        entity.handle = self.last_handle
+        entity.slot = len(self.slots)
+        self.slots.append(entity)
+        self.handles[entity.handle] = entity
+        self.add_other(entity)
+        return entity.handle
+
+    def add_other(self, entity):
+        """
+        Give an other slot to an entity if it isn't a body.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity to index.
+        """
+
+        if entity.is_body():
+            entity.other_slot = None
+        else:
+            entity.other_slot = len(self.other_slots)
+            self.other_slots.append(entity)
+
+    def update_body(self, entity):
+        """
+        Index an entity which is no longer a falling body (e.g. a caught
+        bean). The other entities keep their insertion order from the next
+        compaction.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity which has changed.
+        """
+
+        if entity in self and entity.other_slot is None:
+            self.add_other(entity)
+            self.others_sorted = False
+
+    def remove(self, entity):
+        """
+        Remove an entity by emptying its slot.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity to remove.
+
+        :rtype: bool
+        :returns: True if the entity has been removed, False if it wasn't
+            in the store.
+        """
+
+        if entity not in self:
+            return False
+        del self.handles[entity.handle]
+        self.slots[entity.slot] = None
+        if entity.other_slot is not None:
+            self.other_slots[entity.other_slot] = None
+        self.nb_removed += 1
+        return True
+
+    def get(self, handle):
+        """
+        Get an entity by handle.
+
+        :type handle: int
+        :param handle: The handle of the entity.
+
+        :rtype: entities.entity.Entity
+        :returns: The entity or None if it has been removed.
+        """
+
+        return self.handles.get(handle)
+
+    def compact(self):
+        """
+        Drop the empty slots. It mustn't be called while iterating.
+        """
+
+        if self.nb_removed:
+            self.slots = [entity for entity in self.slots if entity is not None]
+            for slot, entity in enumerate(self.slots):
+                entity.slot = slot
+        if self.nb_removed or not self.others_sorted:
+            self.other_slots = [
+                entity for entity in self.other_slots if entity is not None
+            ]
+            if not self.others_sorted:
+                self.other_slots.sort(key=lambda entity: entity.handle)
+            for other_slot, entity in enumerate(self.other_slots):
+                entity.other_slot = other_slot
+        self.nb_removed = 0
+        self.others_sorted = True
+
+    def clear(self):
+        """
+        Remove all entities.
+        """
+
+        self.slots.clear()
+        self.other_slots.clear()
+        self.handles.clear()
+        self.nb_removed = 0
+        self.others_sorted = True
+
+    def restore(self, entities, last_handle):
+        """
+        Replace the content of the store by entities which already have a
+        handle (see game.snapshot).
+
+        :type entities: list<entities.entity.Entity>
+        :param entities: The entities in iteration order.
+
+        :type last_handle: int
+        :param last_handle: The last handle given by the store.
+        """
+
+        self.slots = list(entities)
+        self.other_slots = []
+        self.handles = {}
+        for slot, entity in enumerate(self.slots):
+            entity.slot = slot
+            self.handles[entity.handle] = entity
+            self.add_other(entity)
+        self.nb_removed = 0
+        self.others_sorted = True
+        self.last_handle = last_handle
@@ -0,0 +1,217 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide the events published by a level and a bus to subscribe to them.
+
+Created on 17/10/2026
+"""
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+
+class Event:
+    """
+    Base class of all level events. Subscribing to Event gives every event.
+    """
+
+
+class ScoreChangedEvent(Event):
+    """
+    Published when the score of the level changes.
+    """
+
+    def __init__(self, previous_score, score):
+        """
+        Initialize a ScoreChangedEvent object.
+
+        :type previous_score: int
+        :param previous_score: The score before the change.
+
+        :type score: int
+        :param score: The new score.
+        """
+
+        self.previous_score = previous_score
+        self.score = score
+
+
+class ScoreCrossedEvent(Event):
+    """
+    Published when the score reaches a threshold (see
+    game.level_state.LevelState.add_score_threshold).
+    """
+
+    def __init__(self, threshold, score):
+        """
+        Initialize a ScoreCrossedEvent object.
+
+        :type threshold: int
+        :param threshold: The threshold which has been reached.
+
+        :type score: int
+        :param score: The new score.
+        """
+
+        self.threshold = threshold
+        self.score = score
+
+
+class StyleChangedEvent(Event):
+    """
+    Published when the style of the level changes (see
+    game.level.Level.get_style_type_with_score).
+    """
+
+    def __init__(self, previous_style_type, style_type):
+        """
+        Initialize a StyleChangedEvent object.
+
+        :type previous_style_type: int
+        :param previous_style_type: The style before the change.
+
+        :type style_type: int
+        :param style_type: The new style.
+        """
+
+        self.previous_style_type = previous_style_type
+        self.style_type = style_type
+
+
+class BackgroundChangedEvent(Event):
+    """
+    Published when the background of the level changes (see
+    game.level.Level.get_background_id_with_score).
+    """
+
+    def __init__(self, previous_background_id, background_id):
+        """
+        Initialize a BackgroundChangedEvent object.
+
+        :type previous_background_id: int
+        :param previous_background_id: The background before the change.
+
+        :type background_id: int
+        :param background_id: The new background.
+        """
+
+        self.previous_background_id = previous_background_id
+        self.background_id = background_id
+
+
+class PyoroDiedEvent(Event):
+    """
+    Published when Pyoro (or a mortal bot) is killed.
+    """
+
+    def __init__(self, pyoro):
+        """
+        Initialize a PyoroDiedEvent object.
+
+        :type pyoro: entities.pyoro.Pyoro
+        :param pyoro: The killed Pyoro.
+        """
+
+        self.pyoro = pyoro
+
+
+class CaseDestroyedEvent(Event):
+    """
+    Published when a block is destroyed.
+    """
+
+    def __init__(self, pos):
+        """
+        Initialize a CaseDestroyedEvent object.
+
+        :type pos: int
+        :param pos: The position of the block (see game.level.Level.cases).
+        """
+
+        self.pos = pos
+
+
+class CaseRepairedEvent(Event):
+    """
+    Published when a destroyed block is repaired.
+    """
+
+    def __init__(self, pos):
+        """
+        Initialize a CaseRepairedEvent object.
+
+        :type pos: int
+        :param pos: The position of the block (see game.level.Level.cases).
+        """
+
+        self.pos = pos
+
+
+class EventBus:
+    """
+    Call the listeners subscribed to a type of event each time an event of
+    this type (or of a subclass) is published.
+    """
+
+    def __init__(self):
+        """
+        Initialize an EventBus object.
+        """
+
+        self.listeners = {}
+
+    def subscribe(self, event_type, listener):
+        """
+        Call a function for each published event of a type.
+
+        :type event_type: type
+        :param event_type: A subclass of game.events.Event.
+
+        :type listener: function or method
+        :param listener: A function called with the event.
+        """
+
+        self.listeners.setdefault(event_type, []).append(listener)
+
+    def unsubscribe(self, event_type, listener):
+        """
+        Stop calling a function subscribed with EventBus.subscribe.
+
+        :type event_type: type
+        :param event_type: The type of event given to EventBus.subscribe.
+
+        :type listener: function or method
+        :param listener: The function to remove.
+        """
+
+        listeners = self.listeners.get(event_type, [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def publish(self, event):
+        """
+        Call the listeners of the event type and of its base classes.
+
+        :type event: game.events.Event
+        :param event: The event to give to the listeners.
+        """
+
+        for event_type in type(event).__mro__:
+            for listener in tuple(self.listeners.get(event_type, ())):
+                listener(event)
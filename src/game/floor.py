@@ -0,0 +1,221 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide a bitset representation of the level floor to find holes quickly.
+
+Created on 17/10/2026
+"""
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.events import CaseDestroyedEvent, CaseRepairedEvent
+
+
+def iter_bits(mask):
+    """
+    Iterate over the indexes of the set bits of an integer.
+
+    :type mask: int
+    :param mask: A positive integer used as a bitset.
+
+    :rtype: generator
+    :returns: A generator of int in increasing order.
+    """
+
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+class Floor:
+    """
+    Store the state of all the cases of a level in two bitsets: bit i of
+    holes is set if case i is destroyed and bit i of repairs is set if an
+    angel is repairing case i. Finding the nearest hole only needs a few
+    integer operations whatever the number of cases.
+
+    The version counter is incremented each time a case changes, so the
+    floor can be compared between two frames without reading every case.
+    """
+
+    def __init__(self, nb_cases, events=None):
+        """
+        Initialize a Floor object.
+
+        :type nb_cases: int
+        :param nb_cases: The number of cases.
+
+        :type events: game.events.EventBus
+        :param events: (Optional) The bus where destroyed and repaired cases
+            are published. Default is None (nothing is published).
+        """
+
+        self.nb_cases = nb_cases
+        self.holes = 0
+        self.repairs = 0
+        self.version = 0
+        self.events = events
+
+    def reset(self, nb_cases):
+        """
+        Make all the cases exist again.
+
+        :type nb_cases: int
+        :param nb_cases: The new number of cases.
+        """
+
+        self.nb_cases = nb_cases
+        self.holes = 0
+        self.repairs = 0
+        self.version += 1
+
+    def set_exists(self, pos, exists):
+        """
+        Destroy or repair a case.
+
+        :type pos: int
+        :param pos: The index of the case.
+
+        :type exists: bool
+        :param exists: False if the case is destroyed.
+        """
+
+        holes = self.holes & ~(1 << pos) if exists else self.holes | (1 << pos)
+        if holes != self.holes:
+            self.holes = holes
+            self.version += 1
+            if self.events is not None:
+                self.events.publish(
+                    CaseRepairedEvent(pos) if exists else CaseDestroyedEvent(pos)
+                )
+
+    def set_repairing(self, pos, is_repairing):
+        """
+        Define if a case is being repaired.
+
+        :type pos: int
+        :param pos: The index of the case.
+
+        :type is_repairing: bool
+        :param is_repairing: True if an angel is repairing the case.
+        """
+
+        if is_repairing:
+            self.repairs |= 1 << pos
+        else:
+            self.repairs &= ~(1 << pos)
+
+    def exists(self, pos):
+        """
+        Check if a case exists.
+
+        :type pos: int
+        :param pos: The index of the case.
+
+        :rtype: bool
+        :returns: False if the case is destroyed.
+        """
+
+        return not self.holes >> pos & 1
+
+    def get_nb_holes(self):
+        """
+        Count the destroyed cases.
+
+        :rtype: int
+        :returns: The number of holes in the floor.
+        """
+
+        return bin(self.holes).count("1")
+
+    def is_repairing(self, pos):
+        """
+        Check if a case is being repaired.
+
+        :type pos: int
+        :param pos: The index of the case.
+
+        :rtype: bool
+        :returns: True if an angel is repairing the case.
+        """
+
+        return bool(self.repairs >> pos & 1)
+
+    def get_next_hole_right(self, pos):
+        """
+        Find the leftmost destroyed case at pos or on its right.
+
+        :type pos: int
+        :param pos: The index of the first case to check.
+
+        :rtype: int, None
+        :returns: The index of the hole or None if there is no hole.
+        """
+
+        holes = self.holes >> max(pos, 0)
+        if not holes:
+            return None
+        return max(pos, 0) + (holes & -holes).bit_length() - 1
+
+    def get_next_hole_left(self, pos):
+        """
+        Find the rightmost destroyed case at pos or on its left.
+
+        :type pos: int
+        :param pos: The index of the first case to check.
+
+        :rtype: int, None
+        :returns: The index of the hole or None if there is no hole.
+        """
+
+        if pos < 0:
+            return None
+        holes = self.holes & ((1 << (pos + 1)) - 1)
+        return holes.bit_length() - 1 if holes else None
+
+    def get_void_positions(self, max_count=None):
+        """
+        Get the destroyed cases which are not being repaired.
+
+        :type max_count: int
+        :param max_count: (Optional) The maximum number of cases to give.
+            Default is None (no limit).
+
+        :rtype: list<int>
+        :returns: The indexes of the cases from left to right.
+        """
+
+        positions = []
+        for pos in iter_bits(self.holes & ~self.repairs):
+            if len(positions) == max_count:
+                break
+            positions.append(pos)
+        return positions
+
+    def get_block_positions(self):
+        """
+        Get the cases which are not destroyed.
+
+        :rtype: generator
+        :returns: A generator of case indexes from left to right.
+        """
+
+        return iter_bits(~self.holes & ((1 << self.nb_cases) - 1))
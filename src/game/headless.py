@@ -0,0 +1,510 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide classes to run a game.level.Level without any display or audio
+device (no pygame window, no PyAudio stream).
+
+Created on 17/10/2026
+"""
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import FPS, HEADLESS_LEVEL_SIZE
+from game.level import Level
+from game.replay import ReplayPlayer, ReplayReader
+
+
+class NullImage:
+    """
+    Replace a pygame surface when nothing has to be drawn.
+    """
+
+    def __init__(self):
+        """
+        Initialize a NullImage object.
+        """
+
+        self.alpha = 255
+
+    def set_alpha(self, alpha):
+        """
+        Store the opacity of the image.
+
+        :type alpha: float
+        :param alpha: The new opacity of the image.
+        """
+
+        self.alpha = alpha
+
+    def get_alpha(self):
+        """
+        Get the opacity of the image.
+
+        :rtype: float
+        :returns: The opacity of the image.
+        """
+
+        return self.alpha
+
+
+class NullImages(dict):
+    """
+    An image dictionary returning a NullImage for any image name.
+    """
+
+    def __missing__(self, image_name):
+        """
+        Create a NullImage for an image name used for the first time.
+
+        :type image_name: str
+        :param image_name: The name of the image.
+
+        :rtype: game.headless.NullImage
+        :returns: The image associated to this name.
+        """
+
+        image = self[image_name] = NullImage()
+        return image
+
+
+class NullSound:
+    """
+    Replace an audio.sound.Sound when nothing has to be played.
+    """
+
+    def __init__(self, file_path=""):
+        """
+        Initialize a NullSound object.
+
+        :type file_path: str
+        :param file_path: (Optional) The path of the replaced sound file.
+        """
+
+        self.file_path = file_path
+        self.is_loaded = True
+        self.is_playing = False
+        self.pos = 0
+        self.loop = 1
+        self.volume = 1
+
+    def play(self, loop=None):
+        """
+        Mark the sound as playing.
+
+        :type loop: int
+        :param loop: The number of times to play the sound.
+        """
+
+        self.loop = loop if loop else self.loop
+        self.is_playing = True
+
+    def pause(self):
+        """
+        Mark the sound as paused.
+        """
+
+        self.is_playing = False
+
+    def stop(self):
+        """
+        Mark the sound as stopped.
+        """
+
+        self.is_playing = False
+        self.loop = 1
+
+    def set_pos(self, pos):
+        """
+        Set the playhead position.
+
+        :type pos: int
+        :param pos: The new position of the playback.
+        """
+
+        self.pos = pos
+
+
+class NullAudioPlayer:
+    """
+    Replace an audio.audio_player.AudioPlayer by giving NullSound objects.
+    """
+
+    def __init__(self):
+        """
+        Initialize a NullAudioPlayer object.
+        """
+
+        self.speed = 1
+        self.sound_volume = 1
+        self.music_volume = 1
+
+    def get_sound(self, sound_path):
+        """
+        Get a new NullSound.
+
+        :type sound_path: str
+        :param sound_path: The path of the sound file.
+
+        :rtype: game.headless.NullSound
+        :returns: A sound playing nothing.
+        """
+
+        return NullSound(sound_path)
+
+    def get_music(self, music_path):
+        """
+        Get a new NullSound.
+
+        :type music_path: str
+        :param music_path: The path of the music file.
+
+        :rtype: game.headless.NullSound
+        :returns: A sound playing nothing.
+        """
+
+        return NullSound(music_path)
+
+    def remove_sound(self, sound):
+        """
+        Do nothing as NullSound objects are not referenced.
+
+        :type sound: game.headless.NullSound
+        :param sound: The sound to remove.
+        """
+
+    def stop_audio(self):
+        """
+        Do nothing as no sound is really played.
+        """
+
+    def set_speed(self, speed):
+        """
+        Set the reading speed of the audio player.
+
+        :type speed: float
+        :param speed: The speed of the audio player.
+        """
+
+        self.speed = speed
+
+    def get_speed(self):
+        """
+        Get the current reading speed of the audio player.
+
+        :rtype: float
+        :returns: The current speed of the audio player.
+        """
+
+        return self.speed
+
+
+class HeadlessActivity:
+    """
+    Replace a gui.level_activity.LevelActivity to be notified of the end of
+    a headless game.
+    """
+
+    def __init__(self, level_drawer):
+        """
+        Initialize a HeadlessActivity object.
+
+        :type level_drawer: game.headless.HeadlessLevelDrawer
+        :param level_drawer: The level drawer owning this activity.
+        """
+
+        self.level_drawer = level_drawer
+        self.is_game_over = False
+
+    def game_over(self):
+        """
+        Stop updating the level when Pyoro is dead.
+        """
+
+        self.is_game_over = True
+        self.level_drawer.level.loop_active = False
+
+
+class HeadlessLevelDrawer:
+    """
+    Replace a gui.level_drawer.LevelDrawer to run a level without display
+    nor audio. Entities get NullImages and NullSound objects.
+    """
+
+    def __init__(self, game_id=0, bot_mode=False, size=None, seed=None,
+                 mortal_bot=False, numpy_physics=None):
+        """
+        Initialize a new HeadlessLevelDrawer object and create a new level.
+
+        :type game_id: int
+        :param game_id: (Optional) An integer representing Pyoro 1 or 2
+                (0=Pyoro, 1=Pyoro 2). Default is 0.
+
+        :type bot_mode: bool
+        :param bot_mode: (Optional) Define if Pyoro have to be replaced by
+                Pyobot. Default is False.
+
+        :type size: tuple
+        :param size: (Optional) The (width, height) size of the level (in
+                case). Default is game.config.HEADLESS_LEVEL_SIZE.
+
+        :type seed: int
+        :param seed: (Optional) The seed of the level random generator (see
+                game.level.Level). Default is None.
+
+        :type mortal_bot: bool
+        :param mortal_bot: (Optional) If True, the game is over when the bot
+                is killed instead of restarting the level. Default is False.
+
+        :type numpy_physics: bool
+        :param numpy_physics: (Optional) See game.level.Level. Default is
+                game.config.NUMPY_PHYSICS.
+        """
+
+        self.activity = HeadlessActivity(self)
+        self.audio_player = NullAudioPlayer()
+        self.case_size = (1, 1)
+        self.level = None
+        self.level = Level(self, game_id, size or HEADLESS_LEVEL_SIZE, bot_mode,
+                           seed, numpy_physics=numpy_physics,
+                           mortal_bot=mortal_bot)
+
+    def get_case_size(self):
+        """
+        Return the size of one case (there is no pixel in headless mode).
+
+        :rtype: tuple
+        :returns: A (1, 1) tuple.
+        """
+
+        return self.case_size
+
+    def get_entity_images(self, folder_name, size, alpha_channel=True):
+        """
+        Get a new image dictionary for an entity without loading anything.
+
+        :type folder_name: str
+        :param folder_name: The name of the entity image folder (unused).
+
+        :type size: list<float>
+        :param size: The (width, height) size of the entity (unused).
+
+        :type alpha_channel: bool
+        :param alpha_channel: (Optional) Unused.
+
+        :rtype: game.headless.NullImages
+        :returns: An image dictionary giving NullImage objects.
+        """
+
+        return NullImages()
+
+    def get_entity_sprites(self, images, sprite_table):
+        """
+        Get the sprites of an entity without compiling anything.
+
+        :type images: game.headless.NullImages
+        :param images: The images of the entity.
+
+        :type sprite_table: game.animation.SpriteTable
+        :param sprite_table: The image names of the entity sprites (unused).
+
+        :rtype: game.headless.NullImages
+        :returns: The images themselves, giving a NullImage for any sprite
+            id.
+        """
+
+        return images
+
+    def get_audio_player(self):
+        """
+        Get the audio player used by the entities of the level.
+
+        :rtype: game.headless.NullAudioPlayer
+        :returns: An audio player playing nothing.
+        """
+
+        return self.audio_player
+
+    def is_game_over(self):
+        """
+        Check if Pyoro is dead and the game over has been triggered.
+
+        :rtype: bool
+        :returns: True if the game is over, otherwise False.
+        """
+
+        return self.activity.is_game_over
+
+    def update_background_transition(self, opacity):
+        """
+        Do nothing (there is no background to draw). It allows to restore
+        the snapshot of a displayed level (see game.snapshot).
+
+        :type opacity: float
+        :param opacity: The opacity of the next background (unused).
+        """
+
+    def update(self, delta_time):
+        """
+        Update the level.
+
+        :type delta_time: float
+        :param delta_time: Time elapsed since the last update.
+        """
+
+        self.level.update(delta_time)
+
+
+def run_headless(game_id=0, bot_mode=True, duration=60, delta_time=None,
+                 seed=None):
+    """
+    Run a headless level until the game is over or the simulated duration is
+    reached.
+
+    :type game_id: int
+    :param game_id: (Optional) 0 for Pyoro, 1 for Pyoro 2. Default is 0.
+
+    :type bot_mode: bool
+    :param bot_mode: (Optional) If True, Pyoro will be a bot.
+        Default is True.
+
+    :type duration: float
+    :param duration: (Optional) The maximum simulated time (in seconds).
+        Default is 60.
+
+    :type delta_time: float
+    :param delta_time: (Optional) The time step of each update (in seconds).
+        Default is 1 / game.config.FPS.
+
+    :type seed: int
+    :param seed: (Optional) The seed of the level random generator. Two runs
+        with the same seed give the same results. Default is None.
+
+    :rtype: dict
+    :returns: A dictionary with the final "score", the simulated "time", the
+        number of "frames" and the "seed" of the level.
+    """
+
+    delta_time = delta_time or 1 / FPS
+    level_drawer = HeadlessLevelDrawer(game_id, bot_mode, seed=seed)
+    frames = 0
+    while frames * delta_time < duration and not level_drawer.is_game_over():
+        level_drawer.update(delta_time)
+        frames += 1
+    return {
+        "score": level_drawer.level.score,
+        "time": frames * delta_time,
+        "frames": frames,
+        "seed": level_drawer.level.seed,
+    }
+
+
+def run_replay(replay_path):
+    """
+    Play a replay file as fast as possible without display nor audio.
+
+    :type replay_path: str
+    :param replay_path: The path of the replay file (see game.replay).
+
+    :rtype: dict
+    :returns: A dictionary with the final "score", the simulated "time", the
+        number of "frames" and the "seed" of the level.
+    """
+
+    replay_reader = ReplayReader(replay_path)
+    level_drawer = HeadlessLevelDrawer(
+        replay_reader.game_id, size=replay_reader.level_size, seed=replay_reader.seed
+    )
+    frames = ReplayPlayer(level_drawer.level, replay_reader).run()
+    return {
+        "score": level_drawer.level.score,
+        "time": frames * replay_reader.step_time,
+        "frames": frames,
+        "seed": replay_reader.seed,
+    }
+
+
+def get_level_state(level):
+    """
+    Get the state of a level compared by check_physics.
+
+    :type level: game.level.Level
+    :param level: The level.
+
+    :rtype: tuple
+    :returns: The score, the floor, the state of Pyoro and the type and
+        position of each entity in insertion order.
+    """
+
+    return (
+        level.score,
+        level.floor.holes,
+        level.pyoro.dead,
+        [
+            (type(entity).__name__, float(entity.pos[0]), float(entity.pos[1]))
+            for entity in level.entities
+        ],
+    )
+
+
+def check_physics(game_id=0, seeds=range(5), duration=300, delta_time=None):
+    """
+    Play the same bot games with and without the NumPy physics backend (see
+    game.physics) and compare both levels after each update. They must
+    stay identical.
+
+    :type game_id: int
+    :param game_id: (Optional) 0 for Pyoro, 1 for Pyoro 2. Default is 0.
+
+    :type seeds: Iterable<int>
+    :param seeds: (Optional) The seeds of the games. Default is 0 to 4.
+
+    :type duration: float
+    :param duration: (Optional) The maximum simulated time of a game (in
+        seconds). Default is 300.
+
+    :type delta_time: float
+    :param delta_time: (Optional) The time step of each update (in seconds).
+        Default is 1 / game.config.FPS.
+
+    :rtype: dict
+    :returns: A {seed: frame} dictionary giving the first frame where the
+        levels differ (None if they never differ).
+    """
+
+    delta_time = delta_time or 1 / FPS
+    mismatches = {}
+    for seed in seeds:
+        level_drawers = [
+            HeadlessLevelDrawer(
+                game_id, True, seed=seed, mortal_bot=True, numpy_physics=numpy_physics
+            )
+            for numpy_physics in (False, True)
+        ]
+        mismatches[seed] = None
+        frames = 0
+        while frames * delta_time < duration \
+                and not level_drawers[0].is_game_over():
+            for level_drawer in level_drawers:
+                level_drawer.update(delta_time)
+            frames += 1
+            states = [get_level_state(drawer.level) for drawer in level_drawers]
+            if states[0] != states[1]:
+                mismatches[seed] = frames
+                break
+    return mismatches
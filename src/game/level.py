@@ -36,14 +36,23 @@ from entities.pyobot_2 import Pyobot2
 from entities.pyoro import Pyoro
 from entities.pyoro_2 import Pyoro2
 from entities.score_text import ScoreText
+from entities.seed import Seed
 from entities.smoke import Smoke
 from entities.super_bean import SuperBean
 
-from game.action_delay import ActionDelay
+from game.action_scheduler import ActionScheduler
+from game.bean_index import BeanIndex
 from game.case import Case
+from game.entity_pool import EntityPool
+from game.entity_store import EntityStore
+from game.events import EventBus
+from game.floor import Floor
+from game.level_state import LevelState, get_background_id, get_style_type
+from game.physics import PhysicsBackend
+from game.snapshot import restore_snapshot, take_snapshot
+from game.spatial_index import SpatialIndex
 from game.config import BEAN_FREQUENCY, SPEED_ACCELERATION, \
-    BACKGROUND_ANIMATED_DURATION
-from game.util import Game
+    FIXED_DELTA_TIME, FIXED_TIMESTEP, MAX_FIXED_STEPS, NUMPY_PHYSICS
 
 
 class Level:
@@ -51,12 +60,15 @@ class Level:
     Central class that manages the entities, terrain and more.
     """
 
-    def __init__(self, level_drawer, game_id, size, bot_mode=False):
+    def __init__(self, level_drawer, game_id, size, bot_mode=False, seed=None,
+                 fixed_step=None, numpy_physics=None, mortal_bot=False):
         """
         Initialize a new Level object.
 
         :type level_drawer: gui.level_drawer.Level_drawer
-        :param activity: The graphical representation of this level.
+        :param activity: The graphical representation of this level. It can
+            also be a game.headless.HeadlessLevelDrawer to run the level
+            without any display or audio.
 
         :type game_id: int
         :param game_id: It can be 0 for Pyoro, or 1 for Pyoro 2.
@@ -68,23 +80,66 @@ class Level:
         :type bot_mode: bool
         :param bot_mode: Optional. If True, Pyoro will be a bot.
             Default is False.
+
+        :type seed: int
+        :param seed: Optional. The seed of the random generator of the level.
+            Two levels with the same seed and the same inputs give the same
+            game if they are updated with fixed steps. A random seed is chosen
+            if undefined.
+
+        :type fixed_step: bool
+        :param fixed_step: Optional. If True, the level is updated with steps
+            of FIXED_DELTA_TIME whatever the frame rate. Default is
+            game.config.FIXED_TIMESTEP.
+
+        :type numpy_physics: bool
+        :param numpy_physics: Optional. If True, beans, leaves and seeds are
+            moved by a game.physics.PhysicsBackend. Default is
+            game.config.NUMPY_PHYSICS.
+
+        :type mortal_bot: bool
+        :param mortal_bot: Optional. If True, a bot dies like Pyoro (the game
+            is over). Otherwise the level is reset when the bot is killed.
+            Default is False.
         """
 
         self.level_drawer = level_drawer
         self.game_id = game_id
         self.size = size
         self.bot_mode = bot_mode
+        self.mortal_bot = mortal_bot
+
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.random = random.Random(self.seed)
+        self.fixed_step = FIXED_TIMESTEP if fixed_step is None else fixed_step
+        self.accumulator = 0
+        self.tick = 0
 
         self.loop_active = True
         self.pyoro = None
+        # Object controlling the bot instead of its own heuristic (see
+        # game.planner.Planner)
+        self.bot_controller = None
 
         self.score = 0
         self.speed = 1
+        self.nb_spawned_beans = 0
         self.animated_background_id = 13
+        # Events published by the level (see game.events)
+        self.events = EventBus()
+        self.state = LevelState(self)
 
         self.cases = []
-        self.entities = []
-        self.action_delays = {}
+        self.floor = Floor(0, self.events)
+        self.entities = EntityStore()
+        self.entity_pool = EntityPool(self)
+        if numpy_physics is None:
+            numpy_physics = NUMPY_PHYSICS
+        self.physics = PhysicsBackend(self) if numpy_physics else None
+        self.spatial_index = SpatialIndex(self)
+        self.bean_index = BeanIndex(self)
+        self.action_scheduler = ActionScheduler()
+        self.action_delays = self.action_scheduler.action_delays
 
         self.init_cases(self.size[0])
         self.init_pyoro()
@@ -98,9 +153,10 @@ class Level:
         :param nb_cases: The number of blocks which will compose the floor.
         """
 
+        self.floor.reset(nb_cases)
         self.cases.clear()
         for i in range(nb_cases):
-            self.cases.append(Case(i))
+            self.cases.append(Case(i, self.floor))
 
     def init_pyoro(self):
         """
@@ -122,6 +178,7 @@ class Level:
         Restart the level:
             - score = 0
             - speed = 1
+            - spawned bean counter = 0
             - entities are killed
             - action delayed are stopped
             - terrain is recreated
@@ -129,28 +186,86 @@ class Level:
 
         self.score = 0
         self.speed = 1
-        for entity in self.entities:
+        self.nb_spawned_beans = 0
+        for entity in tuple(self.entities):
             entity.remove()
         self.entities.clear()
-        self.action_delays.clear()
+        self.spatial_index.invalidate()
+        self.bean_index.clear()
+        self.action_scheduler.clear()
+        self.state.update()
         self.init_cases(self.size[0])
         self.spawn_bean()
 
     def update(self, delta_time):
         """
-        Update the level, entities and action_delays.
+        Update the level, entities and action_delays. In fixed step mode,
+        elapsed time is accumulated and the level is updated by steps of
+        FIXED_DELTA_TIME (at most MAX_FIXED_STEPS per call).
 
         :type delta_time: float
         :param delta_time: Time elapsed since the last update.
         """
 
+        if self.fixed_step:
+            self.accumulator = min(
+                self.accumulator + delta_time, FIXED_DELTA_TIME * MAX_FIXED_STEPS
+            )
+            while self.accumulator >= FIXED_DELTA_TIME:
+                self.accumulator -= FIXED_DELTA_TIME
+                self.step(FIXED_DELTA_TIME)
+        else:
+            self.step(delta_time)
+
+    def step(self, delta_time):
+        """
+        Update the level, entities and action_delays once.
+
+        :type delta_time: float
+        :param delta_time: Time elapsed since the last step.
+        """
+
         if self.loop_active:
+            self.tick += 1
             self.speed += delta_time * SPEED_ACCELERATION
             self.pyoro.update(delta_time * self.speed)
-            for entity in self.entities:
+            # Falling bodies move before the other entities (e.g. the
+            # tongue) so both physics paths give the same game
+            if self.physics:
+                self.physics.update(delta_time * self.speed)
+            else:
+                for entity in self.entities:
+                    if entity.is_body():
+                        entity.update(delta_time * self.speed)
+            for entity in self.entities.iter_others():
                 entity.update(delta_time * self.speed)
-            for action_delay in dict(self.action_delays).values():
-                action_delay.update(delta_time * self.speed)
+            self.action_scheduler.update(delta_time * self.speed)
+            self.state.update()
+            self.entities.compact()
+            self.spatial_index.invalidate()
+            self.bean_index.invalidate()
+
+    def snapshot(self):
+        """
+        Save the whole state of the level (score, blocks, entities, action
+        delays, random generator, ...). See game.snapshot.
+
+        :rtype: bytes
+        :returns: A snapshot to give to Level.restore.
+        """
+
+        return take_snapshot(self)
+
+    def restore(self, snapshot):
+        """
+        Go back to a state saved with Level.snapshot. The level must have the
+        same game_id and size.
+
+        :type snapshot: bytes
+        :param snapshot: The snapshot of the level.
+        """
+
+        restore_snapshot(self, snapshot)
 
     def update_animated_background(self):
         """
@@ -167,9 +282,9 @@ class Level:
         Randomly spawn a new bean. Bean type is also random.
         """
 
-        bean_type_id = random.randint(0, 5)
-        pos = (random.randint(0, self.size[0] - 1) + 0.75, 0)
-        speed = random.uniform(0.5, 1.5) * (self.speed ** 0.6)
+        bean_type_id = self.random.randint(0, 5)
+        pos = (self.random.randint(0, self.size[0] - 1) + 0.75, 0)
+        speed = self.random.uniform(0.5, 1.5) * (self.speed ** 0.6)
 
         if bean_type_id < 4:
             bean = Bean(self, pos, speed)
@@ -178,10 +293,11 @@ class Level:
         else:
             bean = SuperBean(self, pos, speed)
 
-        self.entities.append(bean)
+        self.add_entity(bean)
+        self.nb_spawned_beans += 1
         self.set_action_delay((self, "spawn_bean"),
                               BEAN_FREQUENCY
-                              * random.uniform(0.5, 1.5)
+                              * self.random.uniform(0.5, 1.5)
                               / (self.speed ** 1.5),
                               self.spawn_bean
                               )
@@ -195,7 +311,7 @@ class Level:
         """
 
         if not case.exists and not case.is_repairing:
-            self.entities.append(Angel(self, case))
+            self.add_entity(Angel(self, case))
 
     def spawn_score(self, score, pos):
         """
@@ -212,7 +328,7 @@ class Level:
         allowed = (10, 50, 100, 300, 1000)
         if score in allowed:
             self.score += score
-            self.entities.append(ScoreText(self, pos, score))
+            self.add_entity(self.entity_pool.acquire(ScoreText, pos, score))
         else:
             print(f"[WARNING] [Level.addScore] {score} is an invalid "
                   + f"value ! Allowed are {allowed}")
@@ -224,7 +340,7 @@ class Level:
         :type pos: Iterable<float>
         :param pos: The position of the smoke.
         """
-        self.entities.append(Smoke(self, pos))
+        self.add_entity(self.entity_pool.acquire(Smoke, pos))
 
     def spawn_leaf(self, pos, leaf_type):
         """
@@ -238,8 +354,8 @@ class Level:
             "", "pink" or "super".
         """
 
-        speed = random.uniform(0.5, 1.5)
-        self.entities.append(Leaf(self, pos, speed, leaf_type))
+        speed = self.random.uniform(0.5, 1.5)
+        self.add_entity(self.entity_pool.acquire(Leaf, pos, speed, leaf_type))
 
     def spawn_leaf_piece(self, pos, speed, leaf_piece_type, vel):
         """
@@ -258,8 +374,20 @@ class Level:
         :type vel: float
         :param vel: The default horizontal velocity.
         """
-        self.entities.append(LeafPiece(
-            self, pos, speed, leaf_piece_type, vel))
+        self.add_entity(self.entity_pool.acquire(
+            LeafPiece, pos, speed, leaf_piece_type, vel))
+
+    def spawn_seed(self, angle, direction):
+        """
+        Spawn a seed shot by Pyoro 2.
+
+        :type angle: float
+        :param angle: The initial trajectory's angle in degree.
+
+        :type direction: int
+        :param direction: The direction of the seed (1=right, -1=left).
+        """
+        self.add_entity(self.entity_pool.acquire(Seed, angle, direction))
 
     def repair_case(self, case=None):
         """
@@ -272,13 +400,14 @@ class Level:
 
         void_cases = self.get_void_cases()
         if void_cases:
-            case = case if case in void_cases else random.choice(void_cases)
+            case = case if case in void_cases else self.random.choice(void_cases)
             self.spawn_angel(case)
 
     def create_action_delay(self, action_name, wait_time, fct, *fctArgs, **fctKwargs):
         """
         Create a new action_delay. See game.action_delay.Action_delay.
         If an action_delay already exists with the same name, do nothing.
+        See game.action_scheduler.ActionScheduler.
 
         :type action_name: object
         :param action_name: The name given to the new action_delay.
@@ -296,14 +425,14 @@ class Level:
         :param **fctKwargs: The optional arguments to pass to the fct.
         """
 
-        if action_name not in self.action_delays:
-            self.action_delays[action_name] = ActionDelay(
-                wait_time, fct, *fctArgs, **fctKwargs)
+        self.action_scheduler.create_action_delay(
+            action_name, wait_time, fct, *fctArgs, **fctKwargs)
 
     def set_action_delay(self, action_name, wait_time, fct, *fctArgs, **fctKwargs):
         """
         Create a new action_delay or replace an existing one.
-        See game.action_delay.Action_delay.
+        See game.action_delay.Action_delay and
+        game.action_scheduler.ActionScheduler.
 
         :type action_name: object
         :param action_name: The name given to the new action_delay.
@@ -321,8 +450,8 @@ class Level:
         :param **fctKwargs: The optional arguments to pass to the fct.
         """
 
-        self.action_delays[action_name] = ActionDelay(
-            wait_time, fct, *fctArgs, **fctKwargs)
+        self.action_scheduler.set_action_delay(
+            action_name, wait_time, fct, *fctArgs, **fctKwargs)
 
     def remove_action_delay(self, *action_names):
         """
@@ -332,19 +461,63 @@ class Level:
         :param *action_names: The name of the action_delays to remove.
         """
 
-        for action_name in action_names:
-            self.action_delays.pop(action_name, None)
+        self.action_scheduler.remove_action_delay(*action_names)
+
+    def get_time(self):
+        """
+        Get the time of the level, which is also the clock of the action
+        delays and of the entity animations (see game.animation).
+
+        :rtype: float
+        :returns: The time elapsed in the level (in seconds, scaled by the
+            level speed).
+        """
+
+        return self.action_scheduler.time
+
+    def add_entity(self, entity):
+        """
+        Add an Entity to the level.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity to add.
+
+        :rtype: int
+        :returns: The handle of the entity (see Level.get_entity).
+        """
+
+        handle = self.entities.add(entity)
+        if entity.index_kind == "bean":
+            self.bean_index.add(entity)
+        if self.physics:
+            self.physics.add(entity)
+        return handle
+
+    def get_entity(self, handle):
+        """
+        Get an Entity from its handle.
+
+        :type handle: int
+        :param handle: The handle given when the entity was added.
+
+        :rtype: entities.entity.Entity
+        :returns: The entity or None if it has been removed since.
+        """
+
+        return self.entities.get(handle)
 
     def remove_entity(self, entity):
         """
-        Remove an Entity.
+        Remove an Entity. Pooled entities are given back to the entity pool.
 
         :type entity: entities.entity.Entity
         :param entity: The entity to remove.
         """
 
-        if entity in self.entities:
-            self.entities.remove(entity)
+        if self.entities.remove(entity):
+            if entity.body is not None:
+                entity.body.remove(entity)
+            self.entity_pool.release(entity)
         else:
             print(
                 f"[WARNING] [Level.remove_entity] Unable to remove {entity} from Entity list")
@@ -355,64 +528,56 @@ class Level:
         0 is normal, 1 is black and white and 2 is flashy.
 
         :type score: int
-        :param score: Optional. A score. Use the current level score
-            if undefined.
+        :param score: Optional. A score. Use the current level style
+            (computed once per step, see game.level_state.LevelState) if
+            undefined.
 
         :rtype: int
         :returns: The style id associated to the given score.
         """
 
-        score = score if score else self.score
-        if score < 20000:
-            return 0
-        elif score < 30000:
-            return 1
-        else:
-            return 2
+        if score is None:
+            return self.state.style_type
+        return get_style_type(score)
 
     def get_background_id_with_score(self, score=None):
         """
         Get the background id associated to a specified score.
 
         :type score: int
-        :param score: Optional. A score. Use the current level score
-            if undefined.
+        :param score: Optional. A score. Use the current level background
+            (computed once per step, see game.level_state.LevelState) if
+            undefined.
 
         :rtype: int
         :returns: The background id associated to the given score.
         """
 
-        score = score if score else self.score
-        if score < 11000:
-            return score // 1000
-        elif score < 20000:
-            return 10
-        elif score < 30000:
-            return 11
-        elif score < 40000:
-            return 12
-        else:
-            self.create_action_delay((self, "updateAnimatedBackround"),
-                                     BACKGROUND_ANIMATED_DURATION, self.update_animated_background)
-            return self.animated_background_id
+        if score is None:
+            return self.state.background_id
+        return get_background_id(score, self.animated_background_id)
 
     def get_audio_player(self):
         """
         Get the current audio player.
 
         :rtype: audio.audio_player.Audio_player
-        :returns: The audio player currently used by the game.
+        :returns: The audio player currently used by the level drawer.
         """
-        return Game.audio_player
+        return self.level_drawer.get_audio_player()
 
-    def get_void_cases(self):
+    def get_void_cases(self, max_count=None):
         """
         Get the destroyed blocks that are not being repaired.
 
+        :type max_count: int
+        :param max_count: Optional. The maximum number of blocks to give.
+            Default is None (no limit).
+
         :rtype: list<game.case.Case>
-        :returns: A list of all destroyed blocks.
+        :returns: A list of destroyed blocks from left to right.
         """
-        return [case for case in self.cases if not case.exists and not case.is_repairing]
+        return [self.cases[pos] for pos in self.floor.get_void_positions(max_count)]
 
     def set_size(self, size):
         """
@@ -0,0 +1,167 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide a class computing once per step the level values which only depend
+on the score (style and background).
+
+Created on 17/10/2026
+"""
+
+import bisect
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import BACKGROUND_ANIMATED_DURATION
+from game.events import (
+    BackgroundChangedEvent,
+    ScoreChangedEvent,
+    ScoreCrossedEvent,
+    StyleChangedEvent,
+)
+
+# Score from which the background is animated
+ANIMATED_BACKGROUND_SCORE = 40000
+
+
+def get_style_type(score):
+    """
+    Get the style id from the score.
+    0 is normal, 1 is black and white and 2 is flashy.
+
+    :type score: int
+    :param score: A score.
+
+    :rtype: int
+    :returns: The style id associated to the given score.
+    """
+
+    if score < 20000:
+        return 0
+    elif score < 30000:
+        return 1
+    else:
+        return 2
+
+
+def get_background_id(score, animated_background_id):
+    """
+    Get the background id associated to a specified score.
+
+    :type score: int
+    :param score: A score.
+
+    :type animated_background_id: int
+    :param animated_background_id: The current frame of the animated
+        background (see game.level.Level.update_animated_background).
+
+    :rtype: int
+    :returns: The background id associated to the given score.
+    """
+
+    if score < 11000:
+        return score // 1000
+    elif score < 20000:
+        return 10
+    elif score < 30000:
+        return 11
+    elif score < ANIMATED_BACKGROUND_SCORE:
+        return 12
+    else:
+        return animated_background_id
+
+
+class LevelState:
+    """
+    Store the style and the background of a level, updated at the end of
+    each step. Events are published on the level event bus only when a value
+    changes or when the score reaches a threshold, so nothing has to compare
+    the score with thresholds at each frame.
+    """
+
+    def __init__(self, level):
+        """
+        Initialize a LevelState object.
+
+        :type level: game.level.Level
+        :param level: The level from which values are computed.
+        """
+
+        self.level = level
+        self.score = level.score
+        self.style_type = get_style_type(level.score)
+        self.background_id = get_background_id(
+            level.score, level.animated_background_id
+        )
+        self.score_thresholds = []
+
+    def add_score_threshold(self, threshold):
+        """
+        Publish a game.events.ScoreCrossedEvent each time the score reaches
+        a value.
+
+        :type threshold: int
+        :param threshold: The score to watch.
+        """
+
+        if threshold not in self.score_thresholds:
+            bisect.insort(self.score_thresholds, threshold)
+
+    def update(self):
+        """
+        Compute the values from the level and publish an event for each
+        changed value. The background animation is started when the
+        animated background is reached.
+        """
+
+        level = self.level
+        score = level.score
+        if score != self.score:
+            previous_score, self.score = self.score, score
+            level.events.publish(ScoreChangedEvent(previous_score, score))
+
+            if score > previous_score:
+                start = bisect.bisect_right(self.score_thresholds, previous_score)
+                end = bisect.bisect_right(self.score_thresholds, score)
+                for threshold in self.score_thresholds[start:end]:
+                    level.events.publish(ScoreCrossedEvent(threshold, score))
+
+            style_type = get_style_type(score)
+            if style_type != self.style_type:
+                previous_style_type, self.style_type = self.style_type, style_type
+                level.events.publish(
+                    StyleChangedEvent(previous_style_type, style_type)
+                )
+
+            if score >= ANIMATED_BACKGROUND_SCORE:
+                level.create_action_delay(
+                    (level, "update_animated_background"),
+                    BACKGROUND_ANIMATED_DURATION,
+                    level.update_animated_background,
+                )
+
+        background_id = get_background_id(score, level.animated_background_id)
+        if background_id != self.background_id:
+            previous_background_id, self.background_id = (
+                self.background_id,
+                background_id,
+            )
+            level.events.publish(
+                BackgroundChangedEvent(previous_background_id, background_id)
+            )
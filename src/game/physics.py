@@ -0,0 +1,367 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide an optional NumPy physics backend moving falling entities (beans,
+leaves and seeds) with one vectorized step per entity kind.
+
+Created on 17/10/2026
+"""
+
+from operator import attrgetter
+
+import numpy
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import (
+    AIR_RESISTANCE,
+    BEAN_SPEED,
+    GRAVITY_FORCE,
+    LEAF_SPEED,
+)
+
+
+class BodyArrays:
+    """
+    Store the bodies of one entity kind in contiguous arrays (struct of
+    arrays). While an entity is in the arrays, its pos, body_vel and
+    body_aux attributes are views on its rows. Removed entities get list
+    copies back.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        Initialize a BodyArrays object.
+
+        :type capacity: int
+        :param capacity: (Optional) The initial number of bodies which can be
+            stored without growing the arrays. Default is 64.
+        """
+
+        self.entities = []
+        self.pos = numpy.zeros((capacity, 2))
+        self.vel = numpy.zeros((capacity, 2))
+        self.aux = numpy.zeros((capacity, 2))
+        self.size = numpy.zeros((capacity, 2))
+        self.speed = numpy.zeros(capacity)
+
+    def __len__(self):
+        """
+        Get the number of bodies.
+
+        :rtype: int
+        :returns: The number of entities in the arrays.
+        """
+
+        return len(self.entities)
+
+    def bind(self, entity, index):
+        """
+        Make the attributes of an entity views on a row of the arrays.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity to bind.
+
+        :type index: int
+        :param index: The row of the entity.
+        """
+
+        entity.body_index = index
+        entity.pos = self.pos[index]
+        entity.body_vel = self.vel[index]
+        entity.body_aux = self.aux[index]
+
+    def grow(self):
+        """
+        Double the capacity of the arrays and bind the entities to the new
+        arrays.
+        """
+
+        capacity = len(self.speed) * 2
+        for name in ("pos", "vel", "aux", "size", "speed"):
+            array = getattr(self, name)
+            new_array = numpy.zeros((capacity,) + array.shape[1:])
+            new_array[: len(array)] = array
+            setattr(self, name, new_array)
+
+        for index, entity in enumerate(self.entities):
+            self.bind(entity, index)
+
+    def add(self, entity):
+        """
+        Copy the state of an entity in the arrays and bind it.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity to add.
+        """
+
+        index = len(self.entities)
+        if index == len(self.speed):
+            self.grow()
+
+        self.pos[index] = entity.pos
+        self.vel[index] = getattr(entity, "body_vel", (0, 0))
+        self.aux[index] = getattr(entity, "body_aux", (0, 0))
+        self.size[index] = entity.size
+        self.speed[index] = getattr(entity, "speed", 0)
+        self.entities.append(entity)
+        entity.body = self
+        self.bind(entity, index)
+
+    def remove(self, entity):
+        """
+        Give its state back to an entity and fill its row with the last body.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity to remove.
+        """
+
+        index = entity.body_index
+        entity.pos = self.pos[index].tolist()
+        entity.body_vel = self.vel[index].tolist()
+        entity.body_aux = self.aux[index].tolist()
+        entity.body = None
+        entity.body_index = None
+
+        last = len(self.entities) - 1
+        last_entity = self.entities.pop()
+        if index != last:
+            for array in (self.pos, self.vel, self.aux, self.size, self.speed):
+                array[index] = array[last]
+            self.entities[index] = last_entity
+            self.bind(last_entity, index)
+
+    def clear(self):
+        """
+        Give their state back to all entities and remove them.
+        """
+
+        for entity in self.entities:
+            index = entity.body_index
+            entity.pos = self.pos[index].tolist()
+            entity.body_vel = self.vel[index].tolist()
+            entity.body_aux = self.aux[index].tolist()
+            entity.body = None
+            entity.body_index = None
+        self.entities.clear()
+
+    def get_out_of_bound(self, count, level_size):
+        """
+        Check which bodies are entirely out of the level (see
+        entities.entity.Entity.is_out_of_bound).
+
+        :type count: int
+        :param count: The number of bodies to check.
+
+        :type level_size: tuple
+        :param level_size: The (width, height) size of the level.
+
+        :rtype: numpy.ndarray
+        :returns: A boolean array.
+        """
+
+        pos = self.pos[:count]
+        half_size = self.size[:count] / 2
+        return (
+            (pos[:, 0] + half_size[:, 0] <= 0)
+            | (pos[:, 0] - half_size[:, 0] >= level_size[0])
+            | (pos[:, 1] + half_size[:, 1] <= 0)
+            | (pos[:, 1] - half_size[:, 1] >= level_size[1])
+        )
+
+    def get_entities(self, mask):
+        """
+        Get the entities selected by a mask. Rows are moved when a body is
+        removed, so the entities are sorted by handle to be handled in the
+        order of the level entities (like the scalar path).
+
+        :type mask: numpy.ndarray
+        :param mask: A boolean array.
+
+        :rtype: list
+        :returns: The selected entities in insertion order.
+        """
+
+        return sorted(
+            (self.entities[index] for index in numpy.flatnonzero(mask)),
+            key=attrgetter("handle"),
+        )
+
+
+class PhysicsBackend:
+    """
+    Move the beans, leaves and seeds of a level. Entities declare their kind
+    with their physics_kind attribute. Vectorized tests only select
+    candidates, then the usual entity methods handle collisions, so the
+    game rules stay in the entity classes.
+    """
+
+    def __init__(self, level):
+        """
+        Initialize a PhysicsBackend object.
+
+        :type level: game.level.Level
+        :param level: The level owning the entities.
+        """
+
+        self.level = level
+        self.kinds = {
+            "bean": BodyArrays(),
+            "leaf": BodyArrays(),
+            "seed": BodyArrays(),
+        }
+
+    def add(self, entity):
+        """
+        Move an entity with the backend if its kind is supported.
+
+        :type entity: entities.entity.Entity
+        :param entity: The entity which has just been added to the level.
+        """
+
+        body = self.kinds.get(entity.physics_kind)
+        if body is not None:
+            body.add(entity)
+
+    def get_bodies(self):
+        """
+        Get the entities moved by the backend.
+
+        :rtype: dict
+        :returns: A {kind: list of entities} dictionary in array order.
+        """
+
+        return {kind: list(body.entities) for kind, body in self.kinds.items()}
+
+    def restore(self, bodies):
+        """
+        Replace all bodies (see PhysicsBackend.get_bodies). The rows are
+        filled with the current state of the entities.
+
+        :type bodies: dict
+        :param bodies: A {kind: list of entities} dictionary.
+        """
+
+        for kind, body in self.kinds.items():
+            body.clear()
+            for entity in bodies.get(kind, ()):
+                body.add(entity)
+
+    def update(self, delta_time):
+        """
+        Move all bodies and handle the ones which are hitting something or
+        going out of the level.
+
+        :type delta_time: float
+        :param delta_time: Time elapsed since the last update.
+        """
+
+        self.update_beans(delta_time)
+        self.update_leaves(delta_time)
+        self.update_seeds(delta_time)
+
+    def update_beans(self, delta_time):
+        """
+        Make the beans fall. See entities.bean.Bean.update.
+
+        :type delta_time: float
+        :param delta_time: Time elapsed since the last update.
+        """
+
+        body = self.kinds["bean"]
+        count = len(body)
+        if not count:
+            return
+
+        pos = body.pos[:count]
+        half_size = body.size[:count] / 2
+        pos[:, 1] += BEAN_SPEED * body.speed[:count] * delta_time
+
+        candidates = pos[:, 1] + half_size[:, 1] >= self.level.size[1] - 1
+        pyoro = self.level.pyoro
+        if not pyoro.dead:
+            candidates |= (
+                (pyoro.pos[0] + pyoro.size[0] / 2 > pos[:, 0] - half_size[:, 0])
+                & (pyoro.pos[0] - pyoro.size[0] / 2 < pos[:, 0] + half_size[:, 0])
+                & (pyoro.pos[1] + pyoro.size[1] / 2 > pos[:, 1] - half_size[:, 1])
+                & (pyoro.pos[1] - pyoro.size[1] / 2 < pos[:, 1] + half_size[:, 1])
+            )
+        candidates |= body.get_out_of_bound(count, self.level.size)
+
+        for bean in body.get_entities(candidates):
+            if bean.body is body:
+                bean.check_collisions()
+            if bean.body is body and bean.is_out_of_bound():
+                bean.remove()
+
+    def update_leaves(self, delta_time):
+        """
+        Make the leaves (and leaf pieces) fall and slow down their horizontal
+        velocity. See entities.leaf.Leaf.update.
+
+        :type delta_time: float
+        :param delta_time: Time elapsed since the last update.
+        """
+
+        body = self.kinds["leaf"]
+        count = len(body)
+        if not count:
+            return
+
+        pos = body.pos[:count]
+        vel = body.vel[:count, 0]
+        pos[:, 0] += vel * delta_time
+        pos[:, 1] += (LEAF_SPEED - numpy.abs(vel)) * body.speed[:count] * delta_time
+        vel[:] = numpy.sign(vel) * numpy.maximum(
+            numpy.abs(vel) - AIR_RESISTANCE * delta_time, 0
+        )
+
+        for leaf in body.get_entities(body.get_out_of_bound(count, self.level.size)):
+            leaf.remove()
+
+    def update_seeds(self, delta_time):
+        """
+        Move the seeds and make them fade out. See entities.seed.Seed.update.
+
+        :type delta_time: float
+        :param delta_time: Time elapsed since the last update.
+        """
+
+        body = self.kinds["seed"]
+        count = len(body)
+        if not count:
+            return
+
+        pos = body.pos[:count]
+        vel = body.vel[:count]
+        direction = body.aux[:count, 0]
+        alpha = body.aux[:count, 1]
+
+        vel[:, 0] -= AIR_RESISTANCE * direction * delta_time
+        vel[:, 1] += GRAVITY_FORCE * delta_time
+        pos += vel
+
+        faded = alpha <= 0
+        alpha[~faded] -= 64 * delta_time
+
+        for seed in body.get_entities(
+            faded | body.get_out_of_bound(count, self.level.size)
+        ):
+            if seed.body is body:
+                seed.remove()
@@ -0,0 +1,270 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide a planning controller for the bots: moves are evaluated by
+simulating the level a few seconds ahead from a snapshot.
+
+Created on 17/10/2026
+"""
+
+import time
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import FIXED_DELTA_TIME, PLANNER_BUDGET, PLANNER_HORIZON, \
+    PLANNER_TARGETS
+from game.headless import HeadlessLevelDrawer
+
+# Value of a destroyed block and of the death of the bot in the evaluation
+HOLE_PENALTY = 300
+DEATH_PENALTY = 100000
+# Decrease of the estimated duration of a search unit at each new measure
+COST_DECAY = 0.95
+
+
+class TargetFollower:
+    """
+    Control a bot (see entities.pyobot.Pyobot) to catch or shoot a target
+    bean from one of its sides. Without target, the lowest bean is chosen
+    on the nearest side, as the bots do by themselves.
+    """
+
+    def __init__(self, level):
+        """
+        Initialize a TargetFollower object.
+
+        :type level: game.level.Level
+        :param level: The level of the controlled bot.
+        """
+
+        self.level = level
+        self.target = None
+
+    def control(self, bot):
+        """
+        Move the bot toward the target position and use its capacity when it
+        is reached. The target is then dropped.
+
+        :type bot: entities.pyoro.Pyoro
+        :param bot: The bot to control.
+        """
+
+        if bot.dead or bot.tongue:
+            return
+
+        bean = self.level.get_entity(self.target[0]) if self.target else None
+        if bean is None or bean.caught:
+            self.target = None
+            bean = self.level.bean_index.get_lowest_bean()
+            if bean is None:
+                bot.disable_move()
+                return
+            distance = bot.pos[1] - bean.pos[1]
+            pos = bot.get_nearest_pos(bean.pos[0] - distance, bean.pos[0] + distance)
+        else:
+            pos = bean.pos[0] + self.target[1] * (bot.pos[1] - bean.pos[1])
+
+        if not 0 < pos < self.level.size[0]:
+            self.target = None
+            bot.disable_move()
+        elif int(pos) != int(bot.pos[0]):
+            if bot.pos[0] > pos:
+                bot.enable_move_left()
+            else:
+                bot.enable_move_right()
+        else:
+            if bot.pos[0] > bean.pos[0]:
+                bot.enable_move_left()
+            else:
+                bot.enable_move_right()
+            bot.disable_move()
+            bot.enable_capacity()
+            self.target = None
+
+
+class Planner:
+    """
+    Control the bot of a level by planning. A search cycle takes a snapshot
+    of the level, then simulates each candidate target (the lowest beans,
+    from each side, and no target at all) for PLANNER_HORIZON seconds in a
+    headless level. The best target is followed by the bot.
+
+    The search is spread over the level updates: each update only gives it
+    PLANNER_BUDGET seconds of CPU time.
+    """
+
+    def __init__(self, level, budget=None, horizon=None, nb_targets=None):
+        """
+        Initialize a Planner object.
+
+        :type level: game.level.Level
+        :param level: The level of the controlled bot.
+
+        :type budget: float
+        :param budget: (Optional) The CPU time given to the search at each
+            update (in seconds). Default is game.config.PLANNER_BUDGET.
+
+        :type horizon: float
+        :param horizon: (Optional) The simulated duration of each candidate
+            (in seconds). Default is game.config.PLANNER_HORIZON.
+
+        :type nb_targets: int
+        :param nb_targets: (Optional) The number of beans which can be
+            chosen as targets. Default is game.config.PLANNER_TARGETS.
+        """
+
+        self.level = level
+        self.budget = PLANNER_BUDGET if budget is None else budget
+        self.nb_steps = round(
+            (PLANNER_HORIZON if horizon is None else horizon) / FIXED_DELTA_TIME
+        )
+        self.nb_targets = PLANNER_TARGETS if nb_targets is None else nb_targets
+        self.follower = TargetFollower(level)
+
+        self.simulation = HeadlessLevelDrawer(
+            level.game_id, True, level.size, mortal_bot=True
+        ).level
+        self.simulation.bot_controller = TargetFollower(self.simulation)
+
+        self.snapshot = None
+        self.candidates = []
+        self.values = []
+        self.step = None
+        self.start_score = 0
+
+        # Estimated durations of the search units (see Planner.search)
+        self.costs = {"cycle": 0, "rollout": 0, "step": 0}
+
+        self.cycles = 0
+        self.rollouts = 0
+        self.steps = 0
+
+    def control(self, bot):
+        """
+        Continue the search then move the bot.
+
+        :type bot: entities.pyoro.Pyoro
+        :param bot: The bot to control.
+        """
+
+        if not bot.dead:
+            self.search(self.budget)
+        self.follower.control(bot)
+
+    def search(self, budget):
+        """
+        Simulate candidates until the time budget is spent. The search is
+        made of units (a snapshot of the level, a restore of the simulation
+        or a simulated step) which can't be interrupted, so a unit is only
+        started if its estimated duration fits in the remaining time.
+
+        :type budget: float
+        :param budget: The CPU time to use (in seconds).
+        """
+
+        start = now = time.perf_counter()
+        deadline = start + budget
+        while now < deadline:
+            if not self.candidates:
+                kind, unit = "cycle", self.start_cycle
+            elif self.step is None:
+                kind, unit = "rollout", self.start_rollout
+            else:
+                kind, unit = "step", self.simulate_step
+
+            # The first unit is always run so the search goes on even with
+            # a budget shorter than a unit
+            if now > start and now + self.costs[kind] > deadline:
+                break
+            unit()
+            end = time.perf_counter()
+            self.costs[kind] = max(end - now, self.costs[kind] * COST_DECAY)
+            now = end
+
+    def start_cycle(self):
+        """
+        Save the level and choose the candidate targets.
+        """
+
+        self.snapshot = self.level.snapshot()
+        self.candidates = [None]
+        for bean in self.level.bean_index.get_beans_lower_than(float("-inf"))[
+            : self.nb_targets
+        ]:
+            if not bean.caught:
+                self.candidates.append((bean.handle, -1))
+                self.candidates.append((bean.handle, 1))
+        self.values = []
+
+    def start_rollout(self):
+        """
+        Restore the saved level in the simulation and give it the next
+        candidate target.
+        """
+
+        self.simulation.restore(self.snapshot)
+        self.simulation.bot_controller.target = self.candidates[len(self.values)]
+        self.start_score = self.simulation.score
+        self.step = 0
+
+    def simulate_step(self):
+        """
+        Update the simulation once and end the rollout if the bot is dead or
+        the horizon is reached.
+        """
+
+        simulation = self.simulation
+        simulation.step(FIXED_DELTA_TIME)
+        self.step += 1
+        if simulation.pyoro.dead or self.step >= self.nb_steps:
+            self.end_rollout()
+
+    def end_rollout(self):
+        """
+        Evaluate the simulated candidate. When all candidates are evaluated,
+        the best one becomes the target of the bot.
+        """
+
+        simulation = self.simulation
+        value = simulation.score - self.start_score \
+            - HOLE_PENALTY * simulation.floor.get_nb_holes()
+        if simulation.pyoro.dead:
+            value -= DEATH_PENALTY * (1 + (self.nb_steps - self.step) / self.nb_steps)
+        self.values.append(value)
+        self.rollouts += 1
+        self.steps += self.step
+        self.step = None
+
+        if len(self.values) == len(self.candidates):
+            best = self.values.index(max(self.values))
+            self.follower.target = self.candidates[best]
+            self.candidates = []
+            self.cycles += 1
+
+    def get_stats(self):
+        """
+        Get the search counters.
+
+        :rtype: dict
+        :returns: A dictionary with the number of search "cycles",
+            simulated "rollouts" and simulated "steps".
+        """
+
+        return {"cycles": self.cycles, "rollouts": self.rollouts, "steps": self.steps}
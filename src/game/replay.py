@@ -0,0 +1,299 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide classes to record the inputs of a game.level.Level in a compact
+binary replay file and to play them back.
+
+A replay file starts with a header (magic, version, game_id, seed, level
+size and step duration) followed by events. Each event is one varint
+holding the number of ticks since the previous event (shifted by 3 bits)
+and the action id (3 lowest bits).
+
+Created on 17/10/2026
+"""
+
+import struct
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import FIXED_DELTA_TIME
+
+# Action ids
+MOVE_LEFT = 0
+MOVE_RIGHT = 1
+STOP_MOVE = 2
+ENABLE_CAPACITY = 3
+DISABLE_CAPACITY = 4
+PAUSE = 5
+END = 7
+
+REPLAY_MAGIC = b"PYRP"
+REPLAY_VERSION = 1
+REPLAY_HEADER = struct.Struct("<4sBBIHdd")
+REPLAY_CHUNK_SIZE = 4096
+
+
+def apply_action(level, action):
+    """
+    Apply an input action to the bird of a level. PAUSE and END don't
+    change the level.
+
+    :type level: game.level.Level
+    :param level: The level receiving the action.
+
+    :type action: int
+    :param action: The id of the action (MOVE_LEFT, MOVE_RIGHT, ...).
+    """
+
+    pyoro = level.pyoro
+    if action == MOVE_LEFT:
+        pyoro.enable_move_left()
+    elif action == MOVE_RIGHT:
+        pyoro.enable_move_right()
+    elif action == STOP_MOVE:
+        pyoro.disable_move()
+    elif action == ENABLE_CAPACITY:
+        pyoro.enable_capacity()
+    elif action == DISABLE_CAPACITY:
+        pyoro.disable_capacity()
+
+
+class ReplayWriter:
+    """
+    Write the actions of a level in a replay file. Events are buffered and
+    written by chunks.
+    """
+
+    def __init__(self, file_path, level):
+        """
+        Initialize a ReplayWriter object and write the replay header.
+
+        :type file_path: str
+        :param file_path: The path of the replay file to create.
+
+        :type level: game.level.Level
+        :param level: The recorded level. It must be updated with fixed
+            steps of FIXED_DELTA_TIME.
+        """
+
+        self.file_path = file_path
+        self.file = open(file_path, "wb")
+        self.buffer = bytearray()
+        self.last_tick = 0
+
+        self.file.write(
+            REPLAY_HEADER.pack(
+                REPLAY_MAGIC,
+                REPLAY_VERSION,
+                level.game_id,
+                level.seed,
+                level.size[0],
+                level.size[1],
+                FIXED_DELTA_TIME,
+            )
+        )
+
+    def record(self, tick, action):
+        """
+        Add an action to the replay.
+
+        :type tick: int
+        :param tick: The level tick when the action happened.
+
+        :type action: int
+        :param action: The id of the action (MOVE_LEFT, MOVE_RIGHT, ...).
+        """
+
+        value = (tick - self.last_tick) << 3 | action
+        self.last_tick = tick
+        while value >= 0x80:
+            self.buffer.append(value & 0x7F | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+        if len(self.buffer) >= REPLAY_CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered events in the replay file.
+        """
+
+        self.file.write(self.buffer)
+        self.buffer.clear()
+
+    def close(self, tick):
+        """
+        Mark the end of the replay and close the file.
+
+        :type tick: int
+        :param tick: The level tick when the recording stopped.
+        """
+
+        if not self.file.closed:
+            self.record(tick, END)
+            self.flush()
+            self.file.close()
+            print(
+                f"[INFO] [ReplayWriter.close] Replay saved in {self.file_path} "
+                + f"({tick} ticks)"
+            )
+
+
+class ReplayReader:
+    """
+    Read a replay file. Events are decoded while the file is read by chunks,
+    so long replays are never fully loaded in memory.
+    """
+
+    def __init__(self, file_path):
+        """
+        Initialize a ReplayReader object and read the replay header.
+
+        :type file_path: str
+        :param file_path: The path of the replay file to read.
+        """
+
+        self.file_path = file_path
+        with open(file_path, "rb") as file:
+            header = file.read(REPLAY_HEADER.size)
+
+        if len(header) != REPLAY_HEADER.size:
+            raise ValueError(f"{file_path} is not a replay file")
+        (
+            magic,
+            version,
+            self.game_id,
+            self.seed,
+            width,
+            height,
+            self.step_time,
+        ) = REPLAY_HEADER.unpack(header)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{file_path} is not a replay file")
+        self.level_size = (width, height)
+
+    def __iter__(self):
+        """
+        Decode the events of the replay.
+
+        :rtype: generator
+        :returns: A generator of (tick, action) tuples.
+        """
+
+        tick = 0
+        value = 0
+        shift = 0
+        with open(self.file_path, "rb") as file:
+            file.seek(REPLAY_HEADER.size)
+            chunk = file.read(REPLAY_CHUNK_SIZE)
+            while chunk:
+                for byte in chunk:
+                    value |= (byte & 0x7F) << shift
+                    if byte & 0x80:
+                        shift += 7
+                    else:
+                        tick += value >> 3
+                        yield tick, value & 7
+                        value = 0
+                        shift = 0
+                chunk = file.read(REPLAY_CHUNK_SIZE)
+
+
+class ReplayPlayer:
+    """
+    Feed the actions of a replay into a level. The level is updated with the
+    step duration of the replay, at any speed.
+    """
+
+    def __init__(self, level, replay_reader, speed=1):
+        """
+        Initialize a ReplayPlayer object.
+
+        :type level: game.level.Level
+        :param level: The level to drive. It must have been created with the
+            game_id, seed and size of the replay.
+
+        :type replay_reader: game.replay.ReplayReader
+        :param replay_reader: The replay to play.
+
+        :type speed: float
+        :param speed: (Optional) The playback speed used by
+            ReplayPlayer.update. Default is 1.
+        """
+
+        self.level = level
+        self.step_time = replay_reader.step_time
+        self.events = iter(replay_reader)
+        self.next_event = next(self.events, None)
+        self.speed = speed
+        self.accumulator = 0
+        self.is_finished = False
+
+    def apply_events(self):
+        """
+        Apply the actions recorded for the current tick of the level.
+        """
+
+        while self.next_event and self.next_event[0] <= self.level.tick:
+            action = self.next_event[1]
+            if action == END:
+                self.is_finished = True
+            else:
+                apply_action(self.level, action)
+            self.next_event = next(self.events, None)
+
+        if not self.next_event:
+            self.is_finished = True
+
+    def step(self):
+        """
+        Apply the actions of the current tick and update the level once.
+        """
+
+        self.apply_events()
+        if not self.is_finished:
+            self.level.step(self.step_time)
+
+    def update(self, delta_time):
+        """
+        Update the level by as many steps as elapsed time (multiplied by the
+        playback speed) allows.
+
+        :type delta_time: float
+        :param delta_time: Time elapsed since the last update.
+        """
+
+        self.accumulator += delta_time * self.speed
+        while self.accumulator >= self.step_time and not self.is_finished:
+            self.accumulator -= self.step_time
+            self.step()
+
+    def run(self):
+        """
+        Play the whole replay as fast as possible (or until the level is
+        stopped).
+
+        :rtype: int
+        :returns: The tick of the level at the end of the replay.
+        """
+
+        while not self.is_finished and self.level.loop_active:
+            self.step()
+        return self.level.tick
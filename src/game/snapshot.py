@@ -0,0 +1,398 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide functions to save the whole state of a game.level.Level in a
+compact byte buffer and to restore it later (rollback, look-ahead search,
+crash dumps).
+
+A snapshot starts with a magic, a version, the game_id and the level size,
+followed by pickles. Entities, blocks, the level and its drawer are saved
+as references: an entity state only holds its game values (no image nor
+sound) and is restored in the entity object with the same handle if it
+still exists, otherwise in a new entity.
+
+Created on 17/10/2026
+"""
+
+import array
+import inspect
+import io
+import pickle
+import struct
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from entities.entity import Entity
+from game.case import Case
+
+SNAPSHOT_MAGIC = b"PYSN"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<4sBBdd")
+
+# Entity attributes which are not saved (resources and physics bindings)
+EXCLUDED_ATTRIBUTES = (
+    "level",
+    "images",
+    "sprites",
+    "compiled_sprite_table",
+    "sounds",
+    "body",
+    "body_index",
+)
+BODY_ATTRIBUTES = ("pos", "body_vel", "body_aux")
+# Globals which can be loaded from a snapshot besides the entity classes
+# (entities package) and the methods of the level objects (builtins.getattr)
+SAFE_GLOBALS = (
+    ("game.action_delay", "ActionDelay"),
+    ("numpy", "dtype"),
+    ("numpy.core.multiarray", "scalar"),
+    ("numpy._core.multiarray", "scalar"),
+)
+
+
+class SnapshotPickler(pickle.Pickler):
+    """
+    Pickle the values of a level and replace the level, its drawer, its
+    blocks and its entities by references. Each entity met is numbered and
+    its state must be pickled afterwards (see take_snapshot).
+    """
+
+    def __init__(self, file, level):
+        """
+        Initialize a SnapshotPickler object.
+
+        :type file: io.BytesIO
+        :param file: The buffer to write in.
+
+        :type level: game.level.Level
+        :param level: The level to save.
+        """
+
+        pickle.Pickler.__init__(self, file, pickle.HIGHEST_PROTOCOL)
+        self.level = level
+        self.entities = []
+        self.entity_ids = {}
+
+    def persistent_id(self, obj):
+        """
+        Get the reference of an object which must not be pickled.
+
+        :type obj: object
+        :param obj: The object to pickle.
+
+        :rtype: object
+        :returns: The reference of the object or None to pickle it.
+        """
+
+        level = self.level
+        if isinstance(obj, Entity):
+            entity_id = self.entity_ids.get(id(obj))
+            if entity_id is None:
+                entity_id = len(self.entities)
+                self.entity_ids[id(obj)] = entity_id
+                self.entities.append(obj)
+
+            if obj is level.pyoro:
+                key = "pyoro"
+            elif obj in level.entities:
+                key = obj.handle
+            else:
+                key = None
+            return ("entity", entity_id, type(obj), key)
+        if isinstance(obj, Case):
+            return ("case", obj.pos)
+        if obj is level:
+            return ("level",)
+        if obj is level.level_drawer:
+            return ("drawer",)
+        if obj is level.level_drawer.activity:
+            return ("activity",)
+        return None
+
+
+class SnapshotUnpickler(pickle.Unpickler):
+    """
+    Unpickle the values of a level and resolve the references made by a
+    SnapshotPickler. Entities are reused by handle or created empty, their
+    state is set afterwards (see restore_snapshot).
+
+    Snapshots can be loaded from crash dumps, so only the globals written by
+    a SnapshotPickler can be loaded: a crafted file can't run any other
+    code.
+    """
+
+    def __init__(self, file, level):
+        """
+        Initialize a SnapshotUnpickler object.
+
+        :type file: io.BytesIO
+        :param file: The buffer to read.
+
+        :type level: game.level.Level
+        :param level: The level to restore.
+        """
+
+        pickle.Unpickler.__init__(self, file)
+        self.level = level
+        self.entities = {}
+        self.new_entities = set()
+
+    def persistent_load(self, pid):
+        """
+        Get the object of a reference.
+
+        :type pid: tuple
+        :param pid: The reference given by SnapshotPickler.persistent_id.
+
+        :rtype: object
+        :returns: The referenced object.
+        """
+
+        level = self.level
+        if pid[0] == "entity":
+            _, entity_id, entity_type, key = pid
+            if entity_id not in self.entities:
+                if key == "pyoro":
+                    entity = level.pyoro
+                elif key is not None:
+                    entity = level.entities.get(key)
+                else:
+                    entity = None
+
+                if type(entity) is not entity_type:
+                    entity = entity_type.__new__(entity_type)
+                    self.new_entities.add(entity_id)
+                self.entities[entity_id] = entity
+            return self.entities[entity_id]
+        if pid[0] == "case":
+            return level.cases[pid[1]]
+        if pid[0] == "level":
+            return level
+        if pid[0] == "drawer":
+            return level.level_drawer
+        if pid[0] == "activity":
+            return level.level_drawer.activity
+        raise pickle.UnpicklingError(f"Unknown reference {pid}")
+
+    def find_class(self, module, name):
+        """
+        Get a global allowed in a snapshot (see SAFE_GLOBALS).
+
+        :type module: str
+        :param module: The module of the global.
+
+        :type name: str
+        :param name: The name of the global.
+
+        :rtype: object
+        :returns: The global.
+        """
+
+        if (module, name) == ("builtins", "getattr"):
+            return self.get_method
+        if (module, name) in SAFE_GLOBALS:
+            return pickle.Unpickler.find_class(self, module, name)
+        if module.startswith("entities.") and not name.startswith("_"):
+            entity_type = pickle.Unpickler.find_class(self, module, name)
+            if isinstance(entity_type, type) and issubclass(entity_type, Entity):
+                return entity_type
+        raise pickle.UnpicklingError(f"Forbidden global {module}.{name}")
+
+    def get_method(self, obj, name):
+        """
+        Get a method of the level, its drawer or an entity (bound methods
+        are pickled as getattr calls, e.g. for action delays).
+
+        :type obj: object
+        :param obj: The object owning the method.
+
+        :type name: str
+        :param name: The name of the method.
+
+        :rtype: method
+        :returns: The bound method.
+        """
+
+        level = self.level
+        if not name.startswith("_") and (
+            obj is level or obj is level.level_drawer or isinstance(obj, Entity)
+        ):
+            method = getattr(obj, name, None)
+            if inspect.ismethod(method):
+                return method
+        raise pickle.UnpicklingError(
+            f"Forbidden method {name} of {type(obj).__name__}"
+        )
+
+
+def get_entity_state(entity):
+    """
+    Get the game values of an entity.
+
+    :type entity: entities.entity.Entity
+    :param entity: The entity to save.
+
+    :rtype: dict
+    :returns: A copy of the attributes of the entity without resources.
+    """
+
+    state = entity.__dict__.copy()
+    for name in EXCLUDED_ATTRIBUTES:
+        state.pop(name, None)
+    if entity.body is not None:
+        for name in BODY_ATTRIBUTES:
+            state[name] = state[name].tolist()
+    return state
+
+
+def take_snapshot(level):
+    """
+    Save the state of a level.
+
+    :type level: game.level.Level
+    :param level: The level to save.
+
+    :rtype: bytes
+    :returns: The snapshot.
+    """
+
+    random_state = level.random.getstate()
+    values = {
+        "score": level.score,
+        "speed": level.speed,
+        "tick": level.tick,
+        "accumulator": level.accumulator,
+        "loop_active": level.loop_active,
+        "animated_background_id": level.animated_background_id,
+        "nb_spawned_beans": level.nb_spawned_beans,
+        "random": (
+            random_state[0],
+            array.array("I", random_state[1]).tobytes(),
+            random_state[2],
+        ),
+        "floor": (level.floor.holes, level.floor.repairs),
+        "pyoro": level.pyoro,
+        "entities": list(level.entities),
+        "last_handle": level.entities.last_handle,
+        "time": level.action_scheduler.time,
+        "action_delays": level.action_scheduler.get_entries(),
+        "bodies": level.physics.get_bodies() if level.physics else None,
+    }
+
+    file = io.BytesIO()
+    file.write(
+        SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, level.game_id, *level.size
+        )
+    )
+    pickler = SnapshotPickler(file, level)
+    pickler.dump(values)
+
+    # Saving states can reference more entities (e.g. a caught bean)
+    nb_saved = 0
+    while nb_saved < len(pickler.entities):
+        entities = pickler.entities[nb_saved:]
+        nb_saved = len(pickler.entities)
+        pickler.dump([get_entity_state(entity) for entity in entities])
+    return file.getvalue()
+
+
+def restore_snapshot(level, snapshot):
+    """
+    Restore the state of a level saved with take_snapshot. The level must
+    have the same game_id and size as the saved one.
+
+    :type level: game.level.Level
+    :param level: The level to restore.
+
+    :type snapshot: bytes
+    :param snapshot: The snapshot.
+    """
+
+    magic, version, game_id, width, height = SNAPSHOT_HEADER.unpack_from(snapshot)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError("Invalid level snapshot")
+    if game_id != level.game_id or (width, height) != tuple(level.size):
+        raise ValueError(
+            f"The snapshot of a level {game_id} of size {(width, height)} "
+            + f"can't be restored in a level {level.game_id} of size {level.size}"
+        )
+
+    if level.physics:
+        level.physics.restore({})
+    old_entities = list(level.entities)
+
+    file = io.BytesIO(snapshot)
+    file.seek(SNAPSHOT_HEADER.size)
+    unpickler = SnapshotUnpickler(file, level)
+    values = unpickler.load()
+    states = []
+    while len(states) < len(unpickler.entities):
+        states.extend(unpickler.load())
+
+    for entity_id, state in enumerate(states):
+        entity = unpickler.entities[entity_id]
+        entity.__dict__.update(state)
+        if entity_id in unpickler.new_entities:
+            # Loading resources may change the sprite state (restored below)
+            entity.level = level
+            entity.images = {}
+            entity.sprites = ()
+            entity.compiled_sprite_table = None
+            entity.sounds = {}
+            entity.init_images()
+            entity.init_sounds()
+            entity.__dict__.update(state)
+        elif entity.get_sprite_table() is not entity.compiled_sprite_table:
+            entity.compile_sprites()
+
+    level.pyoro = values["pyoro"]
+    level.score = values["score"]
+    level.speed = values["speed"]
+    level.tick = values["tick"]
+    level.accumulator = values["accumulator"]
+    level.loop_active = values["loop_active"]
+    level.animated_background_id = values["animated_background_id"]
+    level.nb_spawned_beans = values["nb_spawned_beans"]
+
+    version, internal_state, gauss_next = values["random"]
+    level.random.setstate(
+        (version, tuple(array.array("I", internal_state)), gauss_next)
+    )
+
+    level.floor.holes, level.floor.repairs = values["floor"]
+    level.floor.version += 1
+
+    entities = values["entities"]
+    level.entities.restore(entities, values["last_handle"])
+    restored = set(map(id, entities))
+    level.entity_pool.restore(
+        entities, [entity for entity in old_entities if id(entity) not in restored]
+    )
+    level.action_scheduler.restore(values["time"], values["action_delays"])
+    if level.physics:
+        level.physics.restore(values["bodies"] or {})
+
+    level.state.update()
+    level.spatial_index.invalidate()
+    level.bean_index.clear()
+    for entity in entities:
+        if entity.index_kind == "bean":
+            level.bean_index.add(entity)
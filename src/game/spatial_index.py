@@ -0,0 +1,224 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide a spatial index of the level entities bucketed by case column and
+entity kind.
+
+Created on 17/10/2026
+"""
+
+import math
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+
+class SpatialIndex:
+    """
+    Group the entities of a level by (kind, column) where kind is the
+    index_kind of the entity and column is the case under its center. The
+    index is rebuilt on the first query after SpatialIndex.invalidate (once
+    per level step). Entities added since the last build are checked
+    without the buckets and removed entities are skipped, so queries are
+    always up to date with the entity store.
+
+    Queries only give candidates in the entity store order: the exact
+    collision test is still done by the caller.
+    """
+
+    def __init__(self, level):
+        """
+        Initialize a SpatialIndex object.
+
+        :type level: game.level.Level
+        :param level: The level whose entities are indexed.
+        """
+
+        self.level = level
+        self.buckets = {}
+        self.bounds = {}
+        self.built_size = None
+
+        self.queries = 0
+        self.candidates = 0
+        self.scanned = 0
+        self.rebuilds = 0
+
+    def invalidate(self):
+        """
+        Mark the index as outdated. It must be called when entities have
+        moved or when the entity store has been compacted.
+        """
+
+        self.built_size = None
+
+    def rebuild(self):
+        """
+        Fill the buckets with the current entities and compute, for each
+        kind, the bounds used to know which columns a query must visit.
+        """
+
+        self.buckets.clear()
+        self.bounds.clear()
+        slots = self.level.entities.slots
+
+        for entity in slots:
+            if entity is None or entity.index_kind is None:
+                continue
+            kind = entity.index_kind
+            pos = entity.pos
+            size = entity.size
+            key = (kind, math.floor(pos[0]))
+            if key in self.buckets:
+                self.buckets[key].append(entity)
+            else:
+                self.buckets[key] = [entity]
+
+            if kind in self.bounds:
+                half_width, min_y, max_y, extent = self.bounds[kind]
+                self.bounds[kind] = (
+                    max(half_width, size[0] / 2),
+                    min(min_y, pos[1]),
+                    max(max_y, pos[1]),
+                    max(extent, size[0] + size[1]),
+                )
+            else:
+                self.bounds[kind] = (size[0] / 2, pos[1], pos[1], size[0] + size[1])
+
+        self.built_size = len(slots)
+        self.rebuilds += 1
+
+    def get_candidates(self, kinds, get_columns):
+        """
+        Get the entities of some kinds in the columns to visit, followed by
+        the entities added since the last build.
+
+        :type kinds: tuple<str>
+        :param kinds: The index kinds of the wanted entities.
+
+        :type get_columns: function
+        :param get_columns: A function taking the bounds of a kind (see
+            SpatialIndex.rebuild) and returning the range of columns to visit.
+
+        :rtype: generator
+        :returns: A generator of entities.entity.Entity in entity store order.
+        """
+
+        if self.built_size is None:
+            self.rebuild()
+        store = self.level.entities
+        built_size = self.built_size
+
+        candidates = []
+        for kind in kinds:
+            if kind in self.bounds:
+                for column in get_columns(self.bounds[kind]):
+                    candidates.extend(self.buckets.get((kind, column), ()))
+        candidates.sort(key=lambda entity: entity.slot)
+
+        self.queries += 1
+        self.scanned += len(store)
+        for entity in candidates:
+            if entity.slot < built_size and store.slots[entity.slot] is entity:
+                self.candidates += 1
+                yield entity
+
+        slots = store.slots
+        i = built_size
+        while i < len(slots):
+            entity = slots[i]
+            if entity is not None and entity.index_kind in kinds:
+                self.candidates += 1
+                yield entity
+            i += 1
+
+    def query_box(self, kinds, pos, size):
+        """
+        Get the entities which may collide a box.
+
+        :type kinds: tuple<str>
+        :param kinds: The index kinds of the wanted entities.
+
+        :type pos: list<float>
+        :param pos: The (x, y) position of the center of the box.
+
+        :type size: list<float>
+        :param size: The (width, height) size of the box.
+
+        :rtype: generator
+        :returns: A generator of entities.entity.Entity in entity store order.
+        """
+
+        def get_columns(bounds):
+            half_width = bounds[0] + size[0] / 2
+            return range(
+                math.floor(pos[0] - half_width), math.floor(pos[0] + half_width) + 1
+            )
+
+        return self.get_candidates(kinds, get_columns)
+
+    def query_shot(self, kinds, pos, direction):
+        """
+        Get the entities which may be on a diagonal shot (see
+        entities.pyoro_2.Pyoro2.is_shooting_entity). An entity at a
+        horizontal distance d from the shooter can only be shot if
+        d - (width + height) <= shooter y - entity y <= d + (width + height).
+
+        :type kinds: tuple<str>
+        :param kinds: The index kinds of the wanted entities.
+
+        :type pos: list<float>
+        :param pos: The (x, y) position of the shooter.
+
+        :type direction: int
+        :param direction: The direction of the shot (1=right, -1=left).
+
+        :rtype: generator
+        :returns: A generator of entities.entity.Entity in entity store order.
+        """
+
+        def get_columns(bounds):
+            _, min_y, max_y, extent = bounds
+            near = pos[0] + (pos[1] - max_y - extent) * direction
+            far = pos[0] + (pos[1] - min_y + extent) * direction
+            return range(
+                math.floor(min(near, far)), math.floor(max(near, far)) + 1
+            )
+
+        return self.get_candidates(kinds, get_columns)
+
+    def get_stats(self):
+        """
+        Get the index counters.
+
+        :rtype: dict
+        :returns: A dictionary with the number of "queries", "candidates"
+            given by queries, entities "scanned" by an equivalent full scan,
+            "rebuilds" and the mean number of "candidates_per_query".
+        """
+
+        return {
+            "queries": self.queries,
+            "candidates": self.candidates,
+            "scanned": self.scanned,
+            "rebuilds": self.rebuilds,
+            "candidates_per_query": self.candidates / self.queries
+            if self.queries
+            else 0,
+        }
@@ -360,7 +360,7 @@ def check_modules():
         "pygame",
         "json",
         "wave",
-        "audioop",
+        "numpy",
         "pyaudio",
         "threading",
         "traceback",
@@ -0,0 +1,232 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Provide a vectorized environment stepping many headless levels at once
+with one action array, for learning agents.
+
+Created on 17/10/2026
+"""
+
+import random
+
+import numpy
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from entities.bean import Bean
+from entities.pink_bean import PinkBean
+from entities.super_bean import SuperBean
+from game.config import FIXED_DELTA_TIME, HEADLESS_LEVEL_SIZE
+from game.headless import HeadlessLevelDrawer
+from game.replay import apply_action
+
+# Bean type ids in observations (0 means no bean)
+BEAN_TYPES = {Bean: 1, PinkBean: 2, SuperBean: 3}
+
+# Tongue state ids in observations
+TONGUE_NONE = 0
+TONGUE_OUT = 1
+TONGUE_BACK = 2
+
+
+class VectorLevel:
+    """
+    Step several headless levels in lock-step. Actions are the action ids
+    of game.replay (MOVE_LEFT, MOVE_RIGHT, STOP_MOVE, ENABLE_CAPACITY,
+    DISABLE_CAPACITY), any other value does nothing.
+
+    Observations are NumPy arrays allocated once and filled in place at
+    each step, so they must be copied to be kept. A level whose bird is
+    killed is done and starts again with a new seed at the next step.
+    """
+
+    def __init__(self, nb_levels, game_id=0, seed=None, max_beans=16,
+                 size=None, delta_time=None):
+        """
+        Initialize a VectorLevel object.
+
+        :type nb_levels: int
+        :param nb_levels: The number of levels.
+
+        :type game_id: int
+        :param game_id: (Optional) 0 for Pyoro, 1 for Pyoro 2. Default is 0.
+
+        :type seed: int
+        :param seed: (Optional) The seed giving the seeds of the levels.
+            Default is None (random).
+
+        :type max_beans: int
+        :param max_beans: (Optional) The maximum number of beans in an
+            observation. The lowest beans are kept. Default is 16.
+
+        :type size: tuple
+        :param size: (Optional) The (width, height) size of the levels (in
+            case). Default is game.config.HEADLESS_LEVEL_SIZE.
+
+        :type delta_time: float
+        :param delta_time: (Optional) The duration of a step (in seconds).
+            Default is game.config.FIXED_DELTA_TIME.
+        """
+
+        size = size or HEADLESS_LEVEL_SIZE
+        self.nb_levels = nb_levels
+        self.game_id = game_id
+        self.max_beans = max_beans
+        self.size = size
+        self.delta_time = FIXED_DELTA_TIME if delta_time is None else delta_time
+        self.random = random.Random(seed)
+        self.level_drawers = [None] * nb_levels
+        self.floor_versions = [None] * nb_levels
+
+        nb_cases = int(size[0])
+        self.observations = {
+            "bean_pos": numpy.zeros((nb_levels, max_beans, 2), numpy.float32),
+            "bean_type": numpy.zeros((nb_levels, max_beans), numpy.int8),
+            "floor": numpy.ones((nb_levels, nb_cases), numpy.uint8),
+            "pyoro_pos": numpy.zeros((nb_levels, 2), numpy.float32),
+            "pyoro_direction": numpy.zeros(nb_levels, numpy.int8),
+            "tongue_state": numpy.zeros(nb_levels, numpy.int8),
+            "tongue_pos": numpy.zeros((nb_levels, 2), numpy.float32),
+        }
+        self.scores = numpy.zeros(nb_levels, numpy.int64)
+        self.rewards = numpy.zeros(nb_levels, numpy.float32)
+        self.dones = numpy.zeros(nb_levels, bool)
+        self.seeds = numpy.zeros(nb_levels, numpy.uint32)
+
+        # Rows written for all levels at once
+        self.pyoro_rows = [(0, 0)] * nb_levels
+        self.tongue_rows = [(0, 0)] * nb_levels
+
+    def reset_level(self, i):
+        """
+        Start a new game in a level.
+
+        :type i: int
+        :param i: The index of the level.
+        """
+
+        seed = self.random.randrange(2 ** 32)
+        self.level_drawers[i] = HeadlessLevelDrawer(
+            self.game_id, size=self.size, seed=seed
+        )
+        self.floor_versions[i] = None
+        self.seeds[i] = seed
+        self.scores[i] = 0
+
+    def reset(self):
+        """
+        Start a new game in every level.
+
+        :rtype: dict
+        :returns: The observations (see VectorLevel.step).
+        """
+
+        for i in range(self.nb_levels):
+            self.reset_level(i)
+            self.observe(i)
+        self.write_rows()
+        self.rewards[:] = 0
+        self.dones[:] = False
+        return self.observations
+
+    def step(self, actions):
+        """
+        Apply one action to each level and update them once.
+
+        :type actions: Iterable<int>
+        :param actions: The action id of each level.
+
+        :rtype: tuple
+        :returns: An (observations, rewards, dones) tuple where observations
+            is a {name: numpy.ndarray} dictionary ("bean_pos", "bean_type",
+            "floor", "pyoro_pos", "pyoro_direction", "tongue_state",
+            "tongue_pos") with one row per level, rewards are the points won
+            during the step and dones are True for the levels whose bird has
+            just been killed.
+        """
+
+        if self.level_drawers[0] is None:
+            self.reset()
+
+        for i, action in enumerate(actions):
+            if self.dones[i]:
+                self.reset_level(i)
+            level = self.level_drawers[i].level
+            apply_action(level, action)
+            level.step(self.delta_time)
+            self.dones[i] = level.pyoro.dead
+            self.observe(i)
+
+        scores = self.scores.copy()
+        for i, level_drawer in enumerate(self.level_drawers):
+            self.scores[i] = level_drawer.level.score
+        numpy.subtract(self.scores, scores, out=self.rewards, casting="unsafe")
+        self.write_rows()
+        return self.observations, self.rewards, self.dones
+
+    def observe(self, i):
+        """
+        Write the beans and the floor of a level in the observations, and
+        keep the rows written for all levels by VectorLevel.write_rows.
+
+        :type i: int
+        :param i: The index of the level.
+        """
+
+        level = self.level_drawers[i].level
+        pyoro = level.pyoro
+        observations = self.observations
+
+        bean_pos = observations["bean_pos"][i]
+        bean_type = observations["bean_type"][i]
+        beans = level.bean_index.get_beans_lower_than(float("-inf"))
+        nb_beans = min(len(beans), self.max_beans)
+        for j in range(nb_beans):
+            bean_pos[j] = beans[j].pos
+            bean_type[j] = BEAN_TYPES[type(beans[j])]
+        bean_type[nb_beans:] = 0
+
+        if level.floor.version != self.floor_versions[i]:
+            self.floor_versions[i] = level.floor.version
+            holes = numpy.frombuffer(
+                level.floor.holes.to_bytes(level.floor.nb_cases // 8 + 1, "little"),
+                numpy.uint8,
+            )
+            floor = observations["floor"][i]
+            floor[:] = 1 - numpy.unpackbits(holes, bitorder="little")[: len(floor)]
+
+        self.pyoro_rows[i] = (pyoro.pos[0], pyoro.pos[1])
+        observations["pyoro_direction"][i] = pyoro.direction
+        tongue = getattr(pyoro, "tongue", None)
+        if tongue:
+            observations["tongue_state"][i] = TONGUE_BACK if tongue.go_back \
+                else TONGUE_OUT
+            self.tongue_rows[i] = (tongue.pos[0], tongue.pos[1])
+        else:
+            observations["tongue_state"][i] = TONGUE_NONE
+            self.tongue_rows[i] = (0, 0)
+
+    def write_rows(self):
+        """
+        Write the bird and tongue positions of all levels in one copy each.
+        """
+
+        self.observations["pyoro_pos"][:] = self.pyoro_rows
+        self.observations["tongue_pos"][:] = self.tongue_rows
@@ -0,0 +1,254 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide input bindings compiled into lookup tables of level actions.
+
+Created on 17/10/2026
+"""
+
+from pygame.locals import (
+    KEYDOWN,
+    KEYUP,
+    JOYBUTTONDOWN,
+    JOYBUTTONUP,
+    JOYHATMOTION,
+    JOYAXISMOTION,
+)
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.replay import (
+    DISABLE_CAPACITY,
+    ENABLE_CAPACITY,
+    MOVE_LEFT,
+    MOVE_RIGHT,
+    PAUSE,
+    STOP_MOVE,
+)
+
+# Actions done when the input of a binding is pressed
+ENABLE_ACTIONS = {
+    "left": MOVE_LEFT,
+    "right": MOVE_RIGHT,
+    "action": ENABLE_CAPACITY,
+    "pause": PAUSE,
+}
+# Actions done when the input of a binding is released
+DISABLE_ACTIONS = {
+    "left": STOP_MOVE,
+    "right": STOP_MOVE,
+    "action": DISABLE_CAPACITY,
+}
+# Joystick event codes used by the default options (pygame 1 values)
+LEGACY_INPUT_TYPES = {7: JOYAXISMOTION, 9: JOYHATMOTION, 10: JOYBUTTONDOWN}
+# Axis values below this limit are ignored
+AXIS_DEAD_ZONE = 0.2
+
+
+def get_input(input_infos):
+    """
+    Get the input of a joystick binding as stored in the options. Both
+    snake_case and camelCase keys are accepted.
+
+    :type input_infos: dict
+    :param input_infos: The joystick binding of an action.
+
+    :rtype: tuple
+    :returns: A (input type, input id, value) tuple where input type is
+        JOYBUTTONDOWN, JOYHATMOTION or JOYAXISMOTION, or None if the
+        binding is unknown.
+    """
+
+    input_type = input_infos.get("input_type", input_infos.get("inputType"))
+    input_type = LEGACY_INPUT_TYPES.get(input_type, input_type)
+
+    if input_type == JOYBUTTONDOWN:
+        button_id = input_infos.get("button_id", input_infos.get("buttonId"))
+        return JOYBUTTONDOWN, button_id, None
+    if input_type == JOYHATMOTION:
+        hat_id = input_infos.get("hat_id", input_infos.get("hatId"))
+        return JOYHATMOTION, hat_id, tuple(input_infos.get("value", (0, 0)))
+    if input_type == JOYAXISMOTION:
+        axis_id = input_infos.get("axis_id", input_infos.get("axisId"))
+        return JOYAXISMOTION, axis_id, get_axis_direction(input_infos.get("value", 0))
+    return None
+
+
+def get_axis_direction(value):
+    """
+    Get the direction of a joystick axis.
+
+    :type value: float
+    :param value: The position of the axis (between -1 and 1).
+
+    :rtype: int
+    :returns: -1 or 1, or 0 if the axis is in the dead zone.
+    """
+
+    if abs(value) <= AXIS_DEAD_ZONE:
+        return 0
+    return 1 if value > 0 else -1
+
+
+class InputMap:
+    """
+    Translate pygame events into level actions (see game.replay) with the
+    keyboard and joystick bindings compiled into dictionaries keyed by
+    (input type, input id, value). Hats and axes only give actions when
+    their direction changes.
+
+    The bindings are compiled again when they have been changed (see
+    InputMap.invalidate).
+    """
+
+    # Incremented each time the bindings of the options change
+    bindings_version = 0
+
+    def __init__(self):
+        """
+        Initialize an InputMap object.
+        """
+
+        self.version = None
+        self.enable_actions = {}
+        self.disable_actions = {}
+        self.hat_states = {}
+        self.axis_states = {}
+
+    @staticmethod
+    def invalidate():
+        """
+        Tell every InputMap that the bindings have changed.
+        """
+
+        InputMap.bindings_version += 1
+
+    def compile(self, keyboard, joystick):
+        """
+        Build the lookup tables from the bindings.
+
+        :type keyboard: dict
+        :param keyboard: A {action name: key code} dictionary.
+
+        :type joystick: dict
+        :param joystick: A {action name: input infos} dictionary (see
+            get_input).
+        """
+
+        self.version = InputMap.bindings_version
+        self.enable_actions.clear()
+        self.disable_actions.clear()
+        self.hat_states.clear()
+        self.axis_states.clear()
+
+        inputs = [
+            (action_name, (KEYDOWN, key, None))
+            for action_name, key in keyboard.items()
+        ]
+        inputs.extend(
+            (action_name, get_input(input_infos))
+            for action_name, input_infos in joystick.items()
+        )
+        for action_name, input_key in inputs:
+            if input_key is None or action_name not in ENABLE_ACTIONS:
+                continue
+            self.enable_actions.setdefault(input_key, []).append(
+                ENABLE_ACTIONS[action_name]
+            )
+            if action_name in DISABLE_ACTIONS:
+                self.disable_actions.setdefault(input_key, []).append(
+                    DISABLE_ACTIONS[action_name]
+                )
+
+    def is_outdated(self):
+        """
+        Check if the bindings have changed since the last compilation.
+
+        :rtype: bool
+        :returns: True if InputMap.compile must be called again.
+        """
+
+        return self.version != InputMap.bindings_version
+
+    def get_actions(self, event):
+        """
+        Get the level actions triggered by an event.
+
+        :type event: pygame.event.Event
+        :param event: The event to translate.
+
+        :rtype: list<int>
+        :returns: The ids of the actions to apply in order.
+        """
+
+        event_type = event.type
+        if event_type == KEYDOWN:
+            return self.enable_actions.get((KEYDOWN, event.key, None), ())
+        if event_type == KEYUP:
+            return self.disable_actions.get((KEYDOWN, event.key, None), ())
+        if event_type == JOYBUTTONDOWN:
+            return self.enable_actions.get((JOYBUTTONDOWN, event.button, None), ())
+        if event_type == JOYBUTTONUP:
+            return self.disable_actions.get((JOYBUTTONDOWN, event.button, None), ())
+        if event_type == JOYHATMOTION:
+            return self.get_motion_actions(
+                JOYHATMOTION, event.hat, tuple(event.value), self.hat_states, (0, 0)
+            )
+        if event_type == JOYAXISMOTION:
+            return self.get_motion_actions(
+                JOYAXISMOTION,
+                event.axis,
+                get_axis_direction(event.value),
+                self.axis_states,
+                0,
+            )
+        return ()
+
+    def get_motion_actions(self, input_type, input_id, value, states, neutral):
+        """
+        Get the actions triggered by a hat or an axis which has moved: the
+        binding of the previous value is released, then the binding of the
+        new value is pressed.
+
+        :type input_type: int
+        :param input_type: JOYHATMOTION or JOYAXISMOTION.
+
+        :type input_id: int
+        :param input_id: The index of the hat or the axis.
+
+        :type value: object
+        :param value: The new value of the hat or the axis direction.
+
+        :type states: dict
+        :param states: The last {input id: value} of this input type.
+
+        :type neutral: object
+        :param neutral: The value when nothing is pressed.
+
+        :rtype: list<int>
+        :returns: The ids of the actions to apply in order.
+        """
+
+        previous_value = states.get(input_id, neutral)
+        if value == previous_value:
+            return ()
+        states[input_id] = value
+        return self.disable_actions.get(
+            (input_type, input_id, previous_value), []
+        ) + self.enable_actions.get((input_type, input_id, value), [])
@@ -22,34 +22,41 @@ Created on 10/04/2018
 """
 
 import os
-
-from pygame.locals import (
-    KEYDOWN,
-    KEYUP,
-    JOYBUTTONDOWN,
-    JOYBUTTONUP,
-    JOYHATMOTION,
-    JOYAXISMOTION,
-)
+import time
 
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
-from game.util import Game
+from game.config import RECORD_REPLAYS
+from game.events import ScoreCrossedEvent, StyleChangedEvent
+from game.replay import (
+    PAUSE,
+    ReplayPlayer,
+    ReplayReader,
+    ReplayWriter,
+    apply_action,
+)
+from game.util import Game, get_external_data_path
 
 from gui.activity import Activity
 from gui.game_over_menu import GameOverMenu
+from gui.input_map import InputMap
 from gui.level_drawer import LevelDrawer
 from gui.pause_menu import PauseMenu
 from gui.text import Text
 
+# Scores from which a layer is added to the music
+DRUMS_SCORE = 5000
+ORGAN_SCORE = 10000
+SPEED_DRUMS_SCORE = 41000
+
 
 class LevelActivity(Activity):
     """
     Activity managing in-game graphical components.
     """
 
-    def __init__(self, window, game_id=0):
+    def __init__(self, window, game_id=0, replay_path=None, replay_speed=1):
         """
         Initialize a new LevelActivity object.
 
@@ -59,19 +66,55 @@ class LevelActivity(Activity):
         :type game_id: int
         :param game_id: (Optional) The id of the game to load. It can be 0 or 1.
             0 = Pyoro, 1 = Pyoro 2. Default is 0.
+
+        :type replay_path: str
+        :param replay_path: (Optional) The path of a replay file to play
+            instead of a new game (game_id is then read from the replay).
+            Default is None.
+
+        :type replay_speed: float
+        :param replay_speed: (Optional) The playback speed of the replay.
+            Default is 1.
         """
 
         self.window = window
-        self.level_drawer = LevelDrawer(self, game_id)
-
-        self.last_level_style_type = 0
-        self.last_level_score = 0
+        self.replay_player = None
+        self.replay_writer = None
+
+        if replay_path:
+            replay_reader = ReplayReader(replay_path)
+            self.level_drawer = LevelDrawer(
+                self,
+                replay_reader.game_id,
+                seed=replay_reader.seed,
+                size=replay_reader.level_size,
+            )
+            self.replay_player = ReplayPlayer(
+                self.level_drawer.level, replay_reader, replay_speed
+            )
+        else:
+            self.level_drawer = LevelDrawer(self, game_id)
+            if RECORD_REPLAYS:
+                self.level_drawer.level.fixed_step = True
+                self.replay_writer = ReplayWriter(
+                    self.get_replay_file_path(), self.level_drawer.level
+                )
 
-        self.joy_hat_states = []
-        self.joy_axis_states = []
+        self.input_map = InputMap()
 
         Activity.__init__(self, window)
-        self.init_joy_states()
+        self.init_level_events()
+
+    def init_level_events(self):
+        """
+        Subscribe to the level events which change the music.
+        """
+
+        level = self.level_drawer.level
+        for threshold in (DRUMS_SCORE, ORGAN_SCORE, SPEED_DRUMS_SCORE):
+            level.state.add_score_threshold(threshold)
+        level.events.subscribe(ScoreCrossedEvent, self.on_score_crossed)
+        level.events.subscribe(StyleChangedEvent, self.on_style_changed)
 
     def init_sounds(self):
         """
@@ -118,23 +161,41 @@ class LevelActivity(Activity):
             anchor=(0, -1),
         )
 
-    def init_joy_states(self):
+    def get_replay_file_path(self):
         """
-        Initialize joystick hat and axis values.
+        Get the path of a new replay file in the external data folder.
+
+        :rtype: str
+        :returns: The path of a replay file which doesn't exist yet.
         """
 
-        best_joy_hats = max(
-            self.window.joysticks, key=lambda x: x.get_numhats(), default=None
-        )
-        best_joy_axis = max(
-            self.window.joysticks, key=lambda x: x.get_numaxes(), default=None
-        )
-        if best_joy_hats:
-            for _ in range(best_joy_hats.get_numhats()):
-                self.joy_hat_states.append(None)
-        if best_joy_axis:
-            for i in range(best_joy_axis.get_numaxes()):
-                self.joy_axis_states.append(None)
+        folder = os.path.join(get_external_data_path(), "replays")
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        replay_id = 1
+        date = time.strftime("%Y-%m-%d")
+        file_path = os.path.join(folder, f"{date}-{replay_id}.pyr")
+        while os.path.exists(file_path):
+            replay_id += 1
+            file_path = os.path.join(folder, f"{date}-{replay_id}.pyr")
+        return file_path
+
+    def do_action(self, action):
+        """
+        Apply an input action to the level (or pause the game) and record it
+        if replays are recorded.
+
+        :type action: int
+        :param action: The id of the action (see game.replay).
+        """
+
+        if self.replay_writer:
+            self.replay_writer.record(self.level_drawer.level.tick, action)
+        if action == PAUSE:
+            self.pause_game()
+        else:
+            apply_action(self.level_drawer.level, action)
 
     # score
     def get_high_score(self):
@@ -167,62 +228,54 @@ class LevelActivity(Activity):
                 "high_score_text"
             ].text = f"High Score: {self.level_drawer.level.score}"
 
+    def on_score_crossed(self, event):
+        """
+        Add a layer to the music when the score reaches its threshold.
+
+        :type event: game.events.ScoreCrossedEvent
+        :param event: The threshold reached by the score.
+        """
+
+        if event.threshold == DRUMS_SCORE:
+            print("[INFO] [LevelActivity.on_score_crossed] Drums added to the music")
+            self.sounds["drums"].play(-1)
+            self.sounds["drums"].set_pos(self.sounds["music_0"].pos)
+
+        elif event.threshold == ORGAN_SCORE:
+            print("[INFO] [LevelActivity.on_score_crossed] Organ added to the music")
+            self.sounds["organ"].play(-1)
+            self.sounds["organ"].set_pos(self.sounds["music_0"].pos)
+
+        elif event.threshold == SPEED_DRUMS_SCORE:
+            print(
+                "[INFO] [LevelActivity.on_score_crossed] Speed drums added to the music"
+            )
+            self.sounds["speed_drums"].play(-1)
+            self.sounds["speed_drums"].set_pos(self.sounds["music_2"].pos)
+
+    def on_style_changed(self, event):
+        """
+        Start the music of the new style (black and white or flashy).
+
+        :type event: game.events.StyleChangedEvent
+        :param event: The style change published by the level.
+        """
+
+        if event.style_type in (1, 2):
+            print(
+                "[INFO] [LevelActivity.on_style_changed] Music "
+                + f"{event.style_type + 1} started"
+            )
+            Game.audio_player.set_speed(1)
+            Game.audio_player.stop_audio()
+            self.sounds[f"music_{event.style_type}"].play(-1)
+
     def update_sounds(self, delta_time):
         """
-        Start or stop musics according to the current score.
-        """
-
-        style_type = self.level_drawer.level.get_style_type_with_score()
-
-        # Normal style
-        if style_type == 0:
-            if self.last_level_score != self.level_drawer.level.score:
-
-                if (
-                    self.last_level_score < 5000
-                    and self.level_drawer.level.score >= 5000
-                ):
-                    print(
-                        "[INFO] [LevelActivity.update_sounds] Drums added to the music"
-                    )
-                    self.sounds["drums"].play(-1)
-                    self.sounds["drums"].set_pos(self.sounds["music_0"].pos)
-
-                elif (
-                    self.last_level_score < 10000
-                    and self.level_drawer.level.score >= 10000
-                ):
-                    print(
-                        "[INFO] [LevelActivity.update_sounds] Organ added to the music"
-                    )
-                    self.sounds["organ"].play(-1)
-                    self.sounds["organ"].set_pos(self.sounds["music_0"].pos)
-
-        # Black and white style
-        elif style_type == 1:
-            if self.last_level_style_type != style_type:
-                print("[INFO] [LevelActivity.update_sounds] Music 2 started")
-                Game.audio_player.set_speed(1)
-                Game.audio_player.stop_audio()
-                self.sounds["music_1"].play(-1)
-
-        # Flashy style
-        elif style_type == 2:
-            if self.last_level_style_type != style_type:
-                print("[INFO] [LevelActivity.update_sounds] Music 3 started")
-                Game.audio_player.set_speed(1)
-                Game.audio_player.stop_audio()
-                self.sounds["music_2"].play(-1)
-
-            if self.last_level_score < 41000 and self.level_drawer.level.score >= 41000:
-                print(
-                    "[INFO] [LevelActivity.update_sounds] Speed drums added to the music"
-                )
-                self.sounds["speed_drums"].play(-1)
-                self.sounds["speed_drums"].set_pos(self.sounds["music_2"].pos)
+        Speed up the music while Pyoro is alive. Musics are started by the
+        level events (see LevelActivity.init_level_events).
+        """
 
-        self.last_level_style_type = style_type
-        self.last_level_score = self.level_drawer.level.score
         if not self.level_drawer.level.pyoro.dead:
             Game.audio_player.set_speed(
                 Game.audio_player.get_speed() + 0.002 * delta_time
@@ -233,6 +286,8 @@ class LevelActivity(Activity):
         Save the score and the game_id of the current level.
         """
 
+        if self.replay_player:
+            return
         if self.level_drawer.level.score > self.get_high_score():
             self.set_high_score(self.level_drawer.level.score)
         Game.options["last game"] = self.level_drawer.level.game_id
@@ -310,81 +365,20 @@ class LevelActivity(Activity):
 
     def update_event(self, event):
         """
-        Update the level with
+        Update the level with the actions bound to an event (see
+        gui.input_map.InputMap).
+
+        :type event: pygame.event.Event
+        :param event: The event to handle.
         """
 
-        if self.level_drawer.level.loop_active:
-            keyboard = Game.options.get("keyboard", {})
-            joystick = Game.options.get("joystick", {})
-            pyoro = self.level_drawer.level.pyoro
-
-            enable_keys = {
-                "left": pyoro.enable_move_left,
-                "right": pyoro.enable_move_right,
-                "action": pyoro.enable_capacity,
-                "pause": self.pause_game,
-            }
-            disable_keys = {
-                "left": pyoro.disable_move,
-                "right": pyoro.disable_move,
-                "action": pyoro.disable_capacity,
-                "pause": lambda: None,
-            }
-
-            if event.type == KEYDOWN:
-                for action_name, action in enable_keys.items():
-                    if event.key == keyboard.get(action_name, None):
-                        action()
-
-            elif event.type == KEYUP:
-                for action_name, action in disable_keys.items():
-                    if event.key == keyboard.get(action_name, None):
-                        action()
-
-            elif event.type == JOYBUTTONDOWN:
-                for action_name, input_infos in joystick.items():
-                    if input_infos["inputType"] == JOYBUTTONDOWN:
-                        if input_infos["buttonId"] == event.button:
-                            enable_keys[action_name]()
-
-            elif event.type == JOYBUTTONUP:
-                for action_name, input_infos in joystick.items():
-                    if input_infos["inputType"] == JOYBUTTONDOWN:
-                        if input_infos["buttonId"] == event.button:
-                            disable_keys[action_name]()
-
-            elif event.type == JOYHATMOTION:
-                enabled = event.value
-                disabled = self.joy_hat_states[event.hat]
-                self.joy_hat_states[event.hat] = enabled
-
-                for action_name, input_infos in joystick.items():
-                    if input_infos["inputType"] == JOYHATMOTION:
-                        if input_infos["hatId"] == event.hat:
-                            if input_infos["value"] == enabled:
-                                enable_keys[action_name]()
-                            elif input_infos["value"] == disabled:
-                                disable_keys[action_name]()
-
-            elif event.type == JOYAXISMOTION:
-                enabled = event.value
-                disabled = self.joy_axis_states[event.axis]
-                self.joy_axis_states[event.axis] = enabled
-
-                for action_name, input_infos in joystick.items():
-                    if input_infos["inputType"] == JOYAXISMOTION:
-                        if input_infos["axisId"] == event.axis:
-                            if (
-                                input_infos["value"] / enabled > 0
-                                and abs(event.value) > 0.2
-                            ):
-                                enable_keys[action_name]()
-                            elif disabled:
-                                if (
-                                    input_infos["value"] / disabled > 0
-                                    or abs(event.value) <= 0.2
-                                ):
-                                    disable_keys[action_name]()
+        if self.level_drawer.level.loop_active and not self.replay_player:
+            if self.input_map.is_outdated():
+                self.input_map.compile(
+                    Game.options.get("keyboard", {}), Game.options.get("joystick", {})
+                )
+            for action in self.input_map.get_actions(event):
+                self.do_action(action)
 
         Activity.update_event(self, event)
 
@@ -397,7 +391,11 @@ class LevelActivity(Activity):
             seconds).
         """
 
-        self.level_drawer.update(delta_time)
+        if self.replay_player:
+            self.replay_player.update(delta_time)
+            self.level_drawer.draw()
+        else:
+            self.level_drawer.update(delta_time)
         if self.level_drawer.level.loop_active:
             self.update_score()
             self.update_sounds(delta_time)
@@ -409,4 +407,6 @@ class LevelActivity(Activity):
         """
 
         self.save_level_state()
+        if self.replay_writer:
+            self.replay_writer.close(self.level_drawer.level.tick)
         Activity.destroy(self)
@@ -27,9 +27,17 @@ import pygame
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
-from game.config import CASE_SIZE, BACKGROUND_TRANSITION_DURATION, LEVEL_IMAGE_PATH
+from game.config import (
+    CASE_SIZE,
+    BACKGROUND_TRANSITION_DURATION,
+    DIRTY_RECT_RENDERING,
+    LEVEL_IMAGE_PATH,
+    PLANNING_BOT,
+)
+from game.events import BackgroundChangedEvent
 from game.level import Level
-from game.util import get_monitor_density, get_screen_size
+from game.planner import Planner
+from game.util import get_monitor_density, get_screen_size, Game
 from gui.image_transformer import resize_image
 
 
@@ -39,7 +47,7 @@ class LevelDrawer:
             entities on the screen.
     """
 
-    def __init__(self, activity, game_id, bot_mode=False):
+    def __init__(self, activity, game_id, bot_mode=False, seed=None, size=None):
         """
         Initialize a new LevelDrawer object, create a new level and load
                 background images.
@@ -54,6 +62,14 @@ class LevelDrawer:
         :type bot_mode: bool
         :param bot_mode: (Optional) Define if Pyoro have to be replaced by
                 Pyobot. Default is False.
+
+        :type seed: int
+        :param seed: (Optional) The seed of the level random generator (see
+                game.level.Level). Default is None.
+
+        :type size: tuple
+        :param size: (Optional) The (width, height) size of the level (in
+                case). Default is computed from the screen size.
         """
 
         self.activity = activity
@@ -61,14 +77,18 @@ class LevelDrawer:
         self.case_size = ()
         self.level = None
 
-        self.init_level(game_id, bot_mode)
+        self.init_level(game_id, bot_mode, seed, size)
 
-        self.last_background_id = self.level.get_background_id_with_score()
         self.last_background = None
+        self.level.events.subscribe(
+            BackgroundChangedEvent, self.on_background_changed
+        )
+        self.static_scene_state = None
+        self.static_layer = None
 
         self.init_images()
 
-    def init_level(self, game_id, bot_mode):
+    def init_level(self, game_id, bot_mode, seed=None, size=None):
         """
         Create a new level with given game_id and bot_mode value.
 
@@ -79,9 +99,21 @@ class LevelDrawer:
         :type bot_mode: bool
         :param bot_mode: Define if Pyoro have to be replaced by Pyobot. Default
                 is False.
+
+        :type seed: int
+        :param seed: (Optional) The seed of the level random generator.
+                Default is None.
+
+        :type size: tuple
+        :param size: (Optional) The (width, height) size of the level (in
+                case). Default is computed from the screen size.
         """
 
-        self.level = Level(self, game_id, self.get_level_size(), bot_mode)
+        size = size or self.get_level_size()
+        self.level = Level(self, game_id, size, bot_mode, seed)
+
+        if bot_mode and PLANNING_BOT:
+            self.level.bot_controller = Planner(self.level)
 
     def get_level_size(self):
         """
@@ -118,6 +150,61 @@ class LevelDrawer:
             self.case_size = screen_width / case_width, screen_height / case_height
         return self.case_size
 
+    def get_entity_images(self, folder_name, size, alpha_channel=True):
+        """
+        Get the resized images of an entity folder from the window sprite
+                cache (see gui.sprite_cache.SpriteCache).
+
+        :type folder_name: str
+        :param folder_name: The name of the folder (in ENTITIES_IMAGE_PATH)
+                where the images are.
+
+        :type size: list<float>
+        :param size: The (width, height) size of the entity (in case).
+
+        :type alpha_channel: bool
+        :param alpha_channel: (Optional) See gui.window.Window.get_image.
+                Images without alpha channel are copied because the entity
+                can change their opacity. Default is True.
+
+        :rtype: dict
+        :returns: A {image_name: pygame.surface.Surface} dictionary.
+        """
+
+        images = self.activity.window.sprite_cache.get_images(
+            folder_name, size, self.get_case_size(), alpha_channel
+        )
+        if alpha_channel:
+            return dict(images)
+        return {image_name: image.copy() for image_name, image in images.items()}
+
+    def get_entity_sprites(self, images, sprite_table):
+        """
+        Compile the images of an entity in a list indexed by sprite id.
+
+        :type images: dict
+        :param images: The images of the entity (see
+                LevelDrawer.get_entity_images).
+
+        :type sprite_table: game.animation.SpriteTable
+        :param sprite_table: The image names of the entity sprites.
+
+        :rtype: list<pygame.surface.Surface>
+        :returns: The images in the sprite table order.
+        """
+
+        return [images[image_name] for image_name in sprite_table.image_names]
+
+    def get_audio_player(self):
+        """
+        Get the audio player used by the entities of the level.
+
+        :rtype: audio.audio_player.AudioPlayer
+        :returns: The audio player currently used by the game.
+        """
+
+        return Game.audio_player
+
     def init_images(self):
         """
         Initialize background images.
@@ -141,6 +228,7 @@ class LevelDrawer:
                 ),
                 size,
             )
+            self.images[image_name].set_alpha(255)
 
     def draw_pyoro(self):
         """
@@ -178,71 +266,135 @@ class LevelDrawer:
                 y_pos = int(pos[1] * self.case_size[1] + 5)
                 tongue_coords[key] = (x_pos, y_pos)
 
-            pygame.draw.polygon(
-                self.activity.window.root_surface, color[0], tongue_coords
+            window = self.activity.window
+            window.mark_drawn(
+                pygame.draw.polygon(window.root_surface, color[0], tongue_coords)
             )
-            pygame.draw.line(
-                self.activity.window.root_surface,
-                color[1],
-                tongue_coords[0],
-                tongue_coords[1],
-                int(0.115 * case_size[0]),
+            window.mark_drawn(
+                pygame.draw.line(
+                    window.root_surface,
+                    color[1],
+                    tongue_coords[0],
+                    tongue_coords[1],
+                    int(0.115 * case_size[0]),
+                )
             )
-            pygame.draw.line(
-                self.activity.window.root_surface,
-                color[1],
-                tongue_coords[2],
-                tongue_coords[3],
-                int(3.68),
+            window.mark_drawn(
+                pygame.draw.line(
+                    window.root_surface,
+                    color[1],
+                    tongue_coords[2],
+                    tongue_coords[3],
+                    int(3.68),
+                )
             )
 
         self.activity.window.draw_image(
-            pyoro.images[pyoro.current_image_name],
+            pyoro.sprites[pyoro.sprite_id],
             (
                 (pyoro.pos[0] - pyoro.size[0] / 2) * case_size[0],
                 (pyoro.pos[1] - pyoro.size[1] / 2) * case_size[1],
             ),
         )
 
-    def draw_background(self):
+    def draw_background(self, surface):
         """
         Draw the appropriate background image by handling smooth transition
                 animations between different background images.
-        """
 
-        back_id = self.level.get_background_id_with_score()
-        background = self.images[f"background_{back_id}.png"]
+        :type surface: pygame.Surface
+        :param surface: The surface where to draw the background.
+        """
 
-        if back_id == 0:
-            background.set_alpha(255)
-        else:
-            if self.last_background_id != back_id:
-                self.last_background = self.images[
-                    f"background_{self.last_background_id}.png"
-                ]
-                self.last_background_id = back_id
+        background = self.images[
+            f"background_{self.level.get_background_id_with_score()}.png"
+        ]
+        if background.get_alpha() != 255:
+            surface.blit(self.last_background, (0, 0))
+        surface.blit(background, (0, 0))
 
-                self.last_background.set_alpha(255)
-                background.set_alpha(0)
+    def on_background_changed(self, event):
+        """
+        Start a transition animation when the background changes.
 
-                self.update_background_transition(0)
-            if background.get_alpha() != 255:
-                self.activity.window.draw_image(self.last_background, (0, 0))
-        self.activity.window.draw_image(background, (0, 0))
+        :type event: game.events.BackgroundChangedEvent
+        :param event: The background change published by the level.
+        """
 
-    def draw_blocks(self):
+        background = self.images[f"background_{event.background_id}.png"]
+        if event.background_id == 0:
+            self.level.remove_action_delay((self, "update_background_transition"))
+            background.set_alpha(255)
+        else:
+            self.last_background = self.images[
+                f"background_{event.previous_background_id}.png"
+            ]
+            self.last_background.set_alpha(255)
+            background.set_alpha(0)
+            self.update_background_transition(0)
+
+    def draw_blocks(self, surface):
         """
         Draw the cases which are not destroyed.
+
+        :type surface: pygame.Surface
+        :param surface: The surface where to draw the blocks.
         """
 
         _, height = self.activity.window.get_size()
         case_size = self.get_case_size()
-        for i in range(self.level.size[0]):
-            if self.level.cases[i].exists:
-                self.activity.window.draw_image(
-                    self.images[f"block_{self.level.get_style_type_with_score()}.png"],
-                    (i * case_size[0], height - case_size[1]),
-                )
+        block = self.images[f"block_{self.level.get_style_type_with_score()}.png"]
+        for i in self.level.floor.get_block_positions():
+            surface.blit(block, (i * case_size[0], height - case_size[1]))
+
+    def build_static_layer(self):
+        """
+        Draw the background and the blocks on the static layer. The static
+                layer is only rebuilt when the background, the style or the
+                blocks change, so drawing the static scene costs one blit.
+        """
+
+        if not self.static_layer:
+            self.static_layer = pygame.Surface(
+                self.activity.window.get_size()
+            ).convert()
+        self.draw_background(self.static_layer)
+        self.draw_blocks(self.static_layer)
+
+    def has_static_scene_changed(self):
+        """
+        Check if the background (or its opacity during a transition), the
+                style or the blocks have changed since the last frame.
+
+        :rtype: bool
+        :returns: True if the whole screen has to be redrawn.
+        """
+
+        back_id = self.level.get_background_id_with_score()
+        state = (
+            back_id,
+            self.images[f"background_{back_id}.png"].get_alpha(),
+            self.level.get_style_type_with_score(),
+            self.level.floor.version,
+        )
+        changed = state != self.static_scene_state
+        self.static_scene_state = state
+        return changed
+
+    def restore_static_scene(self, rects):
+        """
+        Redraw the static layer only inside some parts of the screen to erase
+                what has been drawn over it.
+
+        :type rects: list<pygame.Rect>
+        :param rects: The parts of the screen to restore.
+        """
+
+        window = self.activity.window
+        for rect in rects:
+            window.mark_dirty(
+                window.root_surface.blit(self.static_layer, rect.topleft, rect)
+            )
 
     def update_background_transition(self, opacity):
         """
@@ -274,24 +426,44 @@ class LevelDrawer:
         """
 
         width, height = self.get_case_size()
+        time = self.level.get_time()
+        style_type = self.level.get_style_type_with_score()
         for entity in self.level.entities:
             x_pos = (entity.pos[0] - entity.size[0] / 2) * width
             y_pos = (entity.pos[1] - entity.size[1] / 2) * height
             self.activity.window.draw_image(
-                entity.images[entity.current_image_name], (x_pos, y_pos)
+                entity.sprites[entity.get_sprite_id(time, style_type)],
+                (x_pos, y_pos),
             )
 
     def update(self, delta_time):
         """
-        Update the level drawer by drawing background, blocks, Pyoro and
-                entities images.
+        Update the level and draw it.
 
         :type delta_time: float
         :param delta_time: Time elapsed since the last update.
         """
 
         self.level.update(delta_time)
-        self.draw_background()
-        self.draw_blocks()
+        self.draw()
+
+    def draw(self):
+        """
+        Draw the static layer (background and blocks), Pyoro and entities
+                images. With DIRTY_RECT_RENDERING, the static layer is only
+                redrawn where something has been drawn during the last frame,
+                unless it has changed.
+        """
+
+        window = self.activity.window
+        changed = self.has_static_scene_changed()
+        if changed:
+            self.build_static_layer()
+
+        if DIRTY_RECT_RENDERING and not changed:
+            self.restore_static_scene(window.last_drawn_rects)
+        else:
+            window.request_full_update()
+            window.root_surface.blit(self.static_layer, (0, 0))
         self.draw_pyoro()
         self.draw_entities()
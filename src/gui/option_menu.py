@@ -31,6 +31,7 @@ from game.config import GUI_IMAGE_PATH, NAME, VERSION
 from game.util import get_key_name, get_joy_key_name, reset_game, Game
 
 from gui.button import Button
+from gui.input_map import InputMap
 from gui.setting_bar import SettingBar
 from gui.text import Text
 from gui.menu_widget import MenuWidget
@@ -448,6 +449,7 @@ class OptionMenu(MenuWidget):
         if "keyboard" not in Game.options:
             Game.options["keyboard"] = {}
         Game.options["keyboard"][action_name] = key_code
+        InputMap.invalidate()
 
     def set_joystick_option(self, action_name, **inputKwargs):
         """
@@ -462,6 +464,7 @@ class OptionMenu(MenuWidget):
         if "joystick" not in Game.options:
             Game.options["joystick"] = {}
         Game.options["joystick"][action_name] = inputKwargs
+        InputMap.invalidate()
 
     def update(self, delta_time):
         """
@@ -0,0 +1,167 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide a cache of resized entity images shared by all levels.
+
+Created on 17/10/2026
+"""
+
+import os
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import ENTITIES_IMAGE_PATH
+from gui.image_transformer import resize_image
+
+
+class SpriteCache:
+    """
+    Store the resized images of each entity folder by (folder, entity size,
+    case size). When the case size changes (new resolution), the images
+    resized for the previous case size are evicted.
+    """
+
+    def __init__(self, window):
+        """
+        Initialize a SpriteCache object.
+
+        :type window: gui.window.Window
+        :param window: The window giving the loaded images.
+        """
+
+        self.window = window
+        self.sprites = {}
+        self.case_size = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_images(self, folder_name, size, case_size, alpha_channel=True):
+        """
+        Get the resized images of an entity folder. Images are loaded and
+        resized only the first time.
+
+        :type folder_name: str
+        :param folder_name: The name of the folder (in ENTITIES_IMAGE_PATH)
+            where the images are.
+
+        :type size: list<float>
+        :param size: The (width, height) size of the entity (in case).
+
+        :type case_size: tuple
+        :param case_size: The (width, height) size of a case (in pixel).
+
+        :type alpha_channel: bool
+        :param alpha_channel: (Optional) See gui.window.Window.get_image.
+            Default is True.
+
+        :rtype: dict
+        :returns: A {image_name: pygame.surface.Surface} dictionary. It's
+            shared by all entities so it mustn't be modified.
+        """
+
+        case_size = tuple(case_size)
+        if case_size != self.case_size:
+            self.evict(case_size)
+
+        key = (folder_name, tuple(size), case_size, alpha_channel)
+        if key in self.sprites:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.sprites[key] = self.load_images(
+                folder_name, size, case_size, alpha_channel
+            )
+        return self.sprites[key]
+
+    def load_images(self, folder_name, size, case_size, alpha_channel):
+        """
+        Load and resize all the images of an entity folder.
+
+        :type folder_name: str
+        :param folder_name: The name of the folder (in ENTITIES_IMAGE_PATH)
+            where the images are.
+
+        :type size: list<float>
+        :param size: The (width, height) size of the entity (in case).
+
+        :type case_size: tuple
+        :param case_size: The (width, height) size of a case (in pixel).
+
+        :type alpha_channel: bool
+        :param alpha_channel: See gui.window.Window.get_image.
+
+        :rtype: dict
+        :returns: A {image_name: pygame.surface.Surface} dictionary.
+        """
+
+        images = {}
+        folder = os.path.join(ENTITIES_IMAGE_PATH, folder_name)
+
+        for image_name in os.listdir(folder):
+            if image_name.split(".")[-1] == "png":
+                images[image_name] = resize_image(
+                    self.window.get_image(
+                        os.path.join(folder, image_name), alpha_channel
+                    ),
+                    (case_size[0] * size[0], case_size[1] * size[1]),
+                )
+        return images
+
+    def evict(self, case_size):
+        """
+        Remove the images resized for another case size.
+
+        :type case_size: tuple
+        :param case_size: The new (width, height) size of a case (in pixel).
+        """
+
+        if self.sprites:
+            print(
+                "[INFO] [SpriteCache.evict] Case size changed to "
+                + f"{case_size}, evicting {len(self.sprites)} sprite folders"
+            )
+        self.evictions += len(self.sprites)
+        self.sprites.clear()
+        self.case_size = case_size
+
+    def clear(self):
+        """
+        Remove all images from the cache.
+        """
+
+        self.sprites.clear()
+        self.case_size = None
+
+    def get_stats(self):
+        """
+        Get the cache counters.
+
+        :rtype: dict
+        :returns: A dictionary with the number of "hits", "misses",
+            "evictions" and the number of cached "folders".
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "folders": len(self.sprites),
+        }
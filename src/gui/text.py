@@ -27,7 +27,8 @@ import pygame.freetype
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
-from game.config import GUI_IMAGE_PATH
+from game.config import GUI_IMAGE_PATH, TEXT_CACHE_SIZE
+from gui.text_cache import TextCache
 from gui.widget import Widget
 
 
@@ -71,6 +72,7 @@ class Text(Widget):
         Text.update_default_kwargs(kwargs)
         Widget.__init__(self, activity, pos, **kwargs)
         self.text = text
+        self.render_cache = TextCache(TEXT_CACHE_SIZE)
         self.create_font()
 
     def create_font(self):
@@ -92,18 +94,57 @@ class Text(Widget):
             seconds).
         """
 
-        surface, rect = self.font.render(
-            self.text, bgcolor=self.kwargs["background_color"])
+        surface, rect = self.render()
         self.kwargs["size"] = [rect.width, rect.height]
         self.activity.window.draw_image(surface, self.get_real_pos())
         Widget.update(self, delta_time)
 
+    def render(self):
+        """
+        Render the text with the current font, or reuse the surface rendered
+        for the same text, font, size, style and colors.
+
+        :rtype: tuple
+        :returns: A (pygame.Surface, pygame.Rect) tuple.
+        """
+
+        background_color = self.kwargs["background_color"]
+        key = (
+            self.text,
+            self.kwargs["font"],
+            self.font.size,
+            self.font.strong,
+            self.font.wide,
+            self.font.oblique,
+            self.font.underline,
+            self.font.vertical,
+            tuple(self.font.fgcolor),
+            tuple(background_color) if background_color else None,
+        )
+        render = self.render_cache.get(key)
+        if not render:
+            render = self.font.render(self.text, bgcolor=background_color)
+            self.render_cache.add(key, render)
+        return render
+
+    def get_cache_stats(self):
+        """
+        Get the counters of the rendered text cache.
+
+        :rtype: dict
+        :returns: See gui.text_cache.TextCache.get_stats.
+        """
+
+        return self.render_cache.get_stats()
+
     def config(self, **kwargs):
         """
-        Change some kwargs of the widget (font, font_size, bold, ...).
+        Change some kwargs of the widget (font, font_size, bold, ...). The
+        rendered text cache is cleared.
         """
 
         Widget.config(self, **kwargs)
+        self.render_cache.clear()
         if "font" in kwargs:
             self.create_font()
         else:
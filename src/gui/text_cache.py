@@ -0,0 +1,110 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+"""
+Provide a least recently used cache of rendered text surfaces.
+
+Created on 17/10/2026
+"""
+
+from collections import OrderedDict
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+
+class TextCache:
+    """
+    Store rendered text surfaces by render key (text, font, size, style and
+    colors). When the cache is full, the least recently used surface is
+    evicted.
+    """
+
+    def __init__(self, max_size):
+        """
+        Initialize a TextCache object.
+
+        :type max_size: int
+        :param max_size: The maximum number of surfaces to keep.
+        """
+
+        self.max_size = max_size
+        self.renders = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Get a rendered text and mark it as recently used.
+
+        :type key: tuple
+        :param key: The render key of the text.
+
+        :rtype: tuple
+        :returns: A (pygame.Surface, pygame.Rect) tuple or None if the text
+            has not been rendered with this key.
+        """
+
+        render = self.renders.get(key)
+        if render:
+            self.hits += 1
+            self.renders.move_to_end(key)
+        else:
+            self.misses += 1
+        return render
+
+    def add(self, key, render):
+        """
+        Store a rendered text and evict the least recently used one if the
+        cache is full.
+
+        :type key: tuple
+        :param key: The render key of the text.
+
+        :type render: tuple
+        :param render: A (pygame.Surface, pygame.Rect) tuple.
+        """
+
+        self.renders[key] = render
+        if len(self.renders) > self.max_size:
+            self.renders.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all rendered texts from the cache.
+        """
+
+        self.renders.clear()
+
+    def get_stats(self):
+        """
+        Get the cache counters.
+
+        :rtype: dict
+        :returns: A dictionary with the number of "hits", "misses",
+            "evictions" and the number of cached "renders".
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "renders": len(self.renders),
+        }
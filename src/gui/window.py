@@ -28,11 +28,12 @@ from pygame.locals import QUIT, K_F4, K_RALT, K_LALT
 __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
-from game.config import NAME, GUI_IMAGE_PATH
+from game.config import DIRTY_RECT_RENDERING, NAME, GUI_IMAGE_PATH
 from game.util import get_resource_paths, leave_game, Game, Errors
 from gui.level_activity import LevelActivity
 from gui.menu_activity import MenuActivity
 from gui.splash_activity import SplashActivity
+from gui.sprite_cache import SpriteCache
 
 
 class Window:
@@ -46,10 +47,16 @@ class Window:
         """
 
         self.images = {}
+        self.sprite_cache = SpriteCache(self)
         self.joysticks = []
         self.root_surface = None
         self.activity = None
 
+        self.full_update = True
+        self.dirty_rects = []
+        self.drawn_rects = []
+        self.last_drawn_rects = []
+
     def create_root_surface(self):
         """
         Create a pygame window in fullscreen mode.
@@ -92,6 +99,7 @@ class Window:
         """
 
         print("[INFO] [Window.initImages] Loading images to RAM memory")
+        self.sprite_cache.clear()
         self.images["unknown"] = self.create_remplacement_image()
         image_paths = get_resource_paths("images")
         for image_path in image_paths:
@@ -181,7 +189,46 @@ class Window:
 
         if self.activity:
             self.activity.update(delta_time)
-        pygame.display.update()
+
+        if DIRTY_RECT_RENDERING and not self.full_update:
+            pygame.display.update(self.dirty_rects)
+        else:
+            pygame.display.update()
+
+        self.full_update = False
+        self.last_drawn_rects = self.drawn_rects
+        self.drawn_rects = []
+        self.dirty_rects = []
+
+    def request_full_update(self):
+        """
+        Update the whole screen at the end of the current frame.
+        """
+
+        self.full_update = True
+
+    def mark_dirty(self, rect):
+        """
+        Update a part of the screen at the end of the current frame.
+
+        :type rect: pygame.Rect
+        :param rect: The part of the screen which has been changed.
+        """
+
+        self.dirty_rects.append(rect)
+
+    def mark_drawn(self, rect):
+        """
+        Update a part of the screen at the end of the current frame and
+        remember it as drawn (see Window.last_drawn_rects) so it can be
+        erased during the next frame.
+
+        :type rect: pygame.Rect
+        :param rect: The part of the screen where something has been drawn.
+        """
+
+        self.dirty_rects.append(rect)
+        self.drawn_rects.append(rect)
 
     def destroy(self):
         """
@@ -197,6 +244,7 @@ class Window:
         Destroy the current activity and stop sounds and musics.
         """
 
+        self.request_full_update()
         if self.activity:
             print("[INFO] [Window.destroy_activity] Destroying "
                   + "the current activity")
@@ -271,6 +319,23 @@ class Window:
                 f"[FATAL ERROR] [Window.set_game_render] Unknown game_id {game_id}")
             leave_game(Errors.CODE_ERROR)
 
+    def set_replay_render(self, replay_path, speed=1):
+        """
+        Replace the current activity by a new
+        gui.levelActivity.LevelActivity playing a replay file.
+
+        :type replay_path: str
+        :param replay_path: The path of the replay file (see game.replay).
+
+        :type speed: float
+        :param speed: (Optional) The playback speed. Default is 1.
+        """
+
+        self.destroy_activity()
+        print(
+            f"[INFO] [Window.set_replay_render] Creating level activity playing {replay_path}")
+        self.activity = LevelActivity(self, replay_path=replay_path, replay_speed=speed)
+
     def draw_image(self, image, pos):
         """
         Draw an image on the screen.
@@ -281,10 +346,15 @@ class Window:
         :type pos: tuple<int>
         :param pos: The (x, y) position of the surface on the screen.
             (0, 0) = the top left corner of the screen.
+
+        :rtype: pygame.Rect
+        :returns: The part of the screen which has been drawn.
         """
 
         if self.root_surface:
-            self.root_surface.blit(image, pos)
+            rect = self.root_surface.blit(image, pos)
+            self.mark_drawn(rect)
+            return rect
         else:
             print("[WARNING] [Window.draw_image] No root surface to draw on")
 
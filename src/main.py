@@ -30,7 +30,9 @@ __author__ = "RedbeanGit"
 __repo__ = "https://github.com/RedbeanGit/Pyoro"
 
 from audio.audio_player import AudioPlayer
+from game.batch import run_batch
 from game.debug_logger import DebugLogger
+from game.headless import check_physics, run_headless, run_replay
 from game.mod import Mod
 from game.util import Errors, Game, leave_game, load_config
 from gui.window import Window
@@ -79,6 +81,65 @@ def update():
         leave_game(Errors.UPDATE_ERROR)
 
 
+def batch(nb_games=100):
+    """
+    Play many bot games on all the processor cores and print their mean
+    results.
+
+    :type nb_games: int
+    :param nb_games: (Optional) The number of games per game id (seeds 0 to
+        nb_games - 1). Default is 100.
+    """
+
+    print("[INFO] [batch] Starting Pyoro in batch mode")
+    for game_id in (0, 1):
+        results = run_batch(game_id, range(nb_games))
+        print(
+            f"[INFO] [batch] game_id={game_id} games={nb_games} "
+            + f"mean_score={results['score'].mean():.1f} "
+            + f"mean_time={results['time'].mean():.2f}s "
+            + f"mean_beans={results['beans'].mean():.1f}"
+        )
+
+
+def headless(seed=None):
+    """
+    Run bot games without display nor audio and print their results.
+
+    :type seed: int
+    :param seed: (Optional) The seed of the games. A random seed is chosen if
+        undefined.
+    """
+
+    print("[INFO] [headless] Starting Pyoro in headless mode")
+    for game_id in (0, 1):
+        results = run_headless(game_id, seed=seed)
+        print(
+            f"[INFO] [headless] game_id={game_id} score={results['score']} "
+            + f"time={results['time']:.2f}s frames={results['frames']} "
+            + f"seed={results['seed']}"
+        )
+
+
+def physics(nb_games=5):
+    """
+    Check that the NumPy physics backend plays the same bot games as the
+    entities themselves and print the results.
+
+    :type nb_games: int
+    :param nb_games: (Optional) The number of games per game id (seeds 0 to
+        nb_games - 1). Default is 5.
+    """
+
+    print("[INFO] [physics] Comparing the physics backends")
+    for game_id in (0, 1):
+        for seed, frame in check_physics(game_id, range(nb_games)).items():
+            print(
+                f"[INFO] [physics] game_id={game_id} seed={seed} "
+                + ("identical" if frame is None else f"differ at frame {frame}")
+            )
+
+
 def loop():
     """
     Create an infinite loop and update game components.
@@ -107,11 +168,35 @@ def loop():
             leave_game(Errors.LOOP_ERROR)
 
 
+def replay(replay_path):
+    """
+    Play a replay file without display nor audio and print its results.
+
+    :type replay_path: str
+    :param replay_path: The path of the replay file.
+    """
+
+    print(f"[INFO] [replay] Playing {replay_path} in headless mode")
+    results = run_replay(replay_path)
+    print(
+        f"[INFO] [replay] score={results['score']} time={results['time']:.2f}s "
+        + f"frames={results['frames']} seed={results['seed']}"
+    )
+
+
 if __name__ == "__main__":
     os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
     if len(sys.argv) > 1:
         if sys.argv[1] == "update":
             update()
+        elif sys.argv[1] == "headless":
+            headless(int(sys.argv[2]) if len(sys.argv) > 2 else None)
+        elif sys.argv[1] == "batch":
+            batch(int(sys.argv[2]) if len(sys.argv) > 2 else 100)
+        elif sys.argv[1] == "physics":
+            physics(int(sys.argv[2]) if len(sys.argv) > 2 else 5)
+        elif sys.argv[1] == "replay" and len(sys.argv) > 2:
+            replay(sys.argv[2])
         else:
             print(f"[WARNING] [GLOBAL] unknown argument {sys.argv[1]}")
             if len(sys.argv) > 2:
@@ -0,0 +1,39 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Test the NumPy physics backend against the scalar updates (see
+game.physics).
+
+Created on 17/10/2026
+"""
+
+import pytest
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.headless import check_physics
+
+
+@pytest.mark.parametrize("game_id", (0, 1))
+def test_same_games(game_id):
+    assert check_physics(game_id, seeds=(0, 1), duration=120) == {
+        0: None,
+        1: None,
+    }
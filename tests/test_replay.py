@@ -0,0 +1,147 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Test replay files (see game.replay).
+
+Created on 17/10/2026
+"""
+
+import random
+
+import pytest
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import FIXED_DELTA_TIME
+from game.headless import HeadlessLevelDrawer, get_level_state
+from game.replay import (
+    DISABLE_CAPACITY,
+    ENABLE_CAPACITY,
+    END,
+    MOVE_LEFT,
+    MOVE_RIGHT,
+    REPLAY_CHUNK_SIZE,
+    REPLAY_HEADER,
+    STOP_MOVE,
+    ReplayPlayer,
+    ReplayReader,
+    ReplayWriter,
+    apply_action,
+)
+
+# The actions a player can record
+ACTIONS = (MOVE_LEFT, MOVE_RIGHT, STOP_MOVE, ENABLE_CAPACITY, DISABLE_CAPACITY)
+
+
+def write_replay(file_path, level, events, end_tick):
+    """
+    Write a replay file.
+
+    :type file_path: str
+    :param file_path: The path of the replay file.
+
+    :type level: game.level.Level
+    :param level: The recorded level.
+
+    :type events: list
+    :param events: The (tick, action) tuples to record.
+
+    :type end_tick: int
+    :param end_tick: The tick of the END marker.
+    """
+
+    replay_writer = ReplayWriter(file_path, level)
+    for tick, action in events:
+        replay_writer.record(tick, action)
+    replay_writer.close(end_tick)
+
+
+def test_header(tmp_path):
+    file_path = str(tmp_path / "header.pyrp")
+    level = HeadlessLevelDrawer(1, seed=42).level
+    write_replay(file_path, level, [], 0)
+
+    replay_reader = ReplayReader(file_path)
+    assert replay_reader.game_id == 1
+    assert replay_reader.seed == 42
+    assert replay_reader.level_size == tuple(level.size)
+    assert replay_reader.step_time == FIXED_DELTA_TIME
+    assert list(replay_reader) == [(0, END)]
+
+
+def test_large_tick_gaps(tmp_path):
+    file_path = str(tmp_path / "gaps.pyrp")
+    events = [
+        (0, MOVE_LEFT),
+        (0, ENABLE_CAPACITY),
+        (15, STOP_MOVE),
+        (16, MOVE_RIGHT),
+        (16 + 2 ** 11, DISABLE_CAPACITY),
+        (2 ** 20, MOVE_LEFT),
+        (2 ** 40, MOVE_RIGHT),
+    ]
+    write_replay(file_path, HeadlessLevelDrawer().level, events, 2 ** 40 + 1)
+
+    assert list(ReplayReader(file_path)) == events + [(2 ** 40 + 1, END)]
+
+
+def test_events_across_chunks(tmp_path):
+    file_path = str(tmp_path / "chunks.pyrp")
+    rand = random.Random(0)
+    events = []
+    tick = 0
+    for _ in range(3 * REPLAY_CHUNK_SIZE):
+        tick += rand.choice((0, 1, 100, 10 ** 5, 10 ** 9))
+        events.append((tick, rand.choice(ACTIONS)))
+    write_replay(file_path, HeadlessLevelDrawer().level, events, tick)
+
+    size = (tmp_path / "chunks.pyrp").stat().st_size - REPLAY_HEADER.size
+    assert size > 2 * REPLAY_CHUNK_SIZE
+    assert list(ReplayReader(file_path)) == events + [(tick, END)]
+
+
+def test_invalid_file(tmp_path):
+    file_path = tmp_path / "invalid.pyrp"
+    file_path.write_bytes(b"PYSN" + bytes(REPLAY_HEADER.size))
+
+    with pytest.raises(ValueError):
+        ReplayReader(str(file_path))
+
+
+@pytest.mark.parametrize("game_id", (0, 1))
+def test_play_recorded_game(tmp_path, game_id):
+    file_path = str(tmp_path / "game.pyrp")
+    level = HeadlessLevelDrawer(game_id, seed=3).level
+    replay_writer = ReplayWriter(file_path, level)
+    rand = random.Random(game_id)
+    while level.tick < 1200 and level.loop_active:
+        if rand.random() < 0.1:
+            action = rand.choice(ACTIONS)
+            apply_action(level, action)
+            replay_writer.record(level.tick, action)
+        level.step(FIXED_DELTA_TIME)
+    replay_writer.close(level.tick)
+
+    replay_reader = ReplayReader(file_path)
+    other_level = HeadlessLevelDrawer(
+        game_id, size=replay_reader.level_size, seed=replay_reader.seed
+    ).level
+    assert ReplayPlayer(other_level, replay_reader).run() == level.tick
+    assert get_level_state(other_level) == get_level_state(level)
@@ -0,0 +1,93 @@
+# -*- coding:utf-8 -*-
+
+# 	This file is part of Pyoro (A Python fan game).
+#
+# 	Metawars is free software: you can redistribute it and/or modify
+# 	it under the terms of the GNU General Public License as published by
+# 	the Free Software Foundation, either version 3 of the License, or
+# 	(at your option) any later version.
+#
+# 	Metawars is distributed in the hope that it will be useful,
+# 	but WITHOUT ANY WARRANTY; without even the implied warranty of
+# 	MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# 	GNU General Public License for more details.
+#
+# 	You should have received a copy of the GNU General Public License
+# 	along with Metawars. If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Test level snapshots (see game.snapshot).
+
+Created on 17/10/2026
+"""
+
+import pytest
+
+__author__ = "RedbeanGit"
+__repo__ = "https://github.com/RedbeanGit/Pyoro"
+
+from game.config import FIXED_DELTA_TIME
+from game.headless import HeadlessLevelDrawer, get_level_state
+
+
+def play(level, nb_steps):
+    """
+    Update a level and save its state after each step.
+
+    :type level: game.level.Level
+    :param level: The level to update.
+
+    :type nb_steps: int
+    :param nb_steps: The number of steps.
+
+    :rtype: list
+    :returns: The state of the level after each step (see
+        game.headless.get_level_state).
+    """
+
+    states = []
+    for _ in range(nb_steps):
+        level.step(FIXED_DELTA_TIME)
+        states.append(get_level_state(level))
+    return states
+
+
+@pytest.mark.parametrize("numpy_physics", (False, True))
+@pytest.mark.parametrize("game_id", (0, 1))
+def test_restore_same_level(game_id, numpy_physics):
+    level = HeadlessLevelDrawer(
+        game_id, True, seed=1, numpy_physics=numpy_physics
+    ).level
+    play(level, 600)
+    snapshot = level.snapshot()
+    states = play(level, 300)
+
+    level.restore(snapshot)
+    assert play(level, 300) == states
+
+
+@pytest.mark.parametrize("numpy_physics", (False, True))
+@pytest.mark.parametrize("game_id", (0, 1))
+def test_restore_other_seed(game_id, numpy_physics):
+    level = HeadlessLevelDrawer(
+        game_id, True, seed=1, numpy_physics=numpy_physics
+    ).level
+    play(level, 600)
+    snapshot = level.snapshot()
+    states = play(level, 300)
+
+    other_level = HeadlessLevelDrawer(
+        game_id, True, seed=2, numpy_physics=numpy_physics
+    ).level
+    play(other_level, 100)
+    other_level.restore(snapshot)
+    assert play(other_level, 300) == states
+
+
+def test_restore_other_game():
+    level = HeadlessLevelDrawer(0, True, seed=1).level
+    snapshot = level.snapshot()
+
+    with pytest.raises(ValueError):
+        HeadlessLevelDrawer(1, True, seed=1).level.restore(snapshot)